@@ -10,6 +10,7 @@ from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 
 # syft absolute
+from syft.server.routes import routes_lifespan
 from syft.util.telemetry import instrument_fastapi
 
 # server absolute
@@ -65,7 +66,8 @@ def get_middlewares() -> FastAPI:
 async def lifespan(app: FastAPI) -> Any:
     try:
         on_app_startup(app)
-        yield
+        async with routes_lifespan(app):
+            yield
     finally:
         on_app_shutdown(app)
 
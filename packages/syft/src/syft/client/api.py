@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 # stdlib
+import asyncio
 from collections import OrderedDict
 from collections.abc import Callable
 import inspect
@@ -372,6 +373,14 @@ class RemoteFunction(SyftObject):
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         return self.function_call(self.path, *args, **kwargs)
 
+    async def call_async(self, *args: Any, **kwargs: Any) -> Any:
+        """Call the endpoint from asyncio code without blocking the event loop.
+
+        The call runs in a worker thread, concurrent calls to an HTTP server share
+        the pooled connections of the client.
+        """
+        return await asyncio.to_thread(self.function_call, self.path, *args, **kwargs)
+
     @property
     def mock(self) -> Any:
         if self.custom_function:
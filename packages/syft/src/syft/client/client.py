@@ -10,15 +10,19 @@ from enum import Enum
 from getpass import getpass
 import json
 import logging
+import threading
 import traceback
 from typing import Any
+from typing import ClassVar
 from typing import TYPE_CHECKING
 from typing import cast
 
 # third party
 from argon2 import PasswordHasher
+from cachetools import LRUCache
 from cachetools import TTLCache
 from cachetools import cached
+from pydantic import BaseModel
 from pydantic import field_validator
 import requests
 from requests import Response
@@ -123,6 +127,64 @@ DEFAULT_SYFT_UI_ADDRESS = f"http://localhost:{DEFAULT_SYFT_UI_PORT}"
 INTERNAL_PROXY_TO_RATHOLE = "http://proxy:80/rtunnel/"
 
 
+class HTTPTransportConfig(BaseModel):
+    """Settings of the HTTP sessions that clients send their requests with.
+
+    Every HTTPConnection keeps one session, with a pool of up to `pool_size`
+    kept-alive connections per host, so consecutive calls reuse a TCP and TLS
+    connection instead of opening a new one. Changes apply to sessions created
+    afterwards.
+    """
+
+    pool_size: int = 10
+    keep_alive: bool = True
+    connect_timeout: float | None = 10
+    # API calls can block until a job finishes, so reads don't time out by default
+    read_timeout: float | None = None
+    retries: int = 3
+    retry_backoff_factor: float = 0.5
+
+    @property
+    def timeout(self) -> tuple[float | None, float | None]:
+        return (self.connect_timeout, self.read_timeout)
+
+
+def create_http_session(config: HTTPTransportConfig) -> Session:
+    session = requests.Session()
+    retry = Retry(total=config.retries, backoff_factor=config.retry_backoff_factor)
+    adapter = HTTPAdapter(
+        pool_connections=config.pool_size,
+        pool_maxsize=config.pool_size,
+        max_retries=retry,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not config.keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+_session_lock = threading.Lock()
+_shared_session: Session | None = None
+
+
+def get_http_session(connection: ServerConnection | None = None) -> Session:
+    """The session of an HTTPConnection, or a shared session for other URLs."""
+    global _shared_session
+
+    if isinstance(connection, HTTPConnection):
+        return connection.session
+    with _session_lock:
+        if _shared_session is None:
+            _shared_session = create_http_session(HTTPConnection.transport_config)
+        return _shared_session
+
+
+# serialized SyftAPI responses by (server url, verify key, protocol) with their ETag,
+# the server answers 304 when the cached API is still up to date
+API_RESPONSE_CACHE: LRUCache = LRUCache(maxsize=32)
+
+
 class Routes(Enum):
     ROUTE_METADATA = f"{API_PATH}/metadata"
     ROUTE_API = f"{API_PATH}/api"
@@ -147,6 +209,8 @@ class HTTPConnection(ServerConnection):
     headers: dict[str, str] | None = None
     rtunnel_token: str | None = None
 
+    transport_config: ClassVar[HTTPTransportConfig] = HTTPTransportConfig()
+
     @field_validator("url", mode="before")
     @classmethod
     def make_url(cls, v: Any) -> Any:
@@ -164,6 +228,8 @@ class HTTPConnection(ServerConnection):
             url=self.url,
             proxy_target_uid=proxy_target_uid,
             rtunnel_token=self.rtunnel_token,
+            # same server, so the proxied calls can reuse the pooled connections
+            session_cache=self.session,
         )
 
     def stream_via(self, proxy_uid: UID, url_path: str) -> ServerURL:
@@ -189,12 +255,9 @@ class HTTPConnection(ServerConnection):
     @property
     def session(self) -> Session:
         if self.session_cache is None:
-            session = requests.Session()
-            retry = Retry(total=3, backoff_factor=0.5)
-            adapter = HTTPAdapter(max_retries=retry)
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
-            self.session_cache = session
+            with _session_lock:
+                if self.session_cache is None:
+                    self.session_cache = create_http_session(self.transport_config)
         return self.session_cache
 
     def _make_get(
@@ -203,6 +266,17 @@ class HTTPConnection(ServerConnection):
         if params is None:
             return self._make_get_no_params(path, stream=stream)
 
+        response = self._get_response(path, params=params, stream=stream)
+        return response.content
+
+    def _get_response(
+        self,
+        path: str,
+        params: dict,
+        stream: bool = False,
+        headers: dict[str, str] | None = None,
+        expected_status_codes: tuple[int, ...] = (200,),
+    ) -> Response:
         url = self.url
 
         if self.rtunnel_token:
@@ -212,15 +286,21 @@ class HTTPConnection(ServerConnection):
 
         url = url.with_path(path)
 
+        if headers is not None:
+            headers = {**(self.headers or {}), **headers}
+        else:
+            headers = self.headers
+
         response = self.session.get(
             str(url),
-            headers=self.headers,
+            headers=headers,
             verify=verify_tls(),
             proxies={},
             params=params,
             stream=stream,
+            timeout=self.transport_config.timeout,
         )
-        if response.status_code != 200:
+        if response.status_code not in expected_status_codes:
             raise requests.ConnectionError(
                 f"Failed to fetch {url}. Response returned with code {response.status_code}"
             )
@@ -228,6 +308,30 @@ class HTTPConnection(ServerConnection):
         # upgrade to tls if available
         self.url = upgrade_tls(self.url, response)
 
+        return response
+
+    def _get_api_content(self, params: dict) -> bytes:
+        """Fetch the serialized SyftAPI, skipping the download when the cached one is
+        still up to date."""
+        cache_key = (
+            str(self.url),
+            params["verify_key"],
+            str(params["communication_protocol"]),
+        )
+        cached = API_RESPONSE_CACHE.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+        response = self._get_response(
+            self.routes.ROUTE_API.value,
+            params=params,
+            headers=headers,
+            expected_status_codes=(200, 304),
+        )
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+
+        etag = response.headers.get("ETag")
+        if etag is not None:
+            API_RESPONSE_CACHE[cache_key] = (etag, response.content)
         return response.content
 
     @cached(cache=TTLCache(maxsize=128, ttl=300))
@@ -247,6 +351,7 @@ class HTTPConnection(ServerConnection):
             verify=verify_tls(),
             proxies={},
             stream=stream,
+            timeout=self.transport_config.timeout,
         )
         if response.status_code != 200:
             raise requests.ConnectionError(
@@ -279,6 +384,7 @@ class HTTPConnection(ServerConnection):
             data=data,
             headers=self.headers,
             stream=stream,
+            timeout=self.transport_config.timeout,
         )
         if response.status_code != 200:
             raise requests.ConnectionError(
@@ -311,6 +417,7 @@ class HTTPConnection(ServerConnection):
             json=json,
             proxies={},
             data=data,
+            timeout=self.transport_config.timeout,
         )
         if response.status_code != 200:
             raise requests.ConnectionError(
@@ -325,7 +432,12 @@ class HTTPConnection(ServerConnection):
     def stream_data(self, credentials: SyftSigningKey) -> Response:
         url = self.url.with_path(self.routes.STREAM.value)
         response = self.session.get(
-            str(url), verify=verify_tls(), proxies={}, stream=True, headers=self.headers
+            str(url),
+            verify=verify_tls(),
+            proxies={},
+            stream=True,
+            headers=self.headers,
+            timeout=self.transport_config.timeout,
         )
         return response
 
@@ -365,7 +477,7 @@ class HTTPConnection(ServerConnection):
                 credentials=credentials,
             )
         else:
-            content = self._make_get(self.routes.ROUTE_API.value, params=params)
+            content = self._get_api_content(params)
             obj = _deserialize(content, from_bytes=True)
         obj.connection = self
         obj.signing_key = credentials
@@ -460,10 +572,12 @@ class HTTPConnection(ServerConnection):
         else:
             api_url = self.api_url
 
-        response = requests.post(  # nosec
-            url=api_url,
+        response = self.session.post(
+            str(api_url),
             data=msg_bytes,
             headers=self.headers,
+            verify=verify_tls(),
+            timeout=self.transport_config.timeout,
         )
 
         if response.status_code != 200:
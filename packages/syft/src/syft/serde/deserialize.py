@@ -1,21 +1,59 @@
 # stdlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import struct
 from typing import Any
+from typing import Protocol
 
 # third party
 from capnp.lib.capnp import _DynamicStructBuilder
 
 
+class Readable(Protocol):
+    def read(self, size: int, /) -> bytes: ...
+
+
+# set while deserializing data the server wrote itself (e.g. stash reads), objects are
+# then constructed without re-running pydantic validation
+_trusted_source: ContextVar[bool] = ContextVar("trusted_source", default=False)
+
+
+def is_trusted_source() -> bool:
+    return _trusted_source.get()
+
+
+@contextmanager
+def trusted_source() -> Iterator[None]:
+    token = _trusted_source.set(True)
+    try:
+        yield
+    finally:
+        _trusted_source.reset(token)
+
+
 def _deserialize(
     blob: Any,
     from_proto: bool = True,
     from_bytes: bool = False,
+    trusted: bool = False,
 ) -> Any:
+    """Deserialize `blob` from capnp bytes or a capnp message.
+
+    Only pass `trusted=True` for data the server serialized itself, pydantic models are
+    then constructed without validation. Payloads received from clients must keep the
+    default so they are validated.
+    """
     # relative
     from .recursive import rs_bytes2object
     from .recursive import rs_proto2object
 
+    if trusted and not is_trusted_source():
+        with trusted_source():
+            return _deserialize(blob, from_proto=from_proto, from_bytes=from_bytes)
+
     if (
-        (from_bytes and not isinstance(blob, bytes))
+        (from_bytes and not isinstance(blob, bytes | bytearray | memoryview))
         or (
             from_proto
             and not from_bytes
@@ -30,3 +68,41 @@ def _deserialize(
 
     if from_proto:
         return rs_proto2object(blob)
+
+
+def _read_exactly(source: Readable, size: int) -> bytes:
+    # sockets and response bodies may return fewer bytes than requested,
+    # only an empty read means the source is exhausted
+    data = source.read(size)
+    if len(data) == size:
+        return data
+
+    chunks = [data]
+    received = len(data)
+    while received < size:
+        chunk = source.read(size - received)
+        if not chunk:
+            raise EOFError(f"Expected {size} bytes from source, got {received}.")
+        chunks.append(chunk)
+        received += len(chunk)
+    return b"".join(chunks)
+
+
+def _deserialize_from(source: Readable) -> Any:
+    """Reads one message written by `_serialize_to` from `source` (file, socket file,
+    response body), anything with a `read` method, without joining it into one buffer.
+    """
+    # relative
+    from .recursive import rs_segments2object
+
+    (segment_count,) = struct.unpack("<I", _read_exactly(source, 4))
+    segment_count += 1
+    sizes = struct.unpack(
+        f"<{segment_count}I", _read_exactly(source, 4 * segment_count)
+    )
+    if segment_count % 2 == 0:
+        # segment table is padded to a multiple of 8 bytes
+        _read_exactly(source, 4)
+
+    segments = [_read_exactly(source, size * 8) for size in sizes]
+    return rs_segments2object(segments)
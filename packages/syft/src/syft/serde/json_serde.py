@@ -4,6 +4,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 import json
+import math
 import typing
 from typing import Any
 from typing import Generic
@@ -13,6 +14,7 @@ from typing import get_args
 from typing import get_origin
 
 # third party
+import orjson
 import pydantic
 
 # syft absolute
@@ -26,7 +28,10 @@ from ..types.syft_object import BaseDateTime
 from ..types.syft_object_registry import SyftObjectRegistry
 from ..types.uid import LineageID
 from ..types.uid import UID
+from .deserialize import is_trusted_source
+from .deserialize import trusted_source
 from .recursive import DEFAULT_EXCLUDE_ATTRS
+from .recursive import construct_model_trusted
 
 T = TypeVar("T")
 
@@ -36,6 +41,8 @@ JSON_DATA_FIELD = "data"
 
 JsonPrimitive = str | int | float | bool | None
 Json = JsonPrimitive | list["Json"] | dict[str, "Json"]
+JsonEncoder = Callable[[Any], Json]
+JsonDecoder = Callable[[Json], Any]
 
 
 def _noop_fn(obj: Any) -> Any:
@@ -100,9 +107,44 @@ register_json_serde(SyftVerifyKey, lambda key: str(key), SyftVerifyKey.from_stri
 register_json_serde(SyftSigningKey, lambda key: str(key), SyftSigningKey.from_string)
 
 
+def _has_non_finite_float(value: Json) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(item) for item in value.values())
+    if isinstance(value, list | tuple):
+        return any(_has_non_finite_float(item) for item in value)
+    return False
+
+
+def json_dumps(value: Json) -> str:
+    """Dump JSON with orjson, used as the `json_serializer` of the database engine.
+
+    orjson writes NaN and +-Infinity as null, values with those are dumped with the
+    stdlib instead, as NaN/Infinity like before.
+    """
+    try:
+        dumped = orjson.dumps(value)
+    except TypeError:
+        # orjson only handles 64-bit integers, fall back to the stdlib
+        return json.dumps(value)
+    if b"null" in dumped and _has_non_finite_float(value):
+        return json.dumps(value)
+    return dumped.decode("utf-8")
+
+
+def json_loads(value: str | bytes) -> Json:
+    """Load JSON with orjson, used as the `json_deserializer` of the database engine."""
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        # rows with NaN/Infinity written by the stdlib, which orjson rejects
+        return json.loads(value)
+
+
 def _validate_json(value: T) -> T:
     # Throws TypeError if value is not JSON-serializable
-    json.dumps(value)
+    json_dumps(value)
     return value
 
 
@@ -158,28 +200,6 @@ def _annotation_issubclass(annotation: Any, cls: type) -> bool:
         return False
 
 
-def _serialize_pydantic_to_json(obj: pydantic.BaseModel) -> dict[str, Json]:
-    canonical_name, version = SyftObjectRegistry.get_canonical_name_version(obj)
-    serde_attributes = SyftObjectRegistry.get_serde_properties(canonical_name, version)
-    exclude_attrs = serde_attributes[4]
-
-    result: dict[str, Json] = {
-        JSON_CANONICAL_NAME_FIELD: canonical_name,
-        JSON_VERSION_FIELD: version,
-    }
-
-    all_exclude_attrs = set(exclude_attrs) | DEFAULT_EXCLUDE_ATTRS
-
-    for key, type_ in obj.model_fields.items():
-        if key in all_exclude_attrs:
-            continue
-        result[key] = serialize_json(getattr(obj, key), type_.annotation)
-
-    result = _add_searchable_and_unique_attrs(obj, result, raise_errors=False)
-
-    return result
-
-
 def get_property_return_type(obj: Any, attr_name: str) -> Any:
     """
     Get the return type annotation of a @property.
@@ -193,67 +213,6 @@ def get_property_return_type(obj: Any, attr_name: str) -> Any:
     return None
 
 
-def _add_searchable_and_unique_attrs(
-    obj: pydantic.BaseModel, obj_dict: dict[str, Json], raise_errors: bool = True
-) -> dict[str, Json]:
-    """
-    Add searchable attrs and unique attrs to the serialized object dict, if they are not already present.
-    Needed for adding non-field attributes (like @property)
-
-    Args:
-        obj (pydantic.BaseModel): Object to serialize.
-        obj_dict (dict[str, Json]): Serialized object dict. Should contain the object's fields.
-        raise_errors (bool, optional): Raise errors if an attribute cannot be accessed.
-            If False, the attribute will be skipped. Defaults to True.
-
-    Raises:
-        Exception: Any exception raised when accessing an attribute.
-
-    Returns:
-        dict[str, Json]: Serialized object dict including searchable attributes.
-    """
-    searchable_attrs: list[str] = getattr(obj, "__attr_searchable__", [])
-    unique_attrs: list[str] = getattr(obj, "__attr_unique__", [])
-
-    attrs_to_add = set(searchable_attrs) | set(unique_attrs)
-    for attr in attrs_to_add:
-        if attr not in obj_dict:
-            try:
-                value = getattr(obj, attr)
-            except Exception as e:
-                if raise_errors:
-                    raise e
-                else:
-                    continue
-            property_annotation = get_property_return_type(obj, attr)
-            obj_dict[attr] = serialize_json(
-                value, validate=False, annotation=property_annotation
-            )
-
-    return obj_dict
-
-
-def _deserialize_pydantic_from_json(
-    obj_dict: dict[str, Json],
-) -> pydantic.BaseModel:
-    try:
-        canonical_name = obj_dict[JSON_CANONICAL_NAME_FIELD]
-        version = obj_dict[JSON_VERSION_FIELD]
-        obj_type = SyftObjectRegistry.get_serde_class(canonical_name, version)
-
-        result = {}
-        for key, type_ in obj_type.model_fields.items():
-            if key not in obj_dict:
-                continue
-            result[key] = deserialize_json(obj_dict[key], type_.annotation)
-
-        return obj_type.model_validate(result)
-    except Exception as e:
-        print(f"Failed to deserialize Pydantic model: {e}")
-        print(json.dumps(obj_dict, indent=2))
-        raise ValueError(f"Failed to deserialize Pydantic model: {e}")
-
-
 def _is_serializable_iterable(annotation: Any) -> bool:
     # we can only serialize typed iterables without Union/Any
     # NOTE optional is allowed
@@ -273,24 +232,6 @@ def _is_serializable_iterable(annotation: Any) -> bool:
     )
 
 
-def _serialize_iterable_to_json(value: Any, annotation: Any) -> Json:
-    # No need to validate in recursive calls
-    return [serialize_json(v, validate=False) for v in value]
-
-
-def _deserialize_iterable_from_json(value: Json, annotation: Any) -> Any:
-    if not isinstance(value, list):
-        raise ValueError(f"Cannot deserialize {type(value)} to {annotation}")
-
-    annotation = _unwrap_type_annotation(annotation)
-
-    if not _is_serializable_iterable(annotation):
-        raise ValueError(f"Cannot deserialize {annotation} from JSON")
-
-    inner_type = _unwrap_type_annotation(get_args(annotation)[0])
-    return [deserialize_json(v, inner_type) for v in value]
-
-
 def _is_serializable_mapping(annotation: Any) -> bool:
     """
     Mapping is serializable if:
@@ -317,33 +258,268 @@ def _is_serializable_mapping(annotation: Any) -> bool:
     )
 
 
-def _serialize_mapping_to_json(value: Any, annotation: Any) -> Json:
-    _, value_type = get_args(annotation)
-    # No need to validate in recursive calls
-    return {k: serialize_json(v, value_type, validate=False) for k, v in value.items()}
+def _serialize_to_json_bytes(obj: Any) -> str:
+    obj_bytes = sy.serialize(obj, to_bytes=True)
+    return base64.b64encode(obj_bytes).decode("utf-8")
 
 
-def _deserialize_mapping_from_json(value: Json, annotation: Any) -> Any:
-    if not isinstance(value, dict):
-        raise ValueError(f"Cannot deserialize {type(value)} to {annotation}")
+def _deserialize_from_json_bytes(obj: str) -> Any:
+    obj_bytes = base64.b64decode(obj)
+    return sy.deserialize(obj_bytes, from_bytes=True)
+
+
+def _serialize_enum_to_json(value: Enum) -> Json:
+    return value.name
+
+
+def _serialize_iterable_to_json(value: Any) -> Json:
+    # items are serialized by their own type, like the original values
+    return [_get_json_encoder(type(v))(v) for v in value]
+
 
+def _compile_json_encoder(annotation: Any) -> JsonEncoder:
+    """Resolve the serialization method for `annotation` once, see `serialize_json`
+    for the resolution order."""
     annotation = _unwrap_type_annotation(annotation)
 
+    encode: JsonEncoder
+    if annotation in JSON_SERDE_REGISTRY:
+        encode = JSON_SERDE_REGISTRY[annotation].serialize_fn
+    elif _annotation_issubclass(annotation, pydantic.BaseModel):
+        encode = _serialize_pydantic_to_json
+    elif _annotation_issubclass(annotation, Enum):
+        encode = _serialize_enum_to_json
+    elif _is_serializable_iterable(annotation):
+        encode = _serialize_iterable_to_json
+    elif _is_serializable_mapping(annotation):
+        encode_value = _get_json_encoder(get_args(annotation)[1])
+
+        def encode(value: Any) -> Json:
+            return {k: encode_value(v) for k, v in value.items()}
+
+    else:
+        encode = _serialize_to_json_bytes
+
+    def encoder(value: Any) -> Json:
+        return None if value is None else encode(value)
+
+    return encoder
+
+
+def _compile_json_decoder(annotation: Any) -> JsonDecoder:
+    """Inverse of `_compile_json_encoder`, see `deserialize_json`."""
+    annotation = _unwrap_type_annotation(annotation)
+
+    decode: JsonDecoder
+    if annotation in JSON_SERDE_REGISTRY:
+        decode = JSON_SERDE_REGISTRY[annotation].deserialize_fn
+    elif _annotation_issubclass(annotation, pydantic.BaseModel):
+        decode = _deserialize_pydantic_from_json
+    elif _annotation_issubclass(annotation, Enum):
+
+        def decode(value: Json) -> Any:
+            return annotation[value]
+
+    else:
+        decode_list = _compile_iterable_decoder(annotation)
+        decode_dict = _compile_mapping_decoder(annotation)
+
+        def decode(value: Json) -> Any:
+            if isinstance(value, list):
+                return decode_list(value)
+            elif isinstance(value, dict):
+                return decode_dict(value)
+            elif isinstance(value, str):
+                return _deserialize_from_json_bytes(value)
+            raise ValueError(f"Cannot deserialize {value} to {annotation}")
+
+    def decoder(value: Json) -> Any:
+        if (
+            isinstance(value, dict)
+            and JSON_CANONICAL_NAME_FIELD in value
+            and JSON_VERSION_FIELD in value
+        ):
+            return _deserialize_pydantic_from_json(value)
+        return None if value is None else decode(value)
+
+    return decoder
+
+
+def _compile_iterable_decoder(annotation: Any) -> JsonDecoder:
+    if not _is_serializable_iterable(annotation):
+
+        def reject(value: Json) -> Any:
+            raise ValueError(f"Cannot deserialize {annotation} from JSON")
+
+        return reject
+
+    decode_item = _get_json_decoder(_unwrap_type_annotation(get_args(annotation)[0]))
+    iterable_type = get_origin(annotation)
+
+    def decode(value: Json) -> Any:
+        values = [decode_item(v) for v in value]  # type: ignore[union-attr]
+        return values if iterable_type is list else iterable_type(values)
+
+    return decode
+
+
+def _compile_mapping_decoder(annotation: Any) -> JsonDecoder:
     if not _is_serializable_mapping(annotation):
-        raise ValueError(f"Cannot deserialize {annotation} from JSON")
 
-    _, value_type = get_args(annotation)
-    return {k: deserialize_json(v, value_type) for k, v in value.items()}
+        def reject(value: Json) -> Any:
+            raise ValueError(f"Cannot deserialize {annotation} from JSON")
 
+        return reject
 
-def _serialize_to_json_bytes(obj: Any) -> str:
-    obj_bytes = sy.serialize(obj, to_bytes=True)
-    return base64.b64encode(obj_bytes).decode("utf-8")
+    decode_value = _get_json_decoder(get_args(annotation)[1])
 
+    def decode(value: Json) -> Any:
+        return {k: decode_value(v) for k, v in value.items()}  # type: ignore[union-attr]
 
-def _deserialize_from_json_bytes(obj: str) -> Any:
-    obj_bytes = base64.b64decode(obj)
-    return sy.deserialize(obj_bytes, from_bytes=True)
+    return decode
+
+
+_JSON_ENCODER_CACHE: dict[Any, JsonEncoder] = {}
+_JSON_DECODER_CACHE: dict[Any, JsonDecoder] = {}
+
+
+def _get_json_encoder(annotation: Any) -> JsonEncoder:
+    try:
+        return _JSON_ENCODER_CACHE[annotation]
+    except KeyError:
+        encoder = _JSON_ENCODER_CACHE[annotation] = _compile_json_encoder(annotation)
+        return encoder
+    except TypeError:
+        # unhashable annotation
+        return _compile_json_encoder(annotation)
+
+
+def _get_json_decoder(annotation: Any) -> JsonDecoder:
+    try:
+        return _JSON_DECODER_CACHE[annotation]
+    except KeyError:
+        decoder = _JSON_DECODER_CACHE[annotation] = _compile_json_decoder(annotation)
+        return decoder
+    except TypeError:
+        # unhashable annotation
+        return _compile_json_decoder(annotation)
+
+
+@dataclass(frozen=True)
+class JSONModelCodec:
+    """Field-by-field JSON (de)serializer for a pydantic model, compiled once from
+    its model fields by `get_json_model_codec`."""
+
+    canonical_name: str
+    version: int
+    # (name, encoder, decoder) for every serialized model field
+    fields: tuple[tuple[str, JsonEncoder, JsonDecoder], ...]
+    # searchable and unique attributes that are not serialized fields, like
+    # @property values, stored so they can be queried
+    extra_attrs: tuple[tuple[str, JsonEncoder], ...]
+
+    def serialize(self, obj: pydantic.BaseModel) -> dict[str, Json]:
+        result: dict[str, Json] = {
+            JSON_CANONICAL_NAME_FIELD: self.canonical_name,
+            JSON_VERSION_FIELD: self.version,
+        }
+        for key, encode, _ in self.fields:
+            result[key] = encode(getattr(obj, key))
+
+        for attr, encode in self.extra_attrs:
+            try:
+                value = getattr(obj, attr)
+            except Exception:  # nosec
+                continue
+            result[attr] = encode(value)
+
+        return result
+
+    def deserialize_fields(self, obj_dict: dict[str, Json]) -> dict[str, Any]:
+        return {
+            key: decode(obj_dict[key])
+            for key, _, decode in self.fields
+            if key in obj_dict
+        }
+
+
+def _compile_json_model_codec(obj_type: type[pydantic.BaseModel]) -> JSONModelCodec:
+    if obj_type not in SyftObjectRegistry.__type_to_canonical_name__:
+        raise ValueError(
+            f"Could not find canonical name for '{obj_type.__module__}.{obj_type.__name__}'"
+        )
+    canonical_name, version = SyftObjectRegistry.__type_to_canonical_name__[obj_type]
+    serde_attributes = SyftObjectRegistry.get_serde_properties(canonical_name, version)
+    all_exclude_attrs = set(serde_attributes[4]) | DEFAULT_EXCLUDE_ATTRS
+
+    fields = tuple(
+        (
+            key,
+            _get_json_encoder(field.annotation),
+            _get_json_decoder(field.annotation),
+        )
+        for key, field in obj_type.model_fields.items()
+        if key not in all_exclude_attrs
+    )
+
+    serialized_keys = {key for key, _, _ in fields}
+    searchable_attrs: list[str] = getattr(obj_type, "__attr_searchable__", [])
+    unique_attrs: list[str] = getattr(obj_type, "__attr_unique__", [])
+    extra_attrs = []
+    for attr in set(searchable_attrs) | set(unique_attrs):
+        if attr in serialized_keys:
+            continue
+        class_attr = getattr(obj_type, attr, None)
+        if isinstance(class_attr, property):
+            annotation = class_attr.fget.__annotations__.get("return", None)
+            if annotation is not None:
+                extra_attrs.append((attr, _get_json_encoder(annotation)))
+                continue
+        extra_attrs.append((attr, _serialize_json_by_type))
+
+    return JSONModelCodec(
+        canonical_name=canonical_name,
+        version=version,
+        fields=fields,
+        extra_attrs=tuple(extra_attrs),
+    )
+
+
+_JSON_MODEL_CODECS: dict[type, JSONModelCodec] = {}
+
+
+def get_json_model_codec(obj_type: type[pydantic.BaseModel]) -> JSONModelCodec:
+    codec = _JSON_MODEL_CODECS.get(obj_type)
+    if codec is None:
+        codec = _JSON_MODEL_CODECS[obj_type] = _compile_json_model_codec(obj_type)
+    return codec
+
+
+def _serialize_json_by_type(value: Any) -> Json:
+    return _get_json_encoder(type(value))(value)
+
+
+def _serialize_pydantic_to_json(obj: pydantic.BaseModel) -> dict[str, Json]:
+    return get_json_model_codec(type(obj)).serialize(obj)
+
+
+def _deserialize_pydantic_from_json(
+    obj_dict: dict[str, Json],
+) -> pydantic.BaseModel:
+    try:
+        canonical_name = obj_dict[JSON_CANONICAL_NAME_FIELD]
+        version = obj_dict[JSON_VERSION_FIELD]
+        obj_type = SyftObjectRegistry.get_serde_class(canonical_name, version)
+
+        result = get_json_model_codec(obj_type).deserialize_fields(obj_dict)
+
+        if is_trusted_source():
+            return construct_model_trusted(obj_type, result)
+        return obj_type.model_validate(result)
+    except Exception as e:
+        print(f"Failed to deserialize Pydantic model: {e}")
+        print(json.dumps(obj_dict, indent=2))
+        raise ValueError(f"Failed to deserialize Pydantic model: {e}")
 
 
 def serialize_json(value: Any, annotation: Any = None, validate: bool = True) -> Json:
@@ -365,9 +541,14 @@ def serialize_json(value: Any, annotation: Any = None, validate: bool = True) ->
     4. Mapping serialization, if the annotation is a strictly typed mapping with string keys.
     5. Serialize the object to bytes and encode it as base64.
 
+    The method is resolved once per annotation and cached, pydantic models are
+    serialized with a `JSONModelCodec` compiled once per class.
+
     Args:
         value (Any): Value to serialize.
         annotation (Any, optional): Type annotation for the value. Defaults to None.
+        validate (bool, optional): Check that the result can be dumped to JSON.
+            Defaults to True.
 
     Returns:
         Json: JSON-serializable object.
@@ -378,25 +559,7 @@ def serialize_json(value: Any, annotation: Any = None, validate: bool = True) ->
     if value is None:
         return None
 
-    # Remove None type from annotation if it is present.
-    annotation = _unwrap_type_annotation(annotation)
-
-    if annotation in JSON_SERDE_REGISTRY:
-        result = JSON_SERDE_REGISTRY[annotation].serialize(value)
-    elif _annotation_issubclass(annotation, pydantic.BaseModel):
-        result = _serialize_pydantic_to_json(value)
-    elif _annotation_issubclass(annotation, Enum):
-        result = value.name
-
-    # JSON recursive types
-    # only strictly annotated iterables and mappings are supported
-    # example: list[int] is supported, but not list[int | str]
-    elif _is_serializable_iterable(annotation):
-        result = _serialize_iterable_to_json(value, annotation)
-    elif _is_serializable_mapping(annotation):
-        result = _serialize_mapping_to_json(value, annotation)
-    else:
-        result = _serialize_to_json_bytes(value)
+    result = _get_json_encoder(annotation)(value)
 
     if validate:
         _validate_json(result)
@@ -404,17 +567,23 @@ def serialize_json(value: Any, annotation: Any = None, validate: bool = True) ->
     return result
 
 
-def deserialize_json(value: Json, annotation: Any = None) -> Any:
+def deserialize_json(value: Json, annotation: Any = None, trusted: bool = False) -> Any:
     """Deserialize a JSON-serializable object to a value, using the schema defined by the
     provided annotation. Inverse of `serialize_json`.
 
     Args:
         value (Json): JSON-serializable object.
         annotation (Any): Type annotation for the value.
+        trusted (bool, optional): The value was serialized by this server, pydantic models
+            are constructed without validation. Defaults to False.
 
     Returns:
         Any: Deserialized value.
     """
+    if trusted and not is_trusted_source():
+        with trusted_source():
+            return deserialize_json(value, annotation)
+
     if (
         isinstance(value, dict)
         and JSON_CANONICAL_NAME_FIELD in value
@@ -425,26 +594,10 @@ def deserialize_json(value: Json, annotation: Any = None) -> Any:
     if value is None:
         return None
 
-    # Remove None type from annotation if it is present.
     if annotation is None:
         raise ValueError("Annotation is required for deserialization")
 
-    annotation = _unwrap_type_annotation(annotation)
-
-    if annotation in JSON_SERDE_REGISTRY:
-        return JSON_SERDE_REGISTRY[annotation].deserialize(value)
-    elif _annotation_issubclass(annotation, pydantic.BaseModel):
-        return _deserialize_pydantic_from_json(value)
-    elif _annotation_issubclass(annotation, Enum):
-        return annotation[value]
-    elif isinstance(value, list):
-        return _deserialize_iterable_from_json(value, annotation)
-    elif isinstance(value, dict):
-        return _deserialize_mapping_from_json(value, annotation)
-    elif isinstance(value, str):
-        return _deserialize_from_json_bytes(value)
-    else:
-        raise ValueError(f"Cannot deserialize {value} to {annotation}")
+    return _get_json_decoder(annotation)(value)
 
 
 def is_json_primitive(value: Any) -> bool:
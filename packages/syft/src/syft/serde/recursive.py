@@ -1,5 +1,7 @@
 # stdlib
 from collections.abc import Callable
+from collections.abc import Iterable
+from dataclasses import dataclass
 from enum import Enum
 from enum import EnumMeta
 import os
@@ -11,9 +13,6 @@ from typing import Any
 from capnp.lib.capnp import _DynamicStructBuilder
 from pydantic import BaseModel
 
-# syft absolute
-import syft as sy
-
 # relative
 from ..types.syft_object_registry import SyftObjectRegistry
 from .capnp import get_capnp_schema
@@ -25,7 +24,13 @@ SYFT_CLASSES_MISSING_CANONICAL_NAME = []
 recursive_scheme = get_capnp_schema("recursive_serde.capnp").RecursiveSerde
 
 SPOOLED_FILE_MAX_SIZE_SERDE = 50 * (1024**2)  # 50MB
+# every nested field adds a struct and a list level to a RecursiveSerde message,
+# so capnp's default nesting limit of 64 is reached by ~32 levels of objects.
+# 512 allows ~255 levels, well above the deepest object graphs syft sends, while
+# still rejecting maliciously deep messages before they exhaust the stack
+MAX_NESTING_LIMIT = 512
 DEFAULT_EXCLUDE_ATTRS: set[str] = {"syft_pre_hooks__", "syft_post_hooks__"}
+_MISSING = object()
 
 
 def get_types(cls: type, keys: list[str] | None = None) -> list[type] | None:
@@ -135,6 +140,136 @@ def skip_unregistered_class(
     return False
 
 
+@dataclass(frozen=True)
+class SerdePlan:
+    """Serde state of a registered class that is compiled once per
+    (canonical_name, version, for_hashing) instead of on every (de)serialization."""
+
+    nonrecursive: bool
+    serialize: Callable | None
+    deserialize: Callable | None
+    # sorted (attr_name, serialize transform) pairs, None if attrs come from __dict__
+    fields: tuple[tuple[str, Callable | None], ...] | None
+    exclude_attrs: frozenset[str]
+    deserialize_transforms: dict[str, Callable]
+    construct: Callable[[dict[str, Any]], Any]
+    # used for trusted sources, skips pydantic validation
+    construct_trusted: Callable[[dict[str, Any]], Any]
+
+
+def compile_fields(
+    attribute_list: Iterable[str],
+    exclude_attrs: frozenset[str],
+    serde_overrides: dict[str, tuple[Callable, Callable]],
+) -> tuple[tuple[str, Callable | None], ...]:
+    return tuple(
+        (
+            attr_name,
+            serde_overrides[attr_name][0] if attr_name in serde_overrides else None,
+        )
+        for attr_name in sorted(set(attribute_list) - exclude_attrs)
+    )
+
+
+def compile_constructor(class_type: type) -> Callable[[dict[str, Any]], Any]:
+    if hasattr(class_type, "serde_constructor"):
+        return class_type.serde_constructor
+
+    is_enum = issubclass(class_type, Enum)
+    if not is_enum and issubclass(class_type, BaseModel):
+        # if we skip the __new__ flow of BaseModel we get the error
+        # AttributeError: object has no attribute '__fields_set__'
+        return lambda kwargs: class_type(**kwargs)
+
+    def construct(kwargs: dict[str, Any]) -> Any:
+        if is_enum and "value" in kwargs:
+            return class_type.__new__(class_type, kwargs["value"])  # type: ignore
+
+        obj = class_type.__new__(class_type)  # type: ignore
+        for attr_name, attr_value in kwargs.items():
+            setattr(obj, attr_name, attr_value)
+        return obj
+
+    return construct
+
+
+def construct_model_trusted(class_type: type[BaseModel], kwargs: dict[str, Any]) -> Any:
+    """Build a pydantic model from already validated values, without validation.
+
+    Defaults and private attributes are filled in by `model_construct`, SyftObject's
+    `__post_init__` hook still runs as it sets up runtime state rather than validating.
+    """
+    obj = class_type.model_construct(**kwargs)
+    post_init = getattr(obj, "__post_init__", None)
+    if post_init is not None:
+        post_init()
+    return obj
+
+
+def compile_trusted_constructor(class_type: type) -> Callable[[dict[str, Any]], Any]:
+    if (
+        not hasattr(class_type, "serde_constructor")
+        and not issubclass(class_type, Enum)
+        and issubclass(class_type, BaseModel)
+    ):
+        return lambda kwargs: construct_model_trusted(class_type, kwargs)
+    return compile_constructor(class_type)
+
+
+def compile_serde_plan(
+    canonical_name: str, version: int, for_hashing: bool
+) -> SerdePlan:
+    (
+        nonrecursive,
+        serialize,
+        deserialize,
+        attribute_list,
+        exclude_attrs_list,
+        serde_overrides,
+        hash_exclude_attrs,
+        cls,
+        _,
+        _,
+    ) = SyftObjectRegistry.get_serde_properties(canonical_name, version)
+
+    exclude_attrs = set(exclude_attrs_list)
+    if for_hashing:
+        # relative
+        from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
+
+        exclude_attrs |= set(hash_exclude_attrs) | set(DYNAMIC_SYFT_ATTRIBUTES)
+
+    return SerdePlan(
+        nonrecursive=nonrecursive,
+        serialize=serialize,
+        deserialize=deserialize,
+        fields=(
+            None
+            if attribute_list is None
+            else compile_fields(
+                attribute_list, frozenset(exclude_attrs), serde_overrides
+            )
+        ),
+        exclude_attrs=frozenset(exclude_attrs),
+        deserialize_transforms={
+            attr_name: transforms[1]
+            for attr_name, transforms in serde_overrides.items()
+        },
+        construct=compile_constructor(cls),
+        construct_trusted=compile_trusted_constructor(cls),
+    )
+
+
+def get_serde_plan(canonical_name: str, version: int, for_hashing: bool) -> SerdePlan:
+    plan = SyftObjectRegistry.get_serde_plan(canonical_name, version, for_hashing)
+    if plan is None:
+        plan = compile_serde_plan(canonical_name, version, for_hashing)
+        SyftObjectRegistry.register_serde_plan(
+            canonical_name, version, for_hashing, plan
+        )
+    return plan
+
+
 def recursive_serde_register(
     cls: object | type,
     serialize: Callable | None = None,
@@ -219,6 +354,9 @@ def recursive_serde_register(
     )
 
     SyftObjectRegistry.register_cls(canonical_name, version, serde_attributes)
+    # the for_hashing plan needs syft_object, which may not be imported yet,
+    # it is compiled on first use instead
+    get_serde_plan(canonical_name, version, for_hashing=False)
 
     alias_fqn = check_fqn_alias(cls)
     if isinstance(alias_fqn, tuple):
@@ -260,108 +398,114 @@ def chunk_bytes(
             data_lst[idx] = data[START_INDEX:END_INDEX]
 
 
-def combine_bytes(capnp_list: list[bytes]) -> bytes:
-    # TODO: make sure this doesn't copy, perhaps allocate a fixed size buffer
-    # and move the bytes into it as we go
-    bytes_value = b""
-    for value in capnp_list:
-        bytes_value += value
-    return bytes_value
+def combine_bytes(capnp_list: list[bytes]) -> bytes | bytearray:
+    """Join the chunks written by `chunk_bytes` back into a single buffer.
+
+    A single chunk is returned as is. Multiple chunks are copied exactly once into a
+    preallocated bytearray, so large fields are not re-copied for every chunk.
+    """
+    if len(capnp_list) == 1:
+        return capnp_list[0]
+
+    chunks = list(capnp_list)
+    buffer = bytearray(sum(len(chunk) for chunk in chunks))
+    view = memoryview(buffer)
+    offset = 0
+    for chunk in chunks:
+        view[offset : offset + len(chunk)] = chunk
+        offset += len(chunk)
+    view.release()
+    return buffer
 
 
 def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuilder:
-    # relative
-    from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
+    msg = recursive_scheme.new_message()
+    rs_object2proto_into(self, msg, for_hashing=for_hashing)
+    return msg
+
+
+def rs_object2proto_into(
+    self: Any, msg: _DynamicStructBuilder, for_hashing: bool = False
+) -> None:
+    """Fill `msg` in place with the RecursiveSerde representation of `self`.
 
+    Recursive fields are written as nested structs in `fieldsObject`, so the whole
+    object tree ends up in a single capnp message instead of every nesting level
+    being encoded to bytes and copied into `fieldsData` of its parent.
+    """
     is_type = False
     if isinstance(self, type):
         is_type = True
 
-    msg = recursive_scheme.new_message()
-
     # todo: rewrite and make sure every object has a canonical name and version
     canonical_name, version = SyftObjectRegistry.get_canonical_name_version(self)
 
-    if not SyftObjectRegistry.has_serde_class(canonical_name, version):
-        # third party
-        raise Exception(
-            f"obj2proto: {canonical_name} version {version} not in SyftObjectRegistry"
-        )
+    plan = SyftObjectRegistry.get_serde_plan(canonical_name, version, for_hashing)
+    if plan is None:
+        if not SyftObjectRegistry.has_serde_class(canonical_name, version):
+            # third party
+            raise Exception(
+                f"obj2proto: {canonical_name} version {version} not in SyftObjectRegistry"
+            )
+        plan = get_serde_plan(canonical_name, version, for_hashing)
 
     msg.canonicalName = canonical_name
     msg.version = version
 
-    (
-        nonrecursive,
-        serialize,
-        _,
-        attribute_list,
-        exclude_attrs_list,
-        serde_overrides,
-        hash_exclude_attrs,
-        _,
-        _,
-        _,
-    ) = SyftObjectRegistry.get_serde_properties(canonical_name, version)
-
-    if nonrecursive or is_type:
-        if serialize is None:
+    if plan.nonrecursive or is_type:
+        if plan.serialize is None:
             raise Exception(
                 f"Cant serialize {type(self)} nonrecursive without serialize."
             )
-        chunk_bytes(self, serialize, "nonrecursiveBlob", msg)
-        return msg
-
-    if attribute_list is None:
-        attribute_list = self.__dict__.keys()
+        chunk_bytes(self, plan.serialize, "nonrecursiveBlob", msg)
+        return
 
-    hash_exclude_attrs_set = (
-        set(hash_exclude_attrs).union(set(DYNAMIC_SYFT_ATTRIBUTES))
-        if for_hashing
-        else set()
-    )
-    attribute_list = (
-        set(attribute_list) - set(exclude_attrs_list) - hash_exclude_attrs_set
-    )
+    fields = plan.fields
+    if fields is None:
+        fields = compile_fields(self.__dict__.keys(), plan.exclude_attrs, {})
 
-    msg.init("fieldsName", len(attribute_list))
-    msg.init("fieldsData", len(attribute_list))
+    msg.init("fieldsName", len(fields))
+    msg.init("fieldsObject", len(fields))
 
-    for idx, attr_name in enumerate(sorted(attribute_list)):
-        if not hasattr(self, attr_name):
+    for idx, (attr_name, transform) in enumerate(fields):
+        field_obj = getattr(self, attr_name, _MISSING)
+        if field_obj is _MISSING:
             raise ValueError(
                 f"{attr_name} on {type(self)} does not exist, serialization aborted!"
             )
 
-        field_obj = getattr(self, attr_name)
-        transforms = serde_overrides.get(attr_name, None)
-
-        if transforms is not None:
-            field_obj = transforms[0](field_obj)
+        if transform is not None:
+            field_obj = transform(field_obj)
 
         if isinstance(field_obj, types.FunctionType):
             continue
 
         msg.fieldsName[idx] = attr_name
-        chunk_bytes(
-            field_obj,
-            lambda x: sy.serialize(x, to_bytes=True, for_hashing=for_hashing),
-            idx,
-            msg.fieldsData,
-        )
-
-    return msg
+        rs_object2proto_into(field_obj, msg.fieldsObject[idx], for_hashing=for_hashing)
 
 
-def rs_bytes2object(blob: bytes) -> Any:
+def rs_bytes2object(blob: bytes | bytearray | memoryview) -> Any:
     MAX_TRAVERSAL_LIMIT = 2**64 - 1
 
     with recursive_scheme.from_bytes(
-        blob, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
+        blob,
+        traversal_limit_in_words=MAX_TRAVERSAL_LIMIT,
+        nesting_limit=MAX_NESTING_LIMIT,
     ) as msg:
         return rs_proto2object(msg)
 
 
+def rs_segments2object(segments: list[bytes]) -> Any:
+    MAX_TRAVERSAL_LIMIT = 2**64 - 1
+
+    msg = recursive_scheme.from_segments(
+        segments,
+        traversal_limit_in_words=MAX_TRAVERSAL_LIMIT,
+        nesting_limit=MAX_NESTING_LIMIT,
+    )
+    return rs_proto2object(msg)
+
+
 def map_fqns_for_backward_compatibility(fqn: str) -> str:
     """for backwards compatibility with 0.8.6. Sometimes classes where moved to another file. Which is
     exactly why we are implementing it differently"""
@@ -378,89 +522,68 @@ def map_fqns_for_backward_compatibility(fqn: str) -> str:
 def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
     # relative
     from .deserialize import _deserialize
-
-    class_type: type | Any = type(None)
+    from .deserialize import is_trusted_source
 
     canonical_name = proto.canonicalName
     version = getattr(proto, "version", -1)
 
-    if not SyftObjectRegistry.has_serde_class(canonical_name, version):
-        # relative
-        from ..server.server import CODE_RELOADER
-
-        for load_user_code in CODE_RELOADER.values():
-            load_user_code()
-        # third party
+    plan = SyftObjectRegistry.get_serde_plan(canonical_name, version, False)
+    if plan is None:
         if not SyftObjectRegistry.has_serde_class(canonical_name, version):
-            raise Exception(
-                f"proto2obj: {canonical_name} version {version} not in SyftObjectRegistry"
-            )
-
-    # TODO: 🐉 sort this out, basically sometimes the syft.user classes are not in the
-    # module name space in sub-processes or threads even though they are loaded on start
-    # its possible that the uvicorn awsgi server is preloading a bunch of threads
-    # however simply getting the class from the TYPE_BANK doesn't always work and
-    # causes some errors so it seems like we want to get the local one where possible
-    (
-        nonrecursive,
-        _,
-        deserialize,
-        _,
-        _,
-        serde_overrides,
-        _,
-        cls,
-        _,
-        version,
-    ) = SyftObjectRegistry.get_serde_properties(canonical_name, version)
-
-    class_type = cls
-
-    if nonrecursive:
-        if deserialize is None:
+            # relative
+            from ..server.server import CODE_RELOADER
+
+            for load_user_code in CODE_RELOADER.values():
+                load_user_code()
+            # third party
+            if not SyftObjectRegistry.has_serde_class(canonical_name, version):
+                raise Exception(
+                    f"proto2obj: {canonical_name} version {version} not in SyftObjectRegistry"
+                )
+
+        # TODO: 🐉 sort this out, basically sometimes the syft.user classes are not in the
+        # module name space in sub-processes or threads even though they are loaded on start
+        # its possible that the uvicorn awsgi server is preloading a bunch of threads
+        # however simply getting the class from the TYPE_BANK doesn't always work and
+        # causes some errors so it seems like we want to get the local one where possible
+        plan = get_serde_plan(canonical_name, version, False)
+
+    if plan.nonrecursive:
+        if plan.deserialize is None:
             raise Exception(
                 f"Cant serialize {type(proto)} nonrecursive without serialize."
             )
 
-        return deserialize(combine_bytes(proto.nonrecursiveBlob))
+        return plan.deserialize(combine_bytes(proto.nonrecursiveBlob))
 
     kwargs = {}
 
-    for attr_name, attr_bytes_list in zip(proto.fieldsName, proto.fieldsData):
-        if attr_name != "":
-            attr_bytes = combine_bytes(attr_bytes_list)
-            attr_value = _deserialize(attr_bytes, from_bytes=True)
-            transforms = serde_overrides.get(attr_name, None)
-
-            if transforms is not None:
-                attr_value = transforms[1](attr_value)
-            kwargs[attr_name] = attr_value
-
-    if hasattr(class_type, "serde_constructor"):
-        return class_type.serde_constructor(kwargs)
-
-    if issubclass(class_type, Enum) and "value" in kwargs:
-        obj = class_type.__new__(class_type, kwargs["value"])
-    elif issubclass(class_type, BaseModel):
-        # if we skip the __new__ flow of BaseModel we get the error
-        # AttributeError: object has no attribute '__fields_set__'
+    # messages written before nested fields were introduced carry every field as
+    # a separately encoded blob in fieldsData, newer ones as structs in fieldsObject
+    if len(proto.fieldsObject) > 0:
+        fields = (
+            (attr_name, rs_proto2object(attr_proto))
+            for attr_name, attr_proto in zip(proto.fieldsName, proto.fieldsObject)
+            if attr_name != ""
+        )
+    else:
+        fields = (
+            (attr_name, _deserialize(combine_bytes(attr_bytes_list), from_bytes=True))
+            for attr_name, attr_bytes_list in zip(proto.fieldsName, proto.fieldsData)
+            if attr_name != ""
+        )
 
-        # if "syft.user" in proto.fullyQualifiedName:
-        #     # weird issues with pydantic and ForwardRef on user classes being inited
-        #     # with custom state args / kwargs
-        #     obj = class_type()
-        #     for attr_name, attr_value in kwargs.items():
-        #         setattr(obj, attr_name, attr_value)
-        # else:
-        #     obj = class_type(**kwargs)
-        obj = class_type(**kwargs)
+    transforms = plan.deserialize_transforms
+    for attr_name, attr_value in fields:
+        transform = transforms.get(attr_name, None)
 
-    else:
-        obj = class_type.__new__(class_type)  # type: ignore
-        for attr_name, attr_value in kwargs.items():
-            setattr(obj, attr_name, attr_value)
+        if transform is not None:
+            attr_value = transform(attr_value)
+        kwargs[attr_name] = attr_value
 
-    return obj
+    if is_trusted_source():
+        return plan.construct_trusted(kwargs)
+    return plan.construct(kwargs)
 
 
 # how else do you import a relative file to execute it?
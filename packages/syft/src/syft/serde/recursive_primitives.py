@@ -66,7 +66,9 @@ def serialize_iterable(iterable: Collection) -> bytes:
         return res
 
 
-def deserialize_iterable(iterable_type: type, blob: bytes) -> Collection:
+def deserialize_iterable(
+    iterable_type: type, blob: bytes | bytearray | memoryview
+) -> Collection:
     # relative
     from .deserialize import _deserialize
 
@@ -108,7 +110,7 @@ def serialize_kv(map: Mapping) -> bytes:
     return _serialize_kv_pairs(len(map), map.items())
 
 
-def get_deserialized_kv_pairs(blob: bytes) -> list[Any]:
+def get_deserialized_kv_pairs(blob: bytes | bytearray | memoryview) -> list[Any]:
     # relative
     from .deserialize import _deserialize
 
@@ -237,7 +239,8 @@ recursive_serde_register(
 recursive_serde_register(
     bytes,
     serialize=lambda x: x,
-    deserialize=lambda x: x,
+    # fields spanning multiple capnp chunks are combined into a bytearray
+    deserialize=lambda x: x if isinstance(x, bytes) else bytes(x),
     canonical_name="bytes",
     version=1,
 )
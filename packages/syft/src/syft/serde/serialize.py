@@ -1,11 +1,18 @@
 # stdlib
+from collections.abc import Iterator
+import struct
 import tempfile
 from typing import Any
+from typing import Protocol
 
 # relative
 from .util import compatible_with_large_file_writes_capnp
 
 
+class Writable(Protocol):
+    def write(self, data: bytes, /) -> Any: ...
+
+
 def _serialize(
     obj: object,
     to_proto: bool = True,
@@ -32,3 +39,44 @@ def _serialize(
 
     if to_proto:
         return proto
+
+
+def _iter_serialized(obj: object, for_hashing: bool = False) -> Iterator[bytes]:
+    """Serializes `obj` and returns an iterator over the segment table followed by the
+    capnp segments. Joined together the chunks are identical to
+    `_serialize(obj, to_bytes=True)`, but the message is never copied into one buffer.
+
+    Serialization happens eagerly, so errors are raised before anything is written.
+    """
+    # relative
+    from .recursive import rs_object2proto
+
+    proto = rs_object2proto(obj, for_hashing=for_hashing)
+    segments = proto.to_segments()
+    del proto
+
+    # capnp stream framing: segment count - 1, the size of every segment in words,
+    # padded to a multiple of 8 bytes
+    table = [len(segments) - 1] + [len(segment) // 8 for segment in segments]
+    if len(table) % 2 == 1:
+        table.append(0)
+    segments.insert(0, struct.pack(f"<{len(table)}I", *table))
+
+    # hand out segments one by one so each can be freed once it has been consumed
+    segments.reverse()
+
+    def iter_chunks() -> Iterator[bytes]:
+        while segments:
+            yield segments.pop()
+
+    return iter_chunks()
+
+
+def _serialize_to(obj: object, sink: Writable, for_hashing: bool = False) -> int:
+    """Serializes `obj` straight into `sink` (file, socket file, blob upload buffer),
+    anything with a `write` method. Returns the number of bytes written."""
+    size = 0
+    for chunk in _iter_serialized(obj, for_hashing=for_hashing):
+        sink.write(chunk)
+        size += len(chunk)
+    return size
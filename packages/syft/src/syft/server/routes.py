@@ -1,14 +1,21 @@
 # stdlib
+import asyncio
 import base64
 import binascii
 from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
 import logging
+import os
 from typing import Annotated
 
 # third party
 from fastapi import APIRouter
 from fastapi import Body
 from fastapi import Depends
+from fastapi import FastAPI
 from fastapi import HTTPException
 from fastapi import Request
 from fastapi import Response
@@ -16,16 +23,18 @@ from fastapi.responses import JSONResponse
 from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 import requests
+from starlette.concurrency import run_in_threadpool
 
 # relative
 from ..abstract_server import AbstractServer
 from ..client.connection import ServerConnection
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..serde.deserialize import _deserialize as deserialize
+from ..serde.deserialize import _deserialize_from as deserialize_from
+from ..serde.serialize import _iter_serialized as iter_serialized
 from ..serde.serialize import _serialize as serialize
 from ..service.context import ServerServiceContext
 from ..service.context import UnauthedServiceContext
-from ..service.metadata.server_metadata import ServerMetadataJSON
 from ..service.response import SyftError
 from ..service.user.user import UserCreate
 from ..service.user.user import UserPrivateKey
@@ -38,8 +47,115 @@ from .worker import Worker
 
 logger = logging.getLogger(__name__)
 
+# threads that deserialize and run API calls, as many as the default threadpool
+# the synchronous handlers used to run on
+API_CALL_MAX_WORKERS = int(os.environ.get("API_CALL_MAX_WORKERS", 40))
+# API calls that are read or run at once, the rest wait before their body is read
+API_CALL_MAX_PENDING = 2 * API_CALL_MAX_WORKERS
+# threads that forward uploads to peers, every upload holds one until it is sent
+STREAM_UPLOAD_MAX_WORKERS = int(os.environ.get("STREAM_UPLOAD_MAX_WORKERS", 16))
+# chunks of an upload that are buffered when the peer is slower than the client
+STREAM_UPLOAD_QUEUE_SIZE = 16
+
+
+async def iter_async(chunks: Iterator[bytes]) -> AsyncGenerator[bytes, None]:
+    for chunk in chunks:
+        yield chunk
+
+
+def iter_queue(
+    queue: asyncio.Queue, loop: asyncio.AbstractEventLoop
+) -> Iterator[bytes]:
+    """Iterate from a thread over the chunks put on `queue` until a None chunk.
+
+    An exception put on the queue is raised, to abort the request being sent.
+    """
+    while True:
+        chunk = asyncio.run_coroutine_threadsafe(queue.get(), loop).result()
+        if chunk is None:
+            return
+        if isinstance(chunk, BaseException):
+            raise chunk
+        yield chunk
+
+
+class ChunkReader:
+    """A `read` over chunks, so a request body can be deserialized from a thread as
+    it arrives."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self.chunks = chunks
+        self.chunk = memoryview(b"")
+
+    def read(self, size: int, /) -> bytes:
+        while not self.chunk:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                return b""
+            self.chunk = memoryview(chunk)
+        data = bytes(self.chunk[:size])
+        self.chunk = self.chunk[size:]
+        return data
+
+
+async def forward_chunks(
+    body: AsyncIterator[bytes], queue: asyncio.Queue, consumer: asyncio.Future
+) -> None:
+    """Put the chunks of `body` on `queue` for `consumer`, which reads them from a
+    thread with `iter_queue`.
+
+    Stops early when `consumer` finishes without reading the whole body. When
+    reading `body` fails, the consumer is aborted and waited for before the
+    error is raised, so it doesn't outlive the request unobserved.
+    """
+
+    async def put_chunk(chunk: bytes | BaseException | None) -> bool:
+        """Hand a chunk to the consumer, False if it ended without it."""
+        put_task = asyncio.ensure_future(queue.put(chunk))
+        await asyncio.wait({put_task, consumer}, return_when=asyncio.FIRST_COMPLETED)
+        if consumer.done():
+            put_task.cancel()
+            return False
+        return True
+
+    end_of_body: None | BaseException = ConnectionAbortedError(
+        "Request body was interrupted"
+    )
+    try:
+        async for chunk in body:
+            if not await put_chunk(chunk):
+                break
+        end_of_body = None
+    finally:
+        # don't let the consumer take a truncated body for a whole one
+        await put_chunk(end_of_body)
+        if end_of_body is not None:
+            with contextlib.suppress(Exception):
+                await consumer
+
+
+@contextlib.asynccontextmanager
+async def routes_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create the executors and the API call limit of the routes from `make_routes`
+    on `app.state`, and shut the executors down when the app stops."""
+    app.state.api_call_slots = asyncio.Semaphore(API_CALL_MAX_PENDING)
+    app.state.api_call_executor = ThreadPoolExecutor(
+        max_workers=API_CALL_MAX_WORKERS, thread_name_prefix="api_call"
+    )
+    app.state.upload_executor = ThreadPoolExecutor(
+        max_workers=STREAM_UPLOAD_MAX_WORKERS, thread_name_prefix="stream_upload"
+    )
+    try:
+        yield
+    finally:
+        # the threads may wait on the event loop, which is running this
+        app.state.api_call_executor.shutdown(wait=False, cancel_futures=True)
+        app.state.upload_executor.shutdown(wait=False, cancel_futures=True)
+
 
 def make_routes(worker: Worker) -> APIRouter:
+    """The routes of the server API, the app they are included in must run
+    `routes_lifespan`."""
     router = APIRouter()
 
     async def get_body(request: Request) -> bytes:
@@ -63,13 +179,17 @@ def make_routes(worker: Worker) -> APIRouter:
 
         peer_uid_parsed = UID.from_string(peer_uid)
 
-        try:
+        def open_stream() -> Iterator[bytes]:
             peer_connection = _get_server_connection(peer_uid_parsed)
             url = peer_connection.to_blob_route(url_path_parsed)
-            stream_response = peer_connection._make_get(url.path, stream=True)
+            return peer_connection._make_get(url.path, stream=True)
+
+        try:
+            stream_response = await run_in_threadpool(open_stream)
         except requests.RequestException:
             raise HTTPException(404, "Failed to retrieve data from datasite.")
 
+        # chunks are read from the peer in the threadpool as the client consumes them
         return StreamingResponse(stream_response, media_type="text/event-stream")
 
     async def read_request_body_in_chunks(
@@ -85,16 +205,27 @@ def make_routes(worker: Worker) -> APIRouter:
         except binascii.Error:
             raise HTTPException(404, "Invalid `url_path`.")
 
-        data = await request.body()
-
         peer_uid_parsed = UID.from_string(peer_uid)
 
-        try:
+        # forward the upload chunk by chunk, the client is only read as fast as the
+        # peer accepts the chunks
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue(maxsize=STREAM_UPLOAD_QUEUE_SIZE)
+
+        def upload() -> requests.Response:
             peer_connection = _get_server_connection(peer_uid_parsed)
             url = peer_connection.to_blob_route(url_path_parsed)
+            return peer_connection._make_put(
+                url.path, data=iter_queue(chunks, loop), stream=True
+            )
+
+        # uploads run on their own threads, slow ones don't hold up the threadpool
+        # of the synchronous routes
+        upload_task = loop.run_in_executor(request.app.state.upload_executor, upload)
+        await forward_chunks(read_request_body_in_chunks(request), chunks, upload_task)
 
-            print("Url on stream", url.path)
-            response = peer_connection._make_put(url.path, data=data, stream=True)
+        try:
+            response = await upload_task
         except requests.RequestException:
             raise HTTPException(404, "Failed to upload data to datasite")
 
@@ -121,25 +252,31 @@ def make_routes(worker: Worker) -> APIRouter:
 
     # provide information about the server in JSON
     @router.get("/metadata", response_class=JSONResponse)
-    def syft_metadata() -> JSONResponse:
-        return worker.metadata.to(ServerMetadataJSON)
+    def syft_metadata() -> Response:
+        return Response(worker.metadata_json, media_type="application/json")
 
     @router.get("/metadata_capnp")
     def syft_metadata_capnp() -> Response:
-        result = worker.metadata
         return Response(
-            serialize(result, to_bytes=True),
+            worker.metadata_capnp,
             media_type="application/octet-stream",
         )
 
     def handle_syft_new_api(
-        user_verify_key: SyftVerifyKey, communication_protocol: PROTOCOL_TYPE
+        user_verify_key: SyftVerifyKey,
+        communication_protocol: PROTOCOL_TYPE,
+        if_none_match: str | None = None,
     ) -> Response:
+        api_bytes, etag = worker.get_serialized_api(
+            user_verify_key, communication_protocol
+        )
+        # the client already has this API
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
         return Response(
-            serialize(
-                worker.get_api(user_verify_key, communication_protocol), to_bytes=True
-            ),
+            api_bytes,
             media_type="application/octet-stream",
+            headers={"ETag": etag},
         )
 
     # get the SyftAPI object
@@ -148,22 +285,36 @@ def make_routes(worker: Worker) -> APIRouter:
         request: Request, verify_key: str, communication_protocol: PROTOCOL_TYPE
     ) -> Response:
         user_verify_key: SyftVerifyKey = SyftVerifyKey.from_string(verify_key)
-        return handle_syft_new_api(user_verify_key, communication_protocol)
+        return handle_syft_new_api(
+            user_verify_key,
+            communication_protocol,
+            if_none_match=request.headers.get("If-None-Match"),
+        )
 
-    def handle_new_api_call(data: bytes) -> Response:
-        obj_msg = deserialize(blob=data, from_bytes=True)
+    def handle_new_api_call(body: Iterator[bytes]) -> Iterator[bytes]:
+        obj_msg = deserialize_from(ChunkReader(body))
         result = worker.handle_api_call(api_call=obj_msg)
-        return Response(
-            serialize(result, to_bytes=True),
-            media_type="application/octet-stream",
-        )
+        return iter_serialized(result)
 
     # make a request to the SyftAPI
     @router.post("/api_call")
-    def syft_new_api_call(
-        request: Request, data: Annotated[bytes, Depends(get_body)]
-    ) -> Response:
-        return handle_new_api_call(data)
+    async def syft_new_api_call(request: Request) -> Response:
+        state = request.app.state
+        async with state.api_call_slots:
+            # the call is deserialized from the body as it arrives, then run and
+            # serialized in the executor, the event loop keeps serving other requests
+            loop = asyncio.get_running_loop()
+            body: asyncio.Queue = asyncio.Queue(maxsize=STREAM_UPLOAD_QUEUE_SIZE)
+            api_call = loop.run_in_executor(
+                state.api_call_executor, handle_new_api_call, iter_queue(body, loop)
+            )
+            await forward_chunks(request.stream(), body, api_call)
+            chunks = await api_call
+        # write the capnp segments out as they are instead of joining them first
+        return StreamingResponse(
+            iter_async(chunks),
+            media_type="application/octet-stream",
+        )
 
     def handle_forgot_password(email: str, server: AbstractServer) -> Response:
         try:
@@ -14,6 +14,7 @@ import logging
 import os
 from pathlib import Path
 import threading
+import time
 from time import sleep
 import traceback
 from typing import Any
@@ -37,6 +38,7 @@ from ..client.client import SyftClient
 from ..deployment_type import DeploymentType
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..protocol.data_protocol import get_data_protocol
+from ..serde.serialize import _serialize as serialize
 from ..service.action.action_object import Action
 from ..service.action.action_object import ActionObject
 from ..service.code.user_code_stash import UserCodeStash
@@ -44,11 +46,14 @@ from ..service.context import AuthedServiceContext
 from ..service.context import ServerServiceContext
 from ..service.context import UnauthedServiceContext
 from ..service.context import UserLoginCredentials
+from ..service.job.job_stash import JOB_WAIT_POLL_INTERVAL_SEC
 from ..service.job.job_stash import Job
 from ..service.job.job_stash import JobStash
 from ..service.job.job_stash import JobStatus
 from ..service.job.job_stash import JobType
+from ..service.job.job_stash import job_events
 from ..service.metadata.server_metadata import ServerMetadata
+from ..service.metadata.server_metadata import ServerMetadataJSON
 from ..service.network.utils import PeerHealthCheckTask
 from ..service.notifier.notifier_service import NotifierService
 from ..service.output.output_service import OutputStash
@@ -140,6 +145,13 @@ SyftT = TypeVar("SyftT", bound=SyftObject)
 # the code for a specific server UID and thread
 CODE_RELOADER: dict[int, Callable] = {}
 
+# settings are cached in memory and dropped when they are changed through this server,
+# this bounds how long other processes of the server can serve stale settings
+SETTINGS_CACHE_TTL_SEC = 10
+
+# number of (user, protocol) pairs the serialized SyftAPI is kept for
+API_CACHE_MAX_SIZE = 1024
+
 
 def get_default_worker_pool_count(server: Server) -> int:
     return int(
@@ -247,7 +259,14 @@ class Server(AbstractServer):
         self.server_side_type = ServerSideType(server_side_type)
         self.client_cache: dict = {}
         self.peer_client_cache: dict = {}
-        self._settings = None
+        self._settings: ServerSettings | None = None
+        self._settings_t = 0.0
+        self._metadata: ServerMetadata | None = None
+        self._metadata_bytes: dict[str, bytes] = {}
+        self._api_cache: OrderedDict[
+            tuple[str, PROTOCOL_TYPE], tuple[tuple, bytes, str]
+        ] = OrderedDict()
+        self._api_cache_lock = threading.Lock()
 
         if isinstance(server_type, str):
             server_type = ServerType(server_type)
@@ -528,10 +547,12 @@ class Server(AbstractServer):
 
     def init_queue_manager(self, queue_config: QueueConfig) -> None:
         MessageHandlers = [APICallMessageHandler]
+        # subprocesses don't run producers or consumers, but use the queue manager
+        # to notify the producer of new queue items
+        self.queue_manager = QueueManager(config=queue_config)
         if self.is_subprocess:
             return None
 
-        self.queue_manager = QueueManager(config=queue_config)
         for message_handler in MessageHandlers:
             queue_name = message_handler.queue_name
             # client config
@@ -904,29 +925,28 @@ class Server(AbstractServer):
     # it should be removed once the settings are refactored and the inconsistencies between
     # settings and services are resolved.
     def get_settings(self) -> ServerSettings | None:
-        if self._settings:
-            return self._settings  # type: ignore
+        settings = self._cached_settings()
+        if settings is not None:
+            return settings
         if self.signing_key is None:
             raise ValueError(f"{self} has no signing key")
 
         settings_stash = self.services.settings.stash
 
         try:
-            settings = settings_stash.get_all(self.signing_key.verify_key).unwrap()
-
-            if len(settings) > 0:
-                setting = settings[0]
-                self.update_self(setting)
-                self._settings = setting
-                return setting
-            else:
-                return None
-
+            all_settings = settings_stash.get_all(self.signing_key.verify_key).unwrap()
         except SyftException:
             return None
 
+        if len(all_settings) == 0:
+            return None
+        return self._cache_settings(all_settings[0])
+
     @property
     def settings(self) -> ServerSettings:
+        settings = self._cached_settings()
+        if settings is not None:
+            return settings
         if self.signing_key is None:
             raise ValueError(f"{self} has no signing key")
 
@@ -939,19 +959,38 @@ class Server(AbstractServer):
 
         if len(all_settings) == 0:
             raise SyftException(public_message=error_msg)
+        return self._cache_settings(all_settings[0])
+
+    def _cached_settings(self) -> ServerSettings | None:
+        if time.monotonic() - self._settings_t >= SETTINGS_CACHE_TTL_SEC:
+            return None
+        return self._settings
 
-        settings = all_settings[0]
+    def _cache_settings(self, settings: ServerSettings) -> ServerSettings:
         self.update_self(settings)
+        self._settings = settings
+        self._settings_t = time.monotonic()
+        self._metadata = None
+        self._metadata_bytes = {}
         return settings
 
+    def invalidate_settings(self) -> None:
+        """Drop the cached settings and metadata, call after changing the settings."""
+        self._settings = None
+        self._settings_t = 0.0
+        self._metadata = None
+        self._metadata_bytes = {}
+
     @property
     def metadata(self) -> ServerMetadata:
-        show_warnings = self.enable_warnings
+        # callers may change the metadata they get, the cached one stays as built
+        return self._get_metadata().model_copy()
+
+    def _get_metadata(self) -> ServerMetadata:
         settings_data = self.settings
-        name = settings_data.name
-        organization = settings_data.organization
-        description = settings_data.description
-        show_warnings = settings_data.show_warnings
+        if self._metadata is not None:
+            return self._metadata
+
         server_type = (
             settings_data.server_type.value if settings_data.server_type else ""
         )
@@ -960,23 +999,41 @@ class Server(AbstractServer):
             if settings_data.server_side_type
             else ""
         )
-        eager_execution_enabled = settings_data.eager_execution_enabled
 
-        return ServerMetadata(
-            name=name,
+        self._metadata = ServerMetadata(
+            name=settings_data.name,
             id=self.id,
             verify_key=self.verify_key,
             highest_version=SYFT_OBJECT_VERSION_1,
             lowest_version=SYFT_OBJECT_VERSION_1,
             syft_version=__version__,
-            description=description,
-            organization=organization,
+            description=settings_data.description,
+            organization=settings_data.organization,
             server_type=server_type,
             server_side_type=server_side_type,
-            show_warnings=show_warnings,
-            eager_execution_enabled=eager_execution_enabled,
+            show_warnings=settings_data.show_warnings,
+            eager_execution_enabled=settings_data.eager_execution_enabled,
             min_size_blob_storage_mb=self.blob_store_config.min_blob_size,
         )
+        return self._metadata
+
+    @property
+    def metadata_capnp(self) -> bytes:
+        """The serialized metadata, as returned by the /metadata_capnp route."""
+        metadata = self._get_metadata()
+        if "capnp" not in self._metadata_bytes:
+            self._metadata_bytes["capnp"] = serialize(metadata, to_bytes=True)
+        return self._metadata_bytes["capnp"]
+
+    @property
+    def metadata_json(self) -> bytes:
+        """The metadata as JSON, as returned by the /metadata route."""
+        metadata = self._get_metadata()
+        if "json" not in self._metadata_bytes:
+            self._metadata_bytes["json"] = (
+                metadata.to(ServerMetadataJSON).model_dump_json().encode()
+            )
+        return self._metadata_bytes["json"]
 
     @property
     def icon(self) -> str:
@@ -1006,11 +1063,14 @@ class Server(AbstractServer):
         # relative
         from ..service.queue.queue import Status
 
-        while True:
-            result = self.queue_stash.pop_on_complete(credentials, uid).unwrap()
-            if result.status == Status.COMPLETED:
-                return result
-            sleep(0.1)
+        result = self.queue_stash.pop_on_complete(credentials, uid).unwrap()
+        # queue items complete together with their jobs
+        with job_events.watch(result.job_id) as changed:
+            while result.status != Status.COMPLETED:
+                changed.wait(JOB_WAIT_POLL_INTERVAL_SEC)
+                changed.clear()
+                result = self.queue_stash.pop_on_complete(credentials, uid).unwrap()
+        return result
 
     @instrument
     def resolve_future(self, credentials: SyftVerifyKey, uid: UID) -> QueueItem:
@@ -1142,7 +1202,6 @@ class Server(AbstractServer):
         if is_blocking or self.is_subprocess:
             api_call = api_call.message
 
-            role = self.get_role_for_credentials(credentials=credentials)
             settings = self.get_settings()
             # TODO: This instance check should be removed once we can ensure that
             # self.settings will always return a ServerSettings object.
@@ -1397,6 +1456,7 @@ class Server(AbstractServer):
         self.queue_stash.set_placeholder(credentials, queue_item).unwrap()
 
         self.services.log.add(context, log_id, queue_item.job_id)
+        self.queue_manager.notify(APICallMessageHandler.queue_name)
 
         return job
 
@@ -1567,6 +1627,47 @@ class Server(AbstractServer):
             communication_protocol=communication_protocol,
         )
 
+    def get_serialized_api(
+        self,
+        for_user: SyftVerifyKey,
+        communication_protocol: PROTOCOL_TYPE,
+    ) -> tuple[bytes, str]:
+        """Get the serialized SyftAPI of a user and its ETag.
+
+        The API is only built again when something it is built from changed: the role
+        of the user, the user code they can read, the custom API endpoints or the name
+        of the server.
+        """
+        fingerprint = (
+            self.get_role_for_credentials(for_user),
+            frozenset(self.services.user_code.stash.get_all_ids(for_user).unwrap()),
+            frozenset(
+                self.services.api.stash.get_all_update_times(
+                    self.verify_key, has_permission=True
+                )
+                .unwrap()
+                .items()
+            ),
+            self.name,
+        )
+        key = (str(for_user), communication_protocol)
+        with self._api_cache_lock:
+            cached = self._api_cache.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                self._api_cache.move_to_end(key)
+                return cached[1], cached[2]
+
+        api_bytes = serialize(
+            self.get_api(for_user, communication_protocol), to_bytes=True
+        )
+        etag = f'"{hashlib.sha256(api_bytes).hexdigest()}"'
+        with self._api_cache_lock:
+            self._api_cache[key] = (fingerprint, api_bytes, etag)
+            self._api_cache.move_to_end(key)
+            while len(self._api_cache) > API_CACHE_MAX_SIZE:
+                self._api_cache.popitem(last=False)
+        return api_bytes, etag
+
     def get_method_with_context(
         self, function: Callable, context: ServerServiceContext
     ) -> Callable:
@@ -36,6 +36,7 @@ from .datasite import Datasite
 from .enclave import Enclave
 from .gateway import Gateway
 from .routes import make_routes
+from .routes import routes_lifespan
 from .server import Server
 from .server import ServerType
 from .utils import get_named_server_uid
@@ -77,7 +78,8 @@ def get_lifetime(worker: Server) -> Callable:
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> Any:
         try:
-            yield
+            async with routes_lifespan(app):
+                yield
         finally:
             worker.stop()
 
@@ -6,10 +6,9 @@ from collections.abc import Callable
 from collections.abc import Iterable
 from enum import Enum
 import inspect
-from io import BytesIO
 import logging
 from pathlib import Path
-import sys
+import tempfile
 import threading
 import time
 import types
@@ -28,8 +27,9 @@ from typing_extensions import Self
 from ...client.api import SyftAPI
 from ...client.api import SyftAPICall
 from ...client.client import SyftClient
+from ...serde.recursive import SPOOLED_FILE_MAX_SIZE_SERDE
 from ...serde.serializable import serializable
-from ...serde.serialize import _serialize as serialize
+from ...serde.serialize import _serialize_to as serialize_to
 from ...server.credentials import SyftVerifyKey
 from ...service.blob_storage.util import can_upload_to_blob_storage
 from ...service.response import SyftSuccess
@@ -820,28 +820,36 @@ class ActionObject(SyncableSyftObject):
                             f" the blob store but to memory cache since it is small."
                         )
                     )
-                serialized = serialize(data, to_bytes=True)
-                size = sys.getsizeof(serialized)
-                storage_entry = CreateBlobStorageEntry.from_obj(data, file_size=size)
-
-                if not TraceResultRegistry.current_thread_is_tracing():
-                    self.syft_action_data_cache = self.as_empty_data()
-                if self.syft_blob_storage_entry_id is not None:
-                    # TODO: check if it already exists
-                    storage_entry.id = self.syft_blob_storage_entry_id
-                allocate_method = from_api_or_context(
-                    func_or_path="blob_storage.allocate",
-                    syft_server_location=self.syft_server_location,
-                    syft_client_verify_key=self.syft_client_verify_key,
-                )
-                if allocate_method is not None:
-                    blob_deposit_object = allocate_method(storage_entry)
-                    blob_deposit_object.write(BytesIO(serialized)).unwrap()
-                    self.syft_blob_storage_entry_id = (
-                        blob_deposit_object.blob_storage_entry_id
+                # the capnp message is still built in memory, but its segments are
+                # written to a spooled file one by one instead of being joined into
+                # one more bytes copy for the upload
+                with tempfile.SpooledTemporaryFile(
+                    max_size=SPOOLED_FILE_MAX_SIZE_SERDE
+                ) as serialized:
+                    size = serialize_to(data, serialized)
+                    serialized.seek(0)
+                    storage_entry = CreateBlobStorageEntry.from_obj(
+                        data, file_size=size
                     )
-                else:
-                    logger.warn("cannot save to blob storage. allocate_method=None")
+
+                    if not TraceResultRegistry.current_thread_is_tracing():
+                        self.syft_action_data_cache = self.as_empty_data()
+                    if self.syft_blob_storage_entry_id is not None:
+                        # TODO: check if it already exists
+                        storage_entry.id = self.syft_blob_storage_entry_id
+                    allocate_method = from_api_or_context(
+                        func_or_path="blob_storage.allocate",
+                        syft_server_location=self.syft_server_location,
+                        syft_client_verify_key=self.syft_client_verify_key,
+                    )
+                    if allocate_method is not None:
+                        blob_deposit_object = allocate_method(storage_entry)
+                        blob_deposit_object.write(serialized).unwrap()
+                        self.syft_blob_storage_entry_id = (
+                            blob_deposit_object.blob_storage_entry_id
+                        )
+                    else:
+                        logger.warn("cannot save to blob storage. allocate_method=None")
 
             self.syft_action_data_type = type(data)
             self._set_reprs(data)
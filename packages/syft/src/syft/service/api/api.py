@@ -39,6 +39,7 @@ from ...types.transforms import transform
 from ...types.uid import UID
 from ...util.misc_objs import MarkdownDescription
 from ..context import AuthedServiceContext
+from ..log.log_buffer import JobLogBuffer
 from ..response import SyftError
 from ..user.user import UserView
 from .utils import print as log_print
@@ -601,10 +602,13 @@ class TwinAPIEndpoint(SyncableSyftObject):
         import functools
 
         original_print = __builtin__.print
+        log_buffer = None
+        if log_id is not None and context.server is not None:
+            log_buffer = JobLogBuffer(context=context, log_id=log_id)
 
         try:
-            if log_id is not None:
-                print = functools.partial(log_print, context, log_id)
+            if log_buffer is not None:
+                print = functools.partial(log_print, log_buffer)
             else:
                 print = original_print  # type: ignore
 
@@ -671,6 +675,10 @@ class TwinAPIEndpoint(SyncableSyftObject):
                         "please contact your admin."
                     )
                 )
+        finally:
+            # write the buffered output of the call and compact its log chunks
+            if log_buffer is not None:
+                log_buffer.close()
 
 
 def set_access_type(context: TransformContext) -> TransformContext:
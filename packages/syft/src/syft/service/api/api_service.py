@@ -1,5 +1,4 @@
 # stdlib
-import time
 from typing import Any
 from typing import cast
 
@@ -344,29 +343,18 @@ class APIService(AbstractService):
 
         # relative
         from ..job.job_stash import JobStatus
+        from ..job.job_stash import PENDING_JOB_STATUSES
 
-        # So result is a Job object
-        job_id = job.id
-        # Question: For a small moment, when job status is updated, it doesn't return the job during the .get() as if
-        # it's not in the stash. Then afterwards if appears again. Is this a bug?
-
-        start = time.time()
-
-        # TODO: what can we do here?????
-        while (
-            job is None
-            or job.status == JobStatus.PROCESSING
-            or job.status == JobStatus.CREATED
-        ):
-            job = context.server.services.job.get(context, job_id)
-            time.sleep(0.1)
-            if (time.time() - custom_endpoint.endpoint_timeout) > start:
-                raise SyftException(
-                    public_message=(
-                        f"Function timed out in {custom_endpoint.endpoint_timeout} seconds. "
-                        + f"Get the Job with id: {job_id} to check results."
-                    )
+        job = context.server.services.job.stash.wait_until_done(
+            context.credentials, job.id, timeout=custom_endpoint.endpoint_timeout
+        ).unwrap()
+        if not job.resolved and job.status in PENDING_JOB_STATUSES:
+            raise SyftException(
+                public_message=(
+                    f"Function timed out in {custom_endpoint.endpoint_timeout} seconds. "
+                    + f"Get the Job with id: {job.id} to check results."
                 )
+            )
 
         if job.status == JobStatus.COMPLETED:
             return job.result
@@ -5,16 +5,14 @@ import sys
 from typing import Any
 
 # relative
-from ...types.uid import UID
 from ..action.action_object import ActionObject
-from ..context import AuthedServiceContext
 from ..job.job_stash import Job
+from ..log.log_buffer import JobLogBuffer
 from ..response import SyftError
 
 
 def print(
-    context: AuthedServiceContext,
-    log_id: UID,
+    log_buffer: JobLogBuffer,
     *args: Any,
     sep: str = " ",
     end: str = "\n",
@@ -32,8 +30,7 @@ def print(
 
     new_args = [to_str(arg) for arg in args]
     new_str = sep.join(new_args) + end
-    if context.server is not None:
-        context.server.services.log.append(context=context, uid=log_id, new_str=new_str)
+    log_buffer.write(stdout=new_str)
     time = datetime.datetime.now().strftime("%d/%m/%y %H:%M:%S")
     return __builtin__.print(
         f"{time} FUNCTION LOG :",
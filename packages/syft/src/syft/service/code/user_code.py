@@ -72,6 +72,7 @@ from ..action.action_object import ActionObject
 from ..context import AuthedServiceContext
 from ..dataset.dataset import Asset
 from ..job.job_stash import Job
+from ..log.log_buffer import JobLogBuffer
 from ..output.output_service import ExecutionOutput
 from ..policy.policy import Constant
 from ..policy.policy import CustomInputPolicy
@@ -1861,6 +1862,7 @@ def execute_byte_code(
 ) -> Any:
     stdout_ = sys.stdout
     stderr_ = sys.stderr
+    log_buffer = None
 
     try:
         # stdlib
@@ -1900,9 +1902,15 @@ def execute_byte_code(
             def __setattr__(self, __name: str, __value: Any) -> None:
                 raise Exception("Attempting to alter read-only value")
 
+        if (
+            context.server is not None
+            and context.job is not None
+            and context.job.log_id is not None
+        ):
+            log_buffer = JobLogBuffer(context=context, log_id=context.job.log_id)
+
         if context.job is not None:
             job_id = context.job_id
-            log_id = context.job.log_id
 
             def print(*args: Any, sep: str = " ", end: str = "\n") -> str | None:
                 def to_str(arg: Any) -> str:
@@ -1918,10 +1926,8 @@ def execute_byte_code(
 
                 new_args = [to_str(arg) for arg in args]
                 new_str = sep.join(new_args) + end
-                if context.server is not None:
-                    context.server.services.log.append(
-                        context=context, uid=log_id, new_str=new_str
-                    )
+                if log_buffer is not None:
+                    log_buffer.write(stdout=new_str)
                 time = datetime.datetime.now().strftime("%d/%m/%y %H:%M:%S")
                 return __builtin__.print(
                     f"{time} FUNCTION LOG ({job_id}):",
@@ -1980,15 +1986,8 @@ def execute_byte_code(
                 time = datetime.datetime.now().strftime("%d/%m/%y %H:%M:%S")
                 logger.error(f"{time} EXCEPTION LOG:\n{error_msg}\n")
 
-            if (
-                context.server is not None
-                and context.job is not None
-                and context.job.log_id is not None
-            ):
-                log_id = context.job.log_id
-                context.server.services.log.append(
-                    context=context, uid=log_id, new_err=error_msg
-                )
+            if log_buffer is not None:
+                log_buffer.write(stderr=error_msg)
 
             result_message = (
                 f"Exception encountered while running {code_item.service_func_name}"
@@ -2026,6 +2025,8 @@ def execute_byte_code(
     finally:
         sys.stdout = stdout_
         sys.stderr = stderr_
+        if log_buffer is not None:
+            log_buffer.close()
 
 
 def traceback_from_error(e: Exception, code: UserCode) -> str:
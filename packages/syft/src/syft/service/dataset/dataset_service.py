@@ -114,14 +114,32 @@ class DatasetService(AbstractService):
         page_index: int | None = 0,
     ) -> DatasetPageView | DictTuple[str, Dataset]:
         """Get a Dataset"""
-        datasets = self.stash.get_all_active(context.credentials).unwrap()
+        slice_ = None
+        if page_size is not None and page_size > 0:
+            # count first, so only the requested page is loaded
+            total = self.stash.count_active(context.credentials).unwrap()
+            slice_ = _paginate_collection(
+                range(total), page_size=page_size, page_index=page_index
+            )
+
+        if slice_ is None:
+            datasets = self.stash.get_all_active(context.credentials).unwrap()
+        else:
+            datasets = self.stash.get_all_active(
+                context.credentials,
+                limit=slice_.stop - slice_.start,
+                offset=slice_.start,
+            ).unwrap()
 
         for dataset in datasets:
             if context.server is not None:
                 dataset.server_uid = context.server.id
 
-        return _paginate_dataset_collection(
-            datasets=datasets, page_size=page_size, page_index=page_index
+        results = DictTuple(datasets, lambda dataset: dataset.name)
+        return (
+            results
+            if slice_ is None
+            else DatasetPageView(datasets=results, total=total)
         )
 
     @service_method(path="dataset.search", name="search", roles=GUEST_ROLE_LEVEL)
@@ -133,13 +151,12 @@ class DatasetService(AbstractService):
         page_index: int | None = 0,
     ) -> DatasetPageView | DictTuple[str, Dataset]:
         """Search a Dataset by name"""
-        results = self.get_all(context)
-
-        filtered_results = [
-            dataset
-            for dataset_name, dataset in results.items()
-            if name in dataset_name and not dataset.to_be_deleted
-        ]
+        filtered_results = []
+        for dataset in self.stash.iter_all_active(context.credentials):
+            if name in dataset.name:
+                if context.server is not None:
+                    dataset.server_uid = context.server.id
+                filtered_results.append(dataset)
 
         return _paginate_dataset_collection(
             filtered_results, page_size=page_size, page_index=page_index
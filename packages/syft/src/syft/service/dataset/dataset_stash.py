@@ -1,3 +1,6 @@
+# stdlib
+from collections.abc import Iterator
+
 # relative
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
@@ -22,6 +25,19 @@ class DatasetStash(ObjectStash[Dataset]):
             filters={"action_ids__contains": uid},
         ).unwrap()
 
+    @as_result(StashException)
+    def count_active(
+        self, credentials: SyftVerifyKey, filters: dict | None = None
+    ) -> int:
+        filters = {**(filters or {}), "to_be_deleted": False}
+        return self.count(credentials=credentials, filters=filters).unwrap()
+
+    def iter_all_active(
+        self, credentials: SyftVerifyKey, filters: dict | None = None
+    ) -> Iterator[Dataset]:
+        filters = {**(filters or {}), "to_be_deleted": False}
+        return self.iter_all(credentials=credentials, filters=filters)
+
     @as_result(StashException)
     def get_all_active(
         self,
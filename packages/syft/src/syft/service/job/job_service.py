@@ -1,6 +1,8 @@
 # stdlib
 from collections.abc import Callable
 import inspect
+import os
+import threading
 import time
 
 # relative
@@ -23,9 +25,16 @@ from ..user.user_roles import ADMIN_ROLE_LEVEL
 from ..user.user_roles import DATA_OWNER_ROLE_LEVEL
 from ..user.user_roles import DATA_SCIENTIST_ROLE_LEVEL
 from ..user.user_roles import GUEST_ROLE_LEVEL
+from .job_stash import JOB_WAIT_TIMEOUT_SEC
 from .job_stash import Job
 from .job_stash import JobStash
 from .job_stash import JobStatus
+from .job_stash import job_events
+
+# Max number of job.wait calls blocking at the same time, each one holds an API
+# call worker thread. Further calls return the job right away and clients poll.
+JOB_WAIT_MAX_WAITERS = int(os.getenv("JOB_WAIT_MAX_WAITERS", 8))
+_job_wait_slots = threading.BoundedSemaphore(JOB_WAIT_MAX_WAITERS)
 
 
 def wait_until(predicate: Callable[[], bool], timeout: int = 10) -> SyftSuccess:
@@ -53,6 +62,31 @@ class JobService(AbstractService):
     def get(self, context: AuthedServiceContext, uid: UID) -> Job:
         return self.stash.get_by_uid(context.credentials, uid=uid).unwrap()
 
+    @service_method(
+        path="job.wait",
+        name="wait",
+        roles=GUEST_ROLE_LEVEL,
+    )
+    def wait(
+        self,
+        context: AuthedServiceContext,
+        uid: UID,
+        timeout: float = JOB_WAIT_TIMEOUT_SEC,
+    ) -> Job:
+        """Get a job once it is done, or after `timeout` seconds if it isn't.
+
+        Returns the job right away when JOB_WAIT_MAX_WAITERS calls are waiting.
+        """
+        if not _job_wait_slots.acquire(blocking=False):
+            return self.stash.get_by_uid(context.credentials, uid=uid).unwrap()
+        try:
+            timeout = min(timeout, JOB_WAIT_TIMEOUT_SEC)
+            return self.stash.wait_until_done(
+                context.credentials, uid, timeout
+            ).unwrap()
+        finally:
+            _job_wait_slots.release()
+
     @service_method(path="job.get_all", name="get_all", roles=DATA_SCIENTIST_ROLE_LEVEL)
     def get_all(self, context: AuthedServiceContext) -> list[Job]:
         return self.stash.get_all(context.credentials).unwrap()
@@ -142,6 +176,7 @@ class JobService(AbstractService):
     )
     def update(self, context: AuthedServiceContext, job: Job) -> SyftSuccess:
         res = self.stash.update(context.credentials, obj=job).unwrap()
+        job_events.notify(job.id)
         return SyftSuccess(message="Job updated!", value=res)
 
     def _kill(self, context: AuthedServiceContext, job: Job) -> SyftSuccess:
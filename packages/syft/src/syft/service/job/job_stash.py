@@ -1,10 +1,14 @@
 # stdlib
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
 from enum import Enum
 import random
 from string import Template
+import threading
+import time
 from time import sleep
 from typing import Any
 
@@ -55,6 +59,67 @@ class JobStatus(str, Enum):
     INTERRUPTED = "interrupted"
 
 
+# statuses of jobs that did not finish yet
+PENDING_JOB_STATUSES = (
+    JobStatus.CREATED,
+    JobStatus.PROCESSING,
+    JobStatus.TERMINATING,
+)
+
+# Max duration (in seconds) of a single wait for a job to finish, clients repeat
+# the wait until the job is done
+JOB_WAIT_TIMEOUT_SEC = 10
+
+# Interval (in seconds) at which waiting for a job re-reads it without a notification
+JOB_WAIT_POLL_INTERVAL_SEC = 1
+
+
+class JobEvents:
+    """Wakes up threads of this process that wait for a job to change.
+
+    Job writes in this process notify directly, job processes notify the
+    queue producer, which notifies here.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waiters: dict[UID | None, set[threading.Event]] = {}
+
+    @contextmanager
+    def watch(self, job_id: UID | None) -> Iterator[threading.Event]:
+        """Yields an event that is set when `job_id` changes.
+
+        Clear the event before reading the job, so a change made right after the
+        read still wakes the next wait.
+        """
+        event = threading.Event()
+        with self._lock:
+            self._waiters.setdefault(job_id, set()).add(event)
+        try:
+            yield event
+        finally:
+            with self._lock:
+                waiters = self._waiters[job_id]
+                waiters.discard(event)
+                if not waiters:
+                    del self._waiters[job_id]
+
+    def notify(self, job_id: UID | None = None) -> None:
+        """Wake the waiters of `job_id`, or all waiters if the job is not known."""
+        with self._lock:
+            if job_id is None:
+                events = [
+                    event for waiters in self._waiters.values() for event in waiters
+                ]
+            else:
+                events = list(self._waiters.get(job_id, ()))
+        for event in events:
+            event.set()
+
+
+job_events = JobEvents()
+
+
 def center_content(text: Any) -> str:
     if isinstance(text, str):
         text = text.replace("\n", "<br>")
@@ -109,6 +174,10 @@ class Job(SyncableSyftObject):
     # used by JobType.TWINAPIJOB
     endpoint: str | None = None
 
+    # output of the log read so far, `logs` only downloads what was written since
+    _stdout_cache: str = ""
+    _stderr_cache: str = ""
+
     __attr_searchable__ = [
         "parent_job_id",
         "job_worker_id",
@@ -273,6 +342,8 @@ class Job(SyncableSyftObject):
             blocking=True,
         )
         res = api.make_call(call)
+        self._stdout_cache = ""
+        self._stderr_cache = ""
         self.fetch()
         return res
 
@@ -289,9 +360,29 @@ class Job(SyncableSyftObject):
         self.fetch()
         return res
 
-    def fetch(self) -> None:
+    def fetch(self, timeout: float | None = None) -> None:
+        """Update the job from the server.
+
+        If `timeout` is given, waits up to `timeout` seconds for the job to finish.
+        """
         api = self.get_api()
-        job = api.job.get(self.id)
+        if timeout is None:
+            job = api.job.get(self.id)
+        else:
+            start = time.time()
+            if "job.wait" in api.endpoints:
+                job = api.job.wait(self.id, timeout=timeout)
+            else:
+                # servers from before the job.wait long poll
+                job = api.job.get(self.id)
+            remaining = timeout - (time.time() - start)
+            if (
+                not job.resolved
+                and job.status in PENDING_JOB_STATUSES
+                and remaining > 0
+            ):
+                # returned early, either polling or the server has too many waiters
+                sleep(min(remaining, JOB_WAIT_POLL_INTERVAL_SEC))
         self.resolved = job.resolved
         if job.resolved:
             self.result = job.result
@@ -324,21 +415,25 @@ class Job(SyncableSyftObject):
 
         results = []
         if stdout:
-            stdout_log = api.services.log.get_stdout(self.log_id)
+            stdout_log = self.read_stdout(offset=len(self._stdout_cache))
             if isinstance(stdout_log, SyftError):
                 results.append(f"Log {self.log_id} not available")
                 has_permissions = False
             else:
-                results.append(stdout_log)
+                self._stdout_cache += stdout_log
+                results.append(self._stdout_cache)
 
         if stderr:
             try:
-                stderr_log = api.services.log.get_stderr(self.log_id)
+                stderr_log = api.services.log.get_stderr(
+                    self.log_id, offset=len(self._stderr_cache)
+                )
                 if isinstance(stderr_log, SyftError):
                     results.append(f"Error log {self.log_id} not available")
                     has_permissions = False
                 else:
-                    results.append(stderr_log)
+                    self._stderr_cache += stderr_log
+                    results.append(self._stderr_cache)
             except Exception:
                 # no access
                 if isinstance(self.result, Err):
@@ -364,6 +459,11 @@ class Job(SyncableSyftObject):
             print(results_str)
             return None
 
+    def read_stdout(self, offset: int = 0) -> str:
+        """Read the stdout of the job from `offset` on, to follow a running job
+        without downloading the whole log every time."""
+        return self.get_api().services.log.get_stdout(self.log_id, offset=offset)
+
     # def __repr__(self) -> str:
     #     return f"<Job: {self.id}>: {self.status}"
 
@@ -575,9 +675,12 @@ class Job(SyncableSyftObject):
             )
 
         print_warning = True
-        counter = 0
+        start = time.time()
         while True:
-            self.fetch()
+            wait_timeout: float = JOB_WAIT_TIMEOUT_SEC
+            if timeout is not None:
+                wait_timeout = min(wait_timeout, max(timeout - (time.time() - start), 0))
+            self.fetch(timeout=wait_timeout)
             if self.resolved:
                 if isinstance(self.result, SyftError | Err) or self.status in [  # type: ignore[unreachable]
                     JobStatus.ERRORED,
@@ -599,12 +702,12 @@ class Job(SyncableSyftObject):
                     )
                     print_warning = False
 
-            sleep(1)
+            if self.status not in PENDING_JOB_STATUSES:
+                # finished, but the result is not set yet
+                sleep(1)
 
-            if timeout is not None:
-                counter += 1
-                if counter > timeout:
-                    raise SyftException(public_message="Reached Timeout!")
+            if timeout is not None and time.time() - start > timeout:
+                raise SyftException(public_message="Reached Timeout!")
 
         # if self.resolve returns self.result as error, then we
         # raise SyftException and not wait for the result
@@ -749,9 +852,34 @@ class JobStash(ObjectStash[Job]):
             and item.result.syft_blob_storage_entry_id is not None
         ):
             item.result._clear_cache()
-        return self.update(credentials, item, add_permissions).unwrap(
+        job = self.update(credentials, item, add_permissions).unwrap(
             public_message="Failed to update"
         )
+        job_events.notify(item.id)
+        return job
+
+    @as_result(StashException, NotFoundException)
+    def wait_until_done(
+        self, credentials: SyftVerifyKey, uid: UID, timeout: float
+    ) -> Job:
+        """Get a job once it is done, or after `timeout` seconds if it isn't.
+
+        Waits for job notifications, and re-reads the job every
+        JOB_WAIT_POLL_INTERVAL_SEC in case a notification is missed.
+        """
+        deadline = time.time() + timeout
+        with job_events.watch(uid) as changed:
+            while True:
+                changed.clear()
+                job = self.get_by_uid(credentials, uid).unwrap()
+                remaining = deadline - time.time()
+                if (
+                    job.resolved
+                    or job.status not in PENDING_JOB_STATUSES
+                    or remaining <= 0
+                ):
+                    return job
+                changed.wait(min(remaining, JOB_WAIT_POLL_INTERVAL_SEC))
 
     def get_active(self, credentials: SyftVerifyKey) -> list[Job]:
         return self.get_all(
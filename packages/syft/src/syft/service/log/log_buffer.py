@@ -0,0 +1,95 @@
+# stdlib
+import logging
+import threading
+
+# relative
+from ...types.uid import UID
+from ..context import AuthedServiceContext
+
+logger = logging.getLogger(__name__)
+
+# flush the buffered output of a job once it reaches this many characters
+LOG_BUFFER_MAX_SIZE = 64 * 1024
+# or when the oldest buffered output is this many seconds old
+LOG_BUFFER_FLUSH_INTERVAL_SEC = 1.0
+
+
+class JobLogBuffer:
+    """Buffers the output of a running job and appends it to its SyftLog in chunks.
+
+    Every flush is a single append of the buffered stdout and stderr, `close`
+    flushes what is left and compacts the chunks into the SyftLog.
+    """
+
+    def __init__(
+        self,
+        context: AuthedServiceContext,
+        log_id: UID,
+        max_size: int = LOG_BUFFER_MAX_SIZE,
+        flush_interval: float = LOG_BUFFER_FLUSH_INTERVAL_SEC,
+    ) -> None:
+        self.context = context
+        self.log_id = log_id
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self._stdout: list[str] = []
+        self._stderr: list[str] = []
+        self._size = 0
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    def write(self, stdout: str = "", stderr: str = "") -> None:
+        with self._lock:
+            if stdout:
+                self._stdout.append(stdout)
+            if stderr:
+                self._stderr.append(stderr)
+            self._size += len(stdout) + len(stderr)
+            if self._size >= self.max_size:
+                self._try_flush()
+            elif self._timer is None and self._size > 0:
+                # flush output that is not followed by more output in time
+                self._timer = threading.Timer(self.flush_interval, self._flush_later)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def _flush_later(self) -> None:
+        with self._lock:
+            self._try_flush()
+
+    def _try_flush(self) -> None:
+        # a failed flush keeps the output buffered, the next flush or close
+        # retries it instead of failing the job that is writing
+        try:
+            self._flush()
+        except Exception as e:
+            logger.error(f"Failed to flush the logs of {self.log_id}", exc_info=e)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._size == 0:
+            return
+        self.context.server.services.log.append(
+            context=self.context,
+            uid=self.log_id,
+            new_str="".join(self._stdout),
+            new_err="".join(self._stderr),
+        )
+        self._stdout.clear()
+        self._stderr.clear()
+        self._size = 0
+
+    def close(self) -> None:
+        try:
+            self.flush()
+            self.context.server.services.log.compact(
+                context=self.context, uid=self.log_id
+            )
+        except Exception as e:
+            logger.error(f"Failed to write the logs of {self.log_id}", exc_info=e)
@@ -12,6 +12,8 @@ from ..user.user_roles import ADMIN_ROLE_LEVEL
 from ..user.user_roles import DATA_SCIENTIST_ROLE_LEVEL
 from .log import SyftLog
 from .log_stash import LogStash
+from .log_stash import STDERR
+from .log_stash import STDOUT
 
 
 @serializable(canonical_name="LogService", version=1)
@@ -41,31 +43,38 @@ class LogService(AbstractService):
         new_str: str = "",
         new_err: str = "",
     ) -> SyftSuccess:
-        new_log = self.stash.get_by_uid(context.credentials, uid).unwrap()
-        if new_str:
-            new_log.append(new_str)
-
-        if new_err:
-            new_log.append_error(new_err)
-
-        self.stash.update(context.credentials, new_log).unwrap()
+        self.stash.append_chunks(
+            context.credentials, uid, stdout=new_str, stderr=new_err
+        ).unwrap()
         return SyftSuccess(message="Log Append successful!")
 
+    # jobs compact their own logs in-process, clients have no reason to
+    @service_method(path="log.compact", name="compact", roles=ADMIN_ROLE_LEVEL)
+    def compact(self, context: AuthedServiceContext, uid: UID) -> SyftSuccess:
+        self.stash.compact(context.credentials, uid).unwrap()
+        return SyftSuccess(message="Log Compact successful!")
+
     @service_method(path="log.get", name="get", roles=DATA_SCIENTIST_ROLE_LEVEL)
     def get(self, context: AuthedServiceContext, uid: UID) -> SyftLog:
-        return self.stash.get_by_uid(context.credentials, uid).unwrap()
+        return self.stash.get_with_chunks(context.credentials, uid).unwrap()
 
     @service_method(
         path="log.get_stdout", name="get_stdout", roles=DATA_SCIENTIST_ROLE_LEVEL
     )
-    def get_stdout(self, context: AuthedServiceContext, uid: UID) -> str:
-        result = self.get(context, uid)
-        return result.stdout
+    def get_stdout(
+        self, context: AuthedServiceContext, uid: UID, offset: int = 0
+    ) -> str:
+        return self.stash.get_stream(
+            context.credentials, uid, STDOUT, offset=offset
+        ).unwrap()
 
     @service_method(path="log.get_stderr", name="get_stderr", roles=ADMIN_ROLE_LEVEL)
-    def get_stderr(self, context: AuthedServiceContext, uid: UID) -> str:
-        result = self.get(context, uid)
-        return result.stderr
+    def get_stderr(
+        self, context: AuthedServiceContext, uid: UID, offset: int = 0
+    ) -> str:
+        return self.stash.get_stream(
+            context.credentials, uid, STDERR, offset=offset
+        ).unwrap()
 
     @service_method(path="log.restart", name="restart", roles=DATA_SCIENTIST_ROLE_LEVEL)
     def restart(
@@ -76,6 +85,7 @@ class LogService(AbstractService):
         log = self.stash.get_by_uid(context.credentials, uid).unwrap()
         log.restart()
         self.stash.update(context.credentials, log).unwrap()
+        self.stash.delete_chunks(uid)
         return SyftSuccess(message="Log Restart successful!")
 
     @service_method(path="log.get_all", name="get_all", roles=DATA_SCIENTIST_ROLE_LEVEL)
@@ -85,6 +95,7 @@ class LogService(AbstractService):
     @service_method(path="log.delete", name="delete", roles=DATA_SCIENTIST_ROLE_LEVEL)
     def delete(self, context: AuthedServiceContext, uid: UID) -> SyftSuccess:
         self.stash.delete_by_uid(context.credentials, uid).unwrap()
+        self.stash.delete_chunks(uid)
         return SyftSuccess(message=f"log {uid} succesfully deleted")
 
     @service_method(
@@ -1,9 +1,195 @@
+# third party
+import sqlalchemy as sa
+from sqlalchemy import Column
+from sqlalchemy import Table
+from sqlalchemy.orm import Session
+
 # relative
 from ...serde.serializable import serializable
+from ...server.credentials import SyftVerifyKey
+from ...store.db.db import DBManager
+from ...store.db.schema import UIDTypeDecorator
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import with_session
+from ...store.document_store_errors import NotFoundException
+from ...store.document_store_errors import StashException
+from ...types.result import as_result
+from ...types.uid import UID
+from ..action.action_permissions import ActionPermission
 from .log import SyftLog
 
+STDOUT = "stdout"
+STDERR = "stderr"
+
+
+def create_log_chunks_table(table: Table) -> Table:
+    """Create the append-only chunks table for the SyftLog table.
+
+    Appending to a log inserts a row here instead of rewriting the whole log,
+    `LogStash.compact` folds the rows back into the SyftLog row.
+    """
+    table_name = f"{table.name}_chunks"
+    if table_name not in table.metadata.tables:
+        Table(
+            table_name,
+            table.metadata,
+            Column("id", sa.Integer, primary_key=True, autoincrement=True),
+            Column(
+                "log_id",
+                UIDTypeDecorator,
+                sa.ForeignKey(table.c.id, ondelete="CASCADE"),
+                nullable=False,
+                index=True,
+            ),
+            Column("stream", sa.String, nullable=False),
+            Column("content", sa.Text, nullable=False),
+        )
+    return table.metadata.tables[table_name]
+
 
 @serializable(canonical_name="LogStash", version=1)
 class LogStash(ObjectStash[SyftLog]):
-    pass
+    def __init__(self, store: DBManager) -> None:
+        super().__init__(store)
+        self.chunks_table = create_log_chunks_table(self.table)
+
+    def _check_access(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        permission: ActionPermission,
+        session: Session,
+    ) -> None:
+        stmt = sa.select(self.table.c.id).where(self._get_field_filter("id", uid))
+        stmt = self._apply_permission_filter(
+            stmt, credentials=credentials, permission=permission, session=session
+        )
+        if session.execute(stmt).first() is None:
+            raise NotFoundException(
+                f"{self.object_type.__name__}: {uid} not found or no permission."
+            )
+
+    def _fold_chunks(self, log: SyftLog, session: Session) -> int | None:
+        """Append the stored chunks to `log`, returns the id of the last chunk."""
+        stmt = (
+            sa.select(
+                self.chunks_table.c.id,
+                self.chunks_table.c.stream,
+                self.chunks_table.c.content,
+            )
+            .where(self.chunks_table.c.log_id == log.id)
+            .order_by(self.chunks_table.c.id)
+        )
+        last_id = None
+        for last_id, stream, content in session.execute(stmt):
+            if stream == STDOUT:
+                log.append(content)
+            else:
+                log.append_error(content)
+        return last_id
+
+    @as_result(StashException, NotFoundException)
+    @with_session
+    def append_chunks(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        stdout: str = "",
+        stderr: str = "",
+        session: Session = None,
+    ) -> None:
+        """Append to a log without reading or rewriting what is already stored."""
+        rows = [
+            {"log_id": uid, "stream": stream, "content": content}
+            for stream, content in ((STDOUT, stdout), (STDERR, stderr))
+            if content
+        ]
+        if not rows:
+            return
+        self._check_access(credentials, uid, ActionPermission.WRITE, session)
+        session.execute(self.chunks_table.insert(), rows)
+
+    @as_result(StashException, NotFoundException)
+    @with_session
+    def get_with_chunks(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        session: Session = None,
+    ) -> SyftLog:
+        """Get a log with the chunks that have not been compacted yet appended to it."""
+        log = self.get_by_uid(credentials, uid, session=session).unwrap()
+        self._fold_chunks(log, session)
+        return log
+
+    @as_result(StashException, NotFoundException)
+    @with_session
+    def get_stream(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        stream: str,
+        offset: int = 0,
+        session: Session = None,
+    ) -> str:
+        """Get the output of a log from character `offset` on, reading only the
+        chunks that end past it."""
+        log = self.get_by_uid(credentials, uid, session=session).unwrap()
+        compacted = log.stdout if stream == STDOUT else log.stderr
+        chunk_offset = max(offset - len(compacted), 0)
+
+        chunks = self.chunks_table
+        chunk_end = (
+            sa.func.sum(sa.func.length(chunks.c.content))
+            .over(order_by=chunks.c.id)
+            .label("chunk_end")
+        )
+        ranked = (
+            sa.select(chunks.c.id, chunks.c.content, chunk_end)
+            .where(chunks.c.log_id == uid, chunks.c.stream == stream)
+            .subquery()
+        )
+        stmt = (
+            sa.select(ranked.c.content, ranked.c.chunk_end)
+            .where(ranked.c.chunk_end > chunk_offset)
+            .order_by(ranked.c.id)
+        )
+        rows = session.execute(stmt).all()
+        if not rows:
+            return compacted[offset:]
+
+        # the first chunk can start before the offset
+        first_content, first_end = rows[0]
+        skip = max(chunk_offset - (first_end - len(first_content)), 0)
+        content = "".join(row.content for row in rows)
+        return compacted[offset:] + content[skip:]
+
+    @as_result(StashException, NotFoundException)
+    @with_session
+    def compact(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        session: Session = None,
+    ) -> SyftLog:
+        """Fold the chunks of a log into the SyftLog row, in a single transaction."""
+        log = self.get_by_uid(credentials, uid, session=session).unwrap()
+        last_id = self._fold_chunks(log, session)
+        if last_id is None:
+            return log
+        self.update(credentials, log, session=session).unwrap()
+        # chunks appended while compacting stay for the next compaction
+        session.execute(
+            self.chunks_table.delete().where(
+                self.chunks_table.c.log_id == uid,
+                self.chunks_table.c.id <= last_id,
+            )
+        )
+        return log
+
+    @with_session
+    def delete_chunks(self, uid: UID, session: Session = None) -> None:
+        # SQLite does not enforce the ON DELETE CASCADE
+        session.execute(
+            self.chunks_table.delete().where(self.chunks_table.c.log_id == uid)
+        )
@@ -3,6 +3,7 @@
 # relative
 from ...serde.serializable import serializable
 from ...store.db.db import DBManager
+from ...store.document_store_errors import NotFoundException
 from ...store.document_store_errors import StashException
 from ...types.errors import SyftException
 from ...types.result import as_result
@@ -217,14 +218,27 @@ class NotificationService(AbstractService):
     def filter_by_obj(
         self, context: AuthedServiceContext, obj_uid: UID
     ) -> Notification:
-        notifications = self.stash.get_all(context.credentials).unwrap()
+        try:
+            return self.stash.get_one(
+                context.credentials, filters={"linked_obj.object_uid": obj_uid}
+            ).unwrap()
+        except NotFoundException:
+            raise SyftException(public_message="Could not get notifications!!")
+
+    @as_result(SyftException)
+    def get_by_obj_uids(
+        self, context: AuthedServiceContext, obj_uids: list[UID]
+    ) -> dict[UID, Notification]:
+        """Get the first notification linked to each object, with a single query."""
+        notifications = self.stash.get_all(
+            context.credentials, filters={"linked_obj.object_uid__in": obj_uids}
+        ).unwrap()
+        result: dict[UID, Notification] = {}
         for notification in notifications:
-            if (
-                notification.linked_obj
-                and notification.linked_obj.object_uid == obj_uid
-            ):
-                return notification
-        raise SyftException(public_message="Could not get notifications!!")
+            obj_uid = notification.linked_obj.object_uid
+            if obj_uid not in result:
+                result[obj_uid] = notification
+        return result
 
 
 TYPE_TO_SERVICE[Notification] = NotificationService
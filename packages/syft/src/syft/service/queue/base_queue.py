@@ -12,6 +12,7 @@ from ..worker.worker_stash import WorkerStash
 
 if TYPE_CHECKING:
     # relative
+    from ..worker.worker_pool import SyftWorker
     from .queue_stash import QueueStash
 
 
@@ -64,6 +65,12 @@ class QueueProducer:
     ) -> None:
         raise NotImplementedError
 
+    def notify(self) -> None:
+        raise NotImplementedError
+
+    def update_syft_worker(self, syft_worker: "SyftWorker") -> None:
+        raise NotImplementedError
+
     def close(self) -> None:
         raise NotImplementedError
 
@@ -118,6 +125,9 @@ class BaseQueueManager:
     def send(self, message: bytes, queue_name: str) -> SyftSuccess:
         raise NotImplementedError
 
+    def notify(self, queue_name: str, job_id: UID | None = None) -> None:
+        raise NotImplementedError
+
     @property
     def publisher(self) -> QueueProducer:
         raise NotImplementedError
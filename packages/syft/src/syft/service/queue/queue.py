@@ -1,7 +1,14 @@
 # stdlib
+import atexit
+from collections.abc import Callable
+from concurrent.futures import Future
 from enum import Enum
 import logging
+import multiprocessing
 from multiprocessing import Process
+from multiprocessing.connection import Connection
+import os
+import queue
 import threading
 from threading import Thread
 import time
@@ -15,6 +22,7 @@ import psutil
 # relative
 from ...serde.deserialize import _deserialize as deserialize
 from ...serde.serializable import serializable
+from ...serde.serialize import _serialize as serialize
 from ...server.credentials import SyftVerifyKey
 from ...server.worker_settings import WorkerSettings
 from ...service.context import AuthedServiceContext
@@ -50,9 +58,17 @@ logger = logging.getLogger(__name__)
 class ConsumerType(str, Enum):
     Thread = "thread"
     Process = "process"
+    ProcessPool = "process_pool"
     Synchronous = "synchronous"
 
 
+# Number of warm job processes kept by a ConsumerType.ProcessPool consumer
+JOB_PROCESS_POOL_SIZE = int(os.getenv("JOB_PROCESS_POOL_SIZE", os.cpu_count() or 1))
+
+# Number of jobs after which a job process is replaced, to contain leaks
+JOB_PROCESS_MAX_JOBS = int(os.getenv("JOB_PROCESS_MAX_JOBS", 100))
+
+
 class MonitorThread(threading.Thread):
     def __init__(
         self,
@@ -110,7 +126,11 @@ class QueueManager(BaseQueueManager):
         self._client = self.config.client_type(self.client_config)
 
     def close(self) -> SyftSuccess:
-        return self._client.close()
+        result = self._client.close()
+        if getattr(self.config, "consumer_type", None) == ConsumerType.ProcessPool:
+            # the consumers are stopped, nothing is sent to the job processes anymore
+            close_job_process_pool()
+        return result
 
     def create_consumer(
         self,
@@ -154,6 +174,11 @@ class QueueManager(BaseQueueManager):
             queue_name=queue_name,
         )
 
+    def notify(self, queue_name: str, job_id: UID | None = None) -> None:
+        """Notify the producer of `queue_name` that queue items are ready, and
+        that job `job_id` changed."""
+        self._client.notify_producer(queue_name=queue_name, job_id=job_id)
+
     @property
     def producers(self) -> Any:
         return self._client.producers
@@ -163,38 +188,86 @@ class QueueManager(BaseQueueManager):
         return self._client.consumers
 
 
-def handle_message_multiprocessing(
-    worker_settings: WorkerSettings,
-    queue_item: QueueItem,
-    credentials: SyftVerifyKey,
-) -> None:
-    # this is a temp hack to prevent some multithreading issues
-    time.sleep(0.5)
+# servers handling queue items in this process, by process id and worker settings.
+# Consumer threads of a process share a server, the same way the request handlers
+# of the web server share theirs: stashes open a session per call and per-job
+# state lives in the AuthedServiceContext of each job.
+_worker_servers: dict[tuple[int, str], Future] = {}
+_worker_servers_lock = threading.Lock()
+
+
+def _reset_worker_servers() -> None:
+    # a forked child inherits the lock in whatever state a parent thread left it,
+    # and futures of servers that are built by parent threads never complete
+    global _worker_servers, _worker_servers_lock
+    _worker_servers = {}
+    _worker_servers_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_worker_servers)
+
+
+def get_worker_server(worker_settings: WorkerSettings) -> Any:
+    """Get the server that handles queue items for `worker_settings`.
+
+    The server is created on first use and reused for later queue items in the same
+    process, forked processes create their own. Building it does not hold the lock,
+    threads asking for the same server wait for the first one to build it.
+    """
     queue_config = worker_settings.queue_config
     if queue_config is None:
         raise ValueError(f"{worker_settings} has no queue configurations!")
     queue_config.client_config.create_producer = False
     queue_config.client_config.n_consumers = 0
 
-    # relative
-    from ...server.server import Server
-
-    worker = Server(
-        id=worker_settings.id,
-        name=worker_settings.name,
-        signing_key=worker_settings.signing_key,
-        db_config=worker_settings.db_config,
-        blob_storage_config=worker_settings.blob_store_config,
-        server_side_type=worker_settings.server_side_type,
-        queue_config=queue_config,
-        is_subprocess=True,
-        migrate=False,
-        deployment_type=worker_settings.deployment_type,
-    )
+    key = (os.getpid(), worker_settings.hash())
+    with _worker_servers_lock:
+        future = _worker_servers.get(key)
+        build = future is None
+        if build:
+            future = Future()
+            _worker_servers[key] = future
+
+    if not build:
+        return future.result()
+
+    try:
+        # relative
+        from ...server.server import Server
 
-    # otherwise it reads it from env, resulting in the wrong credentials
-    worker.id = worker_settings.id
-    worker.signing_key = worker_settings.signing_key
+        worker = Server(
+            id=worker_settings.id,
+            name=worker_settings.name,
+            signing_key=worker_settings.signing_key,
+            db_config=worker_settings.db_config,
+            blob_storage_config=worker_settings.blob_store_config,
+            server_side_type=worker_settings.server_side_type,
+            queue_config=queue_config,
+            is_subprocess=True,
+            migrate=False,
+            deployment_type=worker_settings.deployment_type,
+        )
+
+        # otherwise it reads it from env, resulting in the wrong credentials
+        worker.id = worker_settings.id
+        worker.signing_key = worker_settings.signing_key
+    except BaseException as e:
+        # let the next queue item try again
+        with _worker_servers_lock:
+            _worker_servers.pop(key, None)
+        future.set_exception(e)
+        raise
+
+    future.set_result(worker)
+    return worker
+
+
+def handle_message_multiprocessing(
+    worker_settings: WorkerSettings,
+    queue_item: QueueItem,
+    credentials: SyftVerifyKey,
+) -> None:
+    worker = get_worker_server(worker_settings)
 
     # Set monitor thread for this job.
     monitor_thread = MonitorThread(queue_item, worker, credentials)
@@ -275,20 +348,188 @@ def handle_message_multiprocessing(
     worker.job_stash.set_result(credentials, job_item).unwrap(
         public_message="Failed to set job after running"
     )
+    # queue items waiting on the result of this one can be dispatched now, and
+    # clients waiting for the job can get its result
+    worker.queue_manager.notify(APICallMessageHandler.queue_name, job_item.id)
 
     # Finish monitor thread
     monitor_thread.stop()
 
 
+def _job_process_main(conn: Connection, handler: Callable[..., None]) -> None:
+    """Run the queue items sent by a JobProcessPool, until the pool closes the pipe."""
+    while True:
+        try:
+            message = conn.recv_bytes()
+        except (EOFError, OSError):
+            return
+
+        worker_settings, queue_item, credentials = deserialize(
+            message, from_bytes=True
+        )
+        try:
+            handler(worker_settings, queue_item, credentials)
+        except Exception:
+            logger.exception(f"Job process failed to handle {queue_item}")
+        conn.send_bytes(b"")
+
+
+class JobProcess:
+    def __init__(self, mp_context: Any, handler: Callable[..., None]) -> None:
+        self.conn, child_conn = mp_context.Pipe()
+        self.process = mp_context.Process(
+            target=_job_process_main, args=(child_conn, handler)
+        )
+        self.process.start()
+        child_conn.close()
+        self.n_jobs = 0
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def close(self) -> None:
+        # the process exits once its pipe is closed
+        self.conn.close()
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.terminate()
+
+
+class JobProcessPool:
+    """A pool of warm processes that run queue items one at a time.
+
+    Processes are started from a forkserver with syft imported, and keep their
+    worker server between jobs. A process that was killed, e.g. by terminating its
+    job, or that ran `max_jobs_per_process` jobs is replaced by a new one.
+    """
+
+    def __init__(
+        self,
+        size: int = JOB_PROCESS_POOL_SIZE,
+        max_jobs_per_process: int = JOB_PROCESS_MAX_JOBS,
+        mp_context: Any = None,
+        handler: Callable[..., None] = handle_message_multiprocessing,
+    ) -> None:
+        if mp_context is not None:
+            self.mp_context = mp_context
+        elif "forkserver" in multiprocessing.get_all_start_methods():
+            self.mp_context = multiprocessing.get_context("forkserver")
+            self.mp_context.set_forkserver_preload(["syft"])
+        else:
+            self.mp_context = multiprocessing.get_context("spawn")
+        self.max_jobs_per_process = max_jobs_per_process
+        self.handler = handler
+        self.idle: queue.Queue[JobProcess] = queue.Queue()
+        # idle and busy processes, so closing the pool stops all of them
+        self.processes: set[JobProcess] = set()
+        self.closed = False
+        self._lock = threading.Lock()
+        for _ in range(size):
+            self.idle.put(self._new_process())
+
+    def _new_process(self) -> JobProcess:
+        process = JobProcess(self.mp_context, self.handler)
+        with self._lock:
+            self.processes.add(process)
+        return process
+
+    def _close_process(self, process: JobProcess) -> None:
+        with self._lock:
+            self.processes.discard(process)
+        process.close()
+
+    def acquire(self) -> JobProcess:
+        """Wait for an idle job process."""
+        process = self.idle.get()
+        if not process.process.is_alive():
+            self._close_process(process)
+            process = self._new_process()
+        return process
+
+    def submit(
+        self,
+        process: JobProcess,
+        worker_settings: WorkerSettings,
+        queue_item: QueueItem,
+        credentials: SyftVerifyKey,
+    ) -> None:
+        """Run a queue item on an acquired job process, without waiting for it to finish."""
+        message = serialize((worker_settings, queue_item, credentials), to_bytes=True)
+        process.conn.send_bytes(message)
+        process.n_jobs += 1
+        Thread(target=self._release, args=(process,), daemon=True).start()
+
+    def _release(self, process: JobProcess) -> None:
+        try:
+            process.conn.recv_bytes()
+            reuse = process.n_jobs < self.max_jobs_per_process
+        except (EOFError, OSError):
+            # the job process was killed, or the pool closed its pipe
+            reuse = False
+
+        if self.closed:
+            self._close_process(process)
+            return
+        if not reuse:
+            self._close_process(process)
+            process = self._new_process()
+        self.idle.put(process)
+
+    def close(self) -> None:
+        """Stop the job processes, running jobs are terminated."""
+        self.closed = True
+        with self._lock:
+            processes = list(self.processes)
+        for process in processes:
+            self._close_process(process)
+        while True:
+            try:
+                self.idle.get_nowait()
+            except queue.Empty:
+                return
+
+
+_job_process_pool: JobProcessPool | None = None
+_job_process_pool_lock = threading.Lock()
+
+
+def get_job_process_pool() -> JobProcessPool:
+    global _job_process_pool
+    with _job_process_pool_lock:
+        if _job_process_pool is None:
+            _job_process_pool = JobProcessPool()
+        return _job_process_pool
+
+
+def close_job_process_pool() -> None:
+    """Stop the job processes of this process, the next job starts a new pool."""
+    global _job_process_pool
+    with _job_process_pool_lock:
+        pool, _job_process_pool = _job_process_pool, None
+    if pool is not None:
+        pool.close()
+
+
+def _reset_job_process_pool() -> None:
+    # the job processes of the parent are not children of a forked process
+    global _job_process_pool, _job_process_pool_lock
+    _job_process_pool = None
+    _job_process_pool_lock = threading.Lock()
+
+
+# the job processes are not daemons and wait on their pipe, without closing them
+# multiprocessing would wait for them forever at interpreter exit
+atexit.register(close_job_process_pool)
+os.register_at_fork(after_in_child=_reset_job_process_pool)
+
+
 @serializable(canonical_name="APICallMessageHandler", version=1)
 class APICallMessageHandler(AbstractMessageHandler):
     queue_name = "api_call"
 
     @staticmethod
     def handle_message(message: bytes, syft_worker_id: UID) -> None:
-        # relative
-        from ...server.server import Server
-
         queue_item = deserialize(message, from_bytes=True)
         queue_item = cast(QueueItem, queue_item)
         worker_settings = queue_item.worker_settings
@@ -296,24 +537,7 @@ class APICallMessageHandler(AbstractMessageHandler):
             raise ValueError("Worker settings are missing in the queue item.")
 
         queue_config = worker_settings.queue_config
-        queue_config.client_config.create_producer = False
-        queue_config.client_config.n_consumers = 0
-
-        worker = Server(
-            id=worker_settings.id,
-            name=worker_settings.name,
-            signing_key=worker_settings.signing_key,
-            db_config=worker_settings.db_config,
-            server_side_type=worker_settings.server_side_type,
-            deployment_type=worker_settings.deployment_type,
-            queue_config=queue_config,
-            is_subprocess=True,
-            migrate=False,
-        )
-
-        # otherwise it reads it from env, resulting in the wrong credentials
-        worker.id = worker_settings.id
-        worker.signing_key = worker_settings.signing_key
+        worker = get_worker_server(worker_settings)
 
         credentials = queue_item.syft_client_verify_key
         try:
@@ -361,5 +585,13 @@ class APICallMessageHandler(AbstractMessageHandler):
             job_item.job_pid = process.pid
             worker.job_stash.set_result(credentials, job_item).unwrap()
             process.join()
+        elif queue_config.consumer_type == ConsumerType.ProcessPool:
+            # returns once the job is started, so the consumer can take the next
+            # queue item while the pool has idle processes
+            pool = get_job_process_pool()
+            process = pool.acquire()
+            job_item.job_pid = process.pid
+            worker.job_stash.set_result(credentials, job_item).unwrap()
+            pool.submit(process, worker_settings, queue_item, credentials)
         elif queue_config.consumer_type == ConsumerType.Synchronous:
             handle_message_multiprocessing(worker_settings, queue_item, credentials)
@@ -3,6 +3,9 @@ from collections import defaultdict
 import logging
 import socketserver
 
+# third party
+import zmq
+
 # relative
 from ...serde.serializable import serializable
 from ...service.context import AuthedServiceContext
@@ -19,6 +22,9 @@ from .base_queue import QueueClientConfig
 from .base_queue import QueueConfig
 from .queue import ConsumerType
 from .queue_stash import QueueStash
+from .zmq_common import ZMQCommand
+from .zmq_common import ZMQHeader
+from .zmq_common import ZMQ_NOTIFY_LINGER_MSEC
 from .zmq_consumer import ZMQConsumer
 from .zmq_producer import ZMQProducer
 
@@ -145,6 +151,38 @@ class ZMQClient(QueueClient):
             message=f"Successfully queued message to : {queue_name}",
         )
 
+    def notify_producer(self, queue_name: str, job_id: UID | None = None) -> None:
+        """Notify the producer of a queue that queue items are ready to be dispatched.
+
+        The producer is notified in-process if it runs in this client, otherwise
+        a notification is sent to the producer address. `job_id` is the job that
+        changed, the producer wakes the threads waiting for it.
+        """
+        producer = self.producers.get(queue_name)
+        if producer is not None:
+            producer.notify()
+            return None
+
+        if self.config.queue_port is None:
+            # no producer to notify, it will pick up the items on its next sweep
+            return None
+
+        address = get_queue_address(self.config.queue_port)
+        socket = zmq.Context.instance().socket(zmq.DEALER)
+        try:
+            socket.setsockopt(zmq.LINGER, ZMQ_NOTIFY_LINGER_MSEC)
+            socket.connect(address)
+            # ZMQProducer recv frames: [address, empty, header, command, job_id]
+            frames = [b"", ZMQHeader.W_WORKER, ZMQCommand.W_NOTIFY]
+            if job_id is not None:
+                frames.append(job_id.value.bytes)
+            socket.send_multipart(frames, zmq.NOBLOCK)
+        except zmq.ZMQError:
+            logger.exception(f"Failed to notify producer at {address}")
+        finally:
+            socket.close()
+        return None
+
     def close(self) -> SyftSuccess:
         try:
             for consumers in self.consumers.values():
@@ -1,4 +1,7 @@
 # stdlib
+from collections import OrderedDict
+from collections import deque
+from collections.abc import Hashable
 import threading
 import time
 from typing import Any
@@ -24,12 +27,23 @@ THREAD_TIMEOUT_SEC = 5
 # Max duration (in ms) to wait for ZMQ poller to return
 ZMQ_POLLER_TIMEOUT_MSEC = 1000
 
+# Interval (in seconds) of the producer sweep over the queue stash. New queue items
+# are picked up on notification, the sweep only catches missed notifications.
+QUEUE_RECONCILE_INTERVAL_SEC = 10
+
+# Duration (in ms) a notification is kept around to be delivered to the producer
+ZMQ_NOTIFY_LINGER_MSEC = 500
+
 # Duration (in seconds) after which a worker without a heartbeat will be marked as expired
 WORKER_TIMEOUT_SEC = 60
 
 # Duration (in seconds) after which producer without a heartbeat will be marked as expired
 PRODUCER_TIMEOUT_SEC = 60
 
+# Interval (in seconds) at which the producer reloads the state of its workers
+# from the worker stash
+WORKER_REFRESH_INTERVAL_SEC = 30
+
 # Lock for working on ZMQ socket
 ZMQ_SOCKET_LOCK = threading.Lock()
 
@@ -50,6 +64,7 @@ class ZMQCommand:
     W_REPLY = b"0x03"
     W_HEARTBEAT = b"0x04"
     W_DISCONNECT = b"0x05"
+    W_NOTIFY = b"0x06"
 
 
 class Timeout:
@@ -74,11 +89,55 @@ class Timeout:
         return time.time()
 
 
+class RequestQueue:
+    """Pending requests of a service, with a fair share for every submitter.
+
+    Requests are served round robin over the submitters, and first in first out
+    for a single submitter, so a large batch of one user doesn't starve the others.
+    """
+
+    def __init__(self) -> None:
+        self._requests: dict[Hashable, deque[bytes]] = {}
+        self._submitters: deque[Hashable] = deque()
+        self._size = 0
+        # requests are added by the producer queue thread and
+        # taken by the message sending thread
+        self._lock = threading.Lock()
+
+    def append(self, request: bytes, submitter: Hashable = None) -> None:
+        with self._lock:
+            requests = self._requests.get(submitter)
+            if requests is None:
+                requests = self._requests[submitter] = deque()
+                self._submitters.append(submitter)
+            requests.append(request)
+            self._size += 1
+
+    def popleft(self) -> bytes:
+        with self._lock:
+            if not self._size:
+                raise IndexError("pop from an empty RequestQueue")
+            submitter = self._submitters.popleft()
+            requests = self._requests[submitter]
+            request = requests.popleft()
+            if requests:
+                # next request of this submitter is served after the others
+                self._submitters.append(submitter)
+            else:
+                del self._requests[submitter]
+            self._size -= 1
+            return request
+
+    def __len__(self) -> int:
+        return self._size
+
+
 class Service:
     def __init__(self, name: str) -> None:
         self.name = name
-        self.requests: list[bytes] = []
-        self.waiting: list[Worker] = []  # List of waiting workers
+        self.requests = RequestQueue()
+        # waiting workers by identity, longest waiting first
+        self.waiting: OrderedDict[bytes, Worker] = OrderedDict()
 
 
 class Worker(SyftBaseModel):
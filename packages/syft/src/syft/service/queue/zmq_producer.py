@@ -1,11 +1,10 @@
 # stdlib
 from binascii import hexlify
-import itertools
+from collections import OrderedDict
 import logging
 import sys
 import threading
 from threading import Event
-from time import sleep
 from typing import Any
 
 # third party
@@ -21,17 +20,21 @@ from ...types.errors import SyftException
 from ...types.result import as_result
 from ...types.uid import UID
 from ...util.util import get_queue_address
+from ..job.job_stash import job_events
 from ..service import AbstractService
 from ..worker.worker_pool import ConsumerState
+from ..worker.worker_pool import SyftWorker
 from ..worker.worker_stash import WorkerStash
 from .base_queue import QueueProducer
 from .queue_stash import ActionQueueItem
 from .queue_stash import QueueStash
 from .queue_stash import Status
 from .zmq_common import HEARTBEAT_INTERVAL_SEC
+from .zmq_common import QUEUE_RECONCILE_INTERVAL_SEC
 from .zmq_common import Service
 from .zmq_common import THREAD_TIMEOUT_SEC
 from .zmq_common import Timeout
+from .zmq_common import WORKER_REFRESH_INTERVAL_SEC
 from .zmq_common import Worker
 from .zmq_common import ZMQCommand
 from .zmq_common import ZMQHeader
@@ -60,6 +63,8 @@ class ZMQProducer(QueueProducer):
         self.queue_name = queue_name
         self.auth_context = context
         self._stop = Event()
+        # set when new queue items may be ready to dispatch
+        self._items_available = Event()
         self.post_init()
 
     @property
@@ -71,20 +76,35 @@ class ZMQProducer(QueueProducer):
 
         self.services: dict[str, Service] = {}
         self.workers: dict[bytes, Worker] = {}
-        self.waiting: list[Worker] = []
+        # waiting workers by identity, longest waiting first
+        self.waiting: OrderedDict[bytes, Worker] = OrderedDict()
+        # SyftWorker of each connected worker by syft_worker_id,
+        # None if the worker is not in the worker stash
+        self.syft_workers: dict[UID, SyftWorker | None] = {}
+        self.syft_workers_refresh_t = Timeout(WORKER_REFRESH_INTERVAL_SEC)
         self.heartbeat_t = Timeout(HEARTBEAT_INTERVAL_SEC)
         self.context = zmq.Context(1)
         self.socket = self.context.socket(zmq.ROUTER)
         self.socket.setsockopt(LINGER, 1)
         self.socket.setsockopt_string(zmq.IDENTITY, self.id)
+        # wakes up the message sending thread when read_items queued requests
+        wakeup_address = f"inproc://zmq-producer-wakeup-{self.id}"
+        self.wakeup_receiver = self.context.socket(zmq.PULL)
+        self.wakeup_receiver.bind(wakeup_address)
+        self.wakeup_sender = self.context.socket(zmq.PUSH)
+        self.wakeup_sender.connect(wakeup_address)
         self.poll_workers = zmq.Poller()
         self.poll_workers.register(self.socket, zmq.POLLIN)
+        self.poll_workers.register(self.wakeup_receiver, zmq.POLLIN)
         self.bind(f"tcp://*:{self.port}")
+        # sweep the queue stash once on startup
+        self._items_available.set()
         self.thread: threading.Thread | None = None
         self.producer_thread: threading.Thread | None = None
 
     def close(self) -> None:
         self._stop.set()
+        self._items_available.set()
         try:
             if self.thread:
                 self.thread.join(THREAD_TIMEOUT_SEC)
@@ -105,10 +125,13 @@ class ZMQProducer(QueueProducer):
                 self.producer_thread = None
 
             self.poll_workers.unregister(self.socket)
+            self.poll_workers.unregister(self.wakeup_receiver)
         except Exception as e:
             logger.exception("Failed to unregister poller.", exc_info=e)
         finally:
             self.socket.close()
+            self.wakeup_sender.close()
+            self.wakeup_receiver.close()
             self.context.destroy()
 
     @property
@@ -150,13 +173,19 @@ class ZMQProducer(QueueProducer):
                     return True
         return value
 
+    def notify(self) -> None:
+        """Signal that queue items were added or unblocked, and should be dispatched."""
+        self._items_available.set()
+
     def read_items(self) -> None:
         while True:
+            # wait for a notification, or sweep the stash every
+            # QUEUE_RECONCILE_INTERVAL_SEC to catch missed ones
+            self._items_available.wait(QUEUE_RECONCILE_INTERVAL_SEC)
+            self._items_available.clear()
             if self._stop.is_set():
                 break
             try:
-                sleep(1)
-
                 # Items to be queued
                 items_to_queue = self.queue_stash.get_by_status(
                     self.queue_stash.root_verify_key,
@@ -165,57 +194,55 @@ class ZMQProducer(QueueProducer):
 
                 items_to_queue = [] if items_to_queue is None else items_to_queue
 
-                # Queue Items that are in the processing state
-                items_processing = self.queue_stash.get_by_status(
-                    self.queue_stash.root_verify_key,
-                    status=Status.PROCESSING,
-                ).unwrap()
-
-                items_processing = [] if items_processing is None else items_processing
+                # TODO: Evaluate the retry condition for items in the PROCESSING state.
+                # If job running and timeout or job status is KILL
+                # or heartbeat fails
+                # or container id doesn't exists, kill process or container
+                # else decrease retry count and mark status as CREATED.
 
-                for item in itertools.chain(items_to_queue, items_processing):
+                queued = False
+                for item in items_to_queue:
                     # TODO: if resolving fails, set queueitem to errored, and jobitem as well
-                    if item.status == Status.CREATED:
-                        if isinstance(item, ActionQueueItem):
-                            action = item.kwargs["action"]
-                            if (
-                                self.contains_unresolved_action_objects(
-                                    action.args
-                                ).unwrap()
-                                or self.contains_unresolved_action_objects(
-                                    action.kwargs
-                                ).unwrap()
-                            ):
-                                continue
-
-                        msg_bytes = serialize(item, to_bytes=True)
-                        worker_pool = item.worker_pool.resolve_with_context(
-                            self.auth_context
-                        ).unwrap()
-                        service_name = worker_pool.name
-                        service: Service | None = self.services.get(service_name)
-
-                        # Skip adding message if corresponding service/pool
-                        # is not registered.
-                        if service is None:
+                    if isinstance(item, ActionQueueItem):
+                        action = item.kwargs["action"]
+                        if (
+                            self.contains_unresolved_action_objects(
+                                action.args
+                            ).unwrap()
+                            or self.contains_unresolved_action_objects(
+                                action.kwargs
+                            ).unwrap()
+                        ):
                             continue
 
-                        # append request message to the corresponding service
-                        # This list is processed in dispatch method.
-
-                        # TODO: Logic to evaluate the CAN RUN Condition
-                        item.status = Status.PROCESSING
-                        self.queue_stash.update(
-                            item.syft_client_verify_key, item
-                        ).unwrap(public_message=f"failed to update queue item {item}")
-                        service.requests.append(msg_bytes)
-                    elif item.status == Status.PROCESSING:
-                        # Evaluate Retry condition here
-                        # If job running and timeout or job status is KILL
-                        # or heartbeat fails
-                        # or container id doesn't exists, kill process or container
-                        # else decrease retry count and mark status as CREATED.
-                        pass
+                    msg_bytes = serialize(item, to_bytes=True)
+                    worker_pool = item.worker_pool.resolve_with_context(
+                        self.auth_context
+                    ).unwrap()
+                    service_name = worker_pool.name
+                    service: Service | None = self.services.get(service_name)
+
+                    # Skip adding message if corresponding service/pool
+                    # is not registered.
+                    if service is None:
+                        continue
+
+                    # append request message to the corresponding service
+                    # This list is processed in dispatch method.
+
+                    # TODO: Logic to evaluate the CAN RUN Condition
+                    item.status = Status.PROCESSING
+                    self.queue_stash.update(
+                        item.syft_client_verify_key, item
+                    ).unwrap(public_message=f"failed to update queue item {item}")
+                    service.requests.append(
+                        msg_bytes, submitter=item.syft_client_verify_key
+                    )
+                    queued = True
+
+                if queued:
+                    # dispatch right away instead of after the next poll timeout
+                    self.wakeup_sender.send(b"")
             except Exception as e:
                 # stdlib
                 import traceback
@@ -243,19 +270,51 @@ class ZMQProducer(QueueProducer):
     def send_heartbeats(self) -> None:
         """Send heartbeats to idle workers if it's time"""
         if self.heartbeat_t.has_expired():
-            for worker in self.waiting:
+            for worker in self.waiting.values():
                 self.send_to_worker(worker, ZMQCommand.W_HEARTBEAT)
             self.heartbeat_t.reset()
 
+    def get_syft_worker(self, worker: Worker) -> SyftWorker | None:
+        """Get the cached SyftWorker of a worker, loading it from the stash on first use."""
+        if worker.syft_worker_id not in self.syft_workers:
+            res = worker._syft_worker(self.worker_stash, self.auth_context.credentials)
+            self.syft_workers[worker.syft_worker_id] = res.ok() if res.is_ok() else None
+        return self.syft_workers[worker.syft_worker_id]
+
+    def update_syft_worker(self, syft_worker: SyftWorker) -> None:
+        """Update the cached state of a connected worker, e.g. when it is marked for deletion."""
+        if syft_worker.id in self.syft_workers:
+            self.syft_workers[syft_worker.id] = syft_worker
+
+    def refresh_syft_workers(self) -> None:
+        """Reload the cached SyftWorkers from the stash if it's time"""
+        if not self.syft_workers_refresh_t.has_expired():
+            return
+        self.syft_workers_refresh_t.reset()
+
+        res = self.worker_stash.get_all(self.auth_context.credentials)
+        if res.is_err():
+            logger.error(f"Failed to refresh SyftWorkers: {res.err()}")
+            return
+
+        stored = {syft_worker.id: syft_worker for syft_worker in res.ok()}
+        self.syft_workers = {
+            worker.syft_worker_id: stored.get(worker.syft_worker_id)
+            for worker in self.workers.values()
+            if worker.syft_worker_id is not None
+        }
+
     def purge_workers(self) -> None:
         """Look for & kill expired workers.
 
         Workers are oldest to most recent, so we stop at the first alive worker.
         """
+        self.refresh_syft_workers()
+
         # work on a copy of the iterator
-        for worker in self.waiting:
-            res = worker._syft_worker(self.worker_stash, self.auth_context.credentials)
-            if res.is_err() or (syft_worker := res.ok()) is None:
+        for worker in list(self.waiting.values()):
+            syft_worker = self.get_syft_worker(worker)
+            if syft_worker is None:
                 logger.info(f"Failed to retrieve SyftWorker {worker.syft_worker_id}")
                 continue
 
@@ -300,10 +359,9 @@ class ZMQProducer(QueueProducer):
     def worker_waiting(self, worker: Worker) -> None:
         """This worker is now waiting for work."""
         # Queue to broker and service waiting lists
-        if worker not in self.waiting:
-            self.waiting.append(worker)
-        if worker.service is not None and worker not in worker.service.waiting:
-            worker.service.waiting.append(worker)
+        self.waiting.setdefault(worker.identity, worker)
+        if worker.service is not None:
+            worker.service.waiting.setdefault(worker.identity, worker)
         worker.reset_expiry()
         self.update_consumer_state_for_worker(worker.syft_worker_id, ConsumerState.IDLE)
         self.dispatch(worker.service, None)
@@ -316,9 +374,9 @@ class ZMQProducer(QueueProducer):
         self.purge_workers()
         while service.waiting and service.requests:
             # One worker consuming only one message at a time.
-            msg = service.requests.pop(0)
-            worker = service.waiting.pop(0)
-            self.waiting.remove(worker)
+            msg = service.requests.popleft()
+            _, worker = service.waiting.popitem(last=False)
+            self.waiting.pop(worker.identity, None)
             self.send_to_worker(worker, ZMQCommand.W_REQUEST, msg)
 
     def send_to_worker(
@@ -365,14 +423,19 @@ class ZMQProducer(QueueProducer):
                 for service in self.services.values():
                     self.dispatch(service, None)
 
-                items = None
+                items = {}
 
                 try:
-                    items = self.poll_workers.poll(ZMQ_POLLER_TIMEOUT_MSEC)
+                    items = dict(self.poll_workers.poll(ZMQ_POLLER_TIMEOUT_MSEC))
                 except Exception as e:
                     logger.exception("ZMQProducer poll error", exc_info=e)
 
-                if items:
+                if self.wakeup_receiver in items:
+                    # requests were queued, they are dispatched at the top of the loop
+                    while self.wakeup_receiver.poll(0):
+                        self.wakeup_receiver.recv()
+
+                if self.socket in items:
                     msg = self.socket.recv_multipart()
 
                     if len(msg) < 3:
@@ -386,7 +449,11 @@ class ZMQProducer(QueueProducer):
                         # log everything except the last frame which contains serialized data
                         logger.info(f"ZMQProducer recv: {msg[:4]}")
 
-                    if header == ZMQHeader.W_WORKER:
+                    if header == ZMQHeader.W_WORKER and command == ZMQCommand.W_NOTIFY:
+                        # sent by servers without a producer, see ZMQClient.notify_producer
+                        self.notify()
+                        job_events.notify(UID(data[0]) if data else None)
+                    elif header == ZMQHeader.W_WORKER:
                         self.process_worker(address, command, data)
                     else:
                         logger.error(f"Invalid message header: {header}")
@@ -451,13 +518,13 @@ class ZMQProducer(QueueProducer):
         if disconnect:
             self.send_to_worker(worker, ZMQCommand.W_DISCONNECT)
 
-        if worker.service and worker in worker.service.waiting:
-            worker.service.waiting.remove(worker)
+        if worker.service:
+            worker.service.waiting.pop(worker.identity, None)
 
-        if worker in self.waiting:
-            self.waiting.remove(worker)
+        self.waiting.pop(worker.identity, None)
 
         self.workers.pop(worker.identity, None)
+        self.syft_workers.pop(worker.syft_worker_id, None)
 
         if worker.syft_worker_id is not None:
             self.update_consumer_state_for_worker(
@@ -366,6 +366,7 @@ class Request(SyncableSyftObject):
         "requesting_user_verify_key",
         "approving_user_verify_key",
         "code_id",
+        "history_status",
     ]
     __attr_unique__ = ["request_hash"]
     __repr_attrs__ = [
@@ -585,6 +586,15 @@ class Request(SyncableSyftObject):
             # which tries to send an email to the admin and ends up here
             pass  # lets keep going
 
+        return self.history_status
+
+    @property
+    def history_status(self) -> RequestStatus:
+        """The status of the request by its history of applied changes.
+
+        Stored with the request so it can be filtered on, requests of l0 deployments
+        get their status from the code status and are always PENDING here.
+        """
         if len(self.history) == 0:
             return RequestStatus.PENDING
 
@@ -592,11 +602,7 @@ class Request(SyncableSyftObject):
             len(self.current_change_state) == len(self.changes)
         )
 
-        request_status = (
-            RequestStatus.APPROVED if all_changes_applied else RequestStatus.REJECTED
-        )
-
-        return request_status
+        return RequestStatus.APPROVED if all_changes_applied else RequestStatus.REJECTED
 
     @property
     def status(self) -> RequestStatus:
@@ -5,6 +5,7 @@ import logging
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...store.db.db import DBManager
+from ...store.document_store_errors import NotFoundException
 from ...store.linked_obj import LinkedObject
 from ...types.errors import SyftException
 from ...types.result import as_result
@@ -21,6 +22,7 @@ from ..service import AbstractService
 from ..service import SERVICE_TO_TYPES
 from ..service import TYPE_TO_SERVICE
 from ..service import service_method
+from ..user.user import UserView
 from ..user.user_roles import ADMIN_ROLE_LEVEL
 from ..user.user_roles import DATA_SCIENTIST_ROLE_LEVEL
 from ..user.user_roles import GUEST_ROLE_LEVEL
@@ -81,65 +83,48 @@ class RequestService(AbstractService):
         path="request.get_all", name="get_all", roles=DATA_SCIENTIST_ROLE_LEVEL
     )
     def get_all(self, context: AuthedServiceContext) -> list[Request]:
-        requests = self.stash.get_all(context.credentials).unwrap()
-        # TODO remove once sorting is handled by the stash
-        requests.sort(key=lambda x: (x.request_time, x.id), reverse=True)
+        return self.stash.get_all(
+            context.credentials, order_by="request_time", sort_order="desc"
+        ).unwrap()
 
-        return requests
+    def _get_all_with_status(
+        self, context: AuthedServiceContext, status: RequestStatus
+    ) -> list[Request]:
+        requests = self.stash.get_all_by_history_status(
+            context.credentials, status
+        ).unwrap()
+        # requests that are pending by their history can get their status from the
+        # code status, only those need the full status check
+        return [
+            request
+            for request in requests
+            if request.history_status != RequestStatus.PENDING
+            or request.get_status(context) == status
+        ]
 
-    # DIRTY METHOD: DELETE AFTER DATABASE UPGRADE
     @service_method(
         path="request.get_all_approved",
         name="get_all_approved",
         roles=DATA_SCIENTIST_ROLE_LEVEL,
     )
     def get_all_approved(self, context: AuthedServiceContext) -> list[Request]:
-        requests = self.stash.get_all(context.credentials).unwrap()
-        # TODO remove once sorting is handled by the stash
-        requests = [
-            request
-            for request in requests
-            if request.get_status(context) == RequestStatus.APPROVED
-        ]
-        requests.sort(key=lambda x: (x.request_time, x.id), reverse=True)
-
-        return requests
+        return self._get_all_with_status(context, RequestStatus.APPROVED)
 
-    # DIRTY METHOD: DELETE AFTER DATABASE UPGRADE
     @service_method(
         path="request.get_all_rejected",
         name="get_all_rejected",
         roles=DATA_SCIENTIST_ROLE_LEVEL,
     )
     def get_all_rejected(self, context: AuthedServiceContext) -> list[Request]:
-        requests = self.stash.get_all(context.credentials).unwrap()
-        # TODO remove once sorting is handled by the stash
-        requests = [
-            request
-            for request in requests
-            if request.get_status(context) == RequestStatus.REJECTED
-        ]
-        requests.sort(key=lambda x: (x.request_time, x.id), reverse=True)
-
-        return requests
+        return self._get_all_with_status(context, RequestStatus.REJECTED)
 
-    # DIRTY METHOD: DELETE AFTER DATABASE UPGRADE
     @service_method(
         path="request.get_all_pending",
         name="get_all_pending",
         roles=DATA_SCIENTIST_ROLE_LEVEL,
     )
     def get_all_pending(self, context: AuthedServiceContext) -> list[Request]:
-        requests = self.stash.get_all(context.credentials).unwrap()
-        # TODO remove once sorting is handled by the stash
-        requests = [
-            request
-            for request in requests
-            if request.get_status(context) == RequestStatus.PENDING
-        ]
-        requests.sort(key=lambda x: (x.request_time, x.id), reverse=True)
-
-        return requests
+        return self._get_all_with_status(context, RequestStatus.PENDING)
 
     @service_method(path="request.get_all_info", name="get_all_info")
     def get_all_info(
@@ -149,27 +134,55 @@ class RequestService(AbstractService):
         page_size: int | None = 0,
     ) -> list[list[RequestInfo]] | list[RequestInfo]:
         """Get the information of all requests"""
-        result = self.stash.get_all(context.credentials).unwrap()
-        requests: list[RequestInfo] = []
-        for req in result:
-            user = context.server.services.user.get_by_verify_key(
-                req.requesting_user_verify_key
+        if page_size and page_index:
+            # a single page, paged by the database
+            result = self.stash.get_all(
+                context.credentials, limit=page_size, offset=page_index * page_size
             ).unwrap()
-            message = context.server.services.notification.filter_by_obj(
-                context=context, obj_uid=req.id
-            ).unwrap()
-            requests.append(RequestInfo(user=user, request=req, notification=message))
+            return self._get_request_infos(context, result)
+
+        result = self.stash.get_all(context.credentials).unwrap()
+        requests = self._get_request_infos(context, result)
         if not page_size:
             return requests
 
         # If chunk size is defined, then split list into evenly sized chunks
-        chunked_requests: list[list[RequestInfo]] = [
-            requests[i : i + page_size] for i in range(0, len(requests), page_size)
-        ]
-        if page_index:
-            return chunked_requests[page_index]
-        else:
-            return chunked_requests
+        return [requests[i : i + page_size] for i in range(0, len(requests), page_size)]
+
+    def _get_request_infos(
+        self, context: AuthedServiceContext, requests: list[Request]
+    ) -> list[RequestInfo]:
+        """Get the users and notifications of all requests at once."""
+        user_stash = context.server.services.user.stash
+        verify_keys = list({request.requesting_user_verify_key for request in requests})
+        users = {
+            user.verify_key: user
+            for user in user_stash.get_all(
+                context.server.services.user.root_verify_key,
+                filters={"verify_key__in": verify_keys},
+            ).unwrap()
+        }
+        notifications = context.server.services.notification.get_by_obj_uids(
+            context, [request.id for request in requests]
+        ).unwrap()
+
+        request_infos = []
+        for request in requests:
+            user = users.get(request.requesting_user_verify_key)
+            if user is None:
+                raise NotFoundException(
+                    public_message=f"User with verify key {request.requesting_user_verify_key} not found"
+                )
+            if request.id not in notifications:
+                raise SyftException(public_message="Could not get notifications!!")
+            request_infos.append(
+                RequestInfo(
+                    user=user.to(UserView),
+                    request=request,
+                    message=notifications[request.id],
+                )
+            )
+        return request_infos
 
     @service_method(path="request.add_changes", name="add_changes")
     def add_changes(
@@ -1,11 +1,17 @@
+# third party
+from sqlalchemy.orm import Session
+
 # relative
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import with_session
+from ...store.document_store_errors import StashException
 from ...types.errors import SyftException
 from ...types.result import as_result
 from ...types.uid import UID
 from .request import Request
+from .request import RequestStatus
 
 
 @serializable(canonical_name="RequestStashSQL", version=1)
@@ -29,3 +35,32 @@ class RequestStash(ObjectStash[Request]):
             credentials=credentials,
             filters={"code_id": user_code_id},
         ).unwrap()
+
+    @as_result(StashException)
+    @with_session
+    def get_all_by_history_status(
+        self,
+        credentials: SyftVerifyKey,
+        status: RequestStatus,
+        session: Session = None,
+    ) -> list[Request]:
+        """Get the requests that can have `status`, newest first.
+
+        Requests that are pending by their history are returned for every status,
+        their status can still come from the code status.
+        """
+        query = self.query()
+        role = self.get_role(credentials, session=session)
+        query = query.with_permissions(credentials, role)
+
+        for other_status in RequestStatus:
+            if other_status not in (status, RequestStatus.PENDING):
+                query = query.filter("history_status", "ne", other_status)
+
+        query = query.order_by("request_time", "desc")
+        result = query.execute(session).all()
+        requests = [self.row_as_obj(row) for row in result]
+        # requests stored before history_status was stored have no value to filter
+        # on and pass every filter above, check the status of their history instead
+        allowed = (status, RequestStatus.PENDING)
+        return [request for request in requests if request.history_status in allowed]
@@ -5,6 +5,7 @@ from typing import Any
 
 # third party
 from pydantic import EmailStr
+from pydantic import Field
 from pydantic import field_validator
 from pydantic import model_validator
 from typing_extensions import Self
@@ -248,11 +249,11 @@ class ServerSettings(SyftObject):
     association_request_auto_approval: bool
     eager_execution_enabled: bool = False
     default_worker_pool: str = DEFAULT_WORKER_POOL_NAME
-    welcome_markdown: HTMLObject | MarkdownDescription = HTMLObject(
-        text=DEFAULT_WELCOME_MSG
+    welcome_markdown: HTMLObject | MarkdownDescription = Field(
+        default_factory=lambda: HTMLObject(text=DEFAULT_WELCOME_MSG)
     )
     notifications_enabled: bool
-    pwd_token_config: PwdTokenResetConfig = PwdTokenResetConfig()
+    pwd_token_config: PwdTokenResetConfig = Field(default_factory=PwdTokenResetConfig)
     allow_guest_sessions: bool = True
 
     @field_validator("organization")
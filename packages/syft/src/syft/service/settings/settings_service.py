@@ -70,7 +70,9 @@ class SettingsService(AbstractService):
         self, context: AuthedServiceContext, settings: ServerSettings
     ) -> ServerSettings:
         """Set a new the Server Settings"""
-        return self.stash.set(context.credentials, settings).unwrap()
+        settings = self.stash.set(context.credentials, settings).unwrap()
+        context.server.invalidate_settings()
+        return settings
 
     @service_method(
         path="settings.update",
@@ -132,6 +134,7 @@ class SettingsService(AbstractService):
             update_result = self.stash.update(
                 context.credentials, obj=new_settings
             ).unwrap()
+            context.server.invalidate_settings()
 
             # If notifications_enabled is present in the update, we need to update the notifier settings
             if settings.notifications_enabled is not Empty:  # type: ignore[comparison-overlap]
@@ -182,6 +185,7 @@ class SettingsService(AbstractService):
             updated_settings = self.stash.update(
                 context.credentials, new_settings
             ).unwrap()
+            context.server.invalidate_settings()
             return SyftSuccess(
                 message=(
                     "Settings updated successfully. "
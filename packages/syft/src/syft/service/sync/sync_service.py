@@ -135,9 +135,12 @@ class SyncService(AbstractService):
             raise ValueError("ActionObject permissions should be added separately")
         else:
             store = get_store(context, item)  # type: ignore
-            for permission in new_permissions:
-                if permission.permission == ActionPermission.READ:
-                    store.add_permission(permission)
+            read_permissions = [
+                permission
+                for permission in new_permissions
+                if permission.permission == ActionPermission.READ
+            ]
+            store.add_permissions_many(read_permissions, ignore_missing=True).unwrap()
 
     def add_storage_permissions_for_item(
         self,
@@ -181,6 +184,20 @@ class SyncService(AbstractService):
 
         return res
 
+    @as_result(SyftException)
+    def set_objects(
+        self,
+        context: AuthedServiceContext,
+        stash: ObjectStash,
+        items: list[SyncableSyftObject],
+    ) -> list[SyftObject]:
+        """Batched `set_object` for items of a single stash"""
+        # Storage permissions are added separately
+        results = stash.upsert_many(
+            context.credentials, items, add_storage_permission=False
+        ).unwrap()
+        return [result.unwrap() for result in results]
+
     @service_method(
         path="sync.sync_items",
         name="sync_items",
@@ -207,6 +224,7 @@ class SyncService(AbstractService):
         # This should happen only for the high side when we sync results but
         # we need to add permissions for the DS to properly show the status of the requests
         for obj_type, permission_list in permissions.items():
+            read_permissions = []
             for permission in permission_list:
                 if permission.uid in item_ids:
                     continue
@@ -216,18 +234,23 @@ class SyncService(AbstractService):
                     raise SyftException(
                         public_message="Permission for object type not supported!"
                     )
-                if issubclass(obj_type, ActionObject):
-                    store = context.server.services.action.stash
-                else:
-                    service = context.server.get_service(TYPE_TO_SERVICE[obj_type])
-                    store = service.stash  # type: ignore[assignment]
                 if permission.permission == ActionPermission.READ:
-                    store.add_permission(permission)
+                    read_permissions.append(permission)
+            if not read_permissions:
+                continue
+            if issubclass(obj_type, ActionObject):
+                store = context.server.services.action.stash
+            else:
+                service = context.server.get_service(TYPE_TO_SERVICE[obj_type])
+                store = service.stash  # type: ignore[assignment]
+            store.add_permissions_many(read_permissions, ignore_missing=True).unwrap()
 
         storage_permissions_dict = defaultdict(list)
         for storage_permission in storage_permissions:
             storage_permissions_dict[storage_permission.uid].append(storage_permission)
 
+        # objects are written per stash in one batch, permissions are added after
+        items_by_stash: dict[ObjectStash, list[SyncableSyftObject]] = defaultdict(list)
         for item in items:
             new_permissions = permissions_dict[item.id.id]
             new_storage_permissions = storage_permissions_dict[item.id.id]
@@ -236,13 +259,30 @@ class SyncService(AbstractService):
                 self.add_storage_permissions_for_item(
                     context, item, new_storage_permissions
                 )
-            else:
-                item = self.transform_item(context, item)  # type: ignore[unreachable]
+            elif isinstance(item, TwinAPIEndpoint):
+                item = self.transform_item(context, item)
                 self.set_object(context, item).unwrap()
                 self.add_permissions_for_item(context, item, new_permissions)
                 self.add_storage_permissions_for_item(
                     context, item, new_storage_permissions
                 )
+            else:
+                item = self.transform_item(context, item)
+                stash = self.get_stash_for_item(context, item).unwrap()
+                items_by_stash[stash].append(item)
+
+        for stash, stash_items in items_by_stash.items():
+            self.set_objects(context, stash, stash_items).unwrap()
+            new_permissions = [
+                permission
+                for item in stash_items
+                for permission in permissions_dict[item.id.id]
+            ]
+            self.add_permissions_for_item(context, stash_items[0], new_permissions)
+            for item in stash_items:
+                self.add_storage_permissions_for_item(
+                    context, item, storage_permissions_dict[item.id.id]
+                )
 
         # NOTE include_items=False to avoid snapshotting the database
         # Snapshotting is disabled to avoid mongo size limit and performance issues
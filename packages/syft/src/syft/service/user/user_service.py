@@ -545,6 +545,7 @@ class UserService(AbstractService):
                 settings_stash.update(
                     credentials=context.credentials, obj=settings_data
                 )
+                context.server.invalidate_settings()
 
         return user.to(UserView)
 
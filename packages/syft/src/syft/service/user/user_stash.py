@@ -1,17 +1,159 @@
+# third party
+from pydantic import ValidationError
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
 # relative
 from ...serde.serializable import serializable
 from ...server.credentials import SyftSigningKey
 from ...server.credentials import SyftVerifyKey
+from ...store.db.role_cache import role_cache
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import with_session
 from ...store.document_store_errors import NotFoundException
 from ...store.document_store_errors import StashException
+from ...store.document_store_errors import UniqueConstraintException
+from ...types.errors import SyftException
+from ...types.result import Result
 from ...types.result import as_result
+from ...types.uid import UID
+from ..action.action_permissions import ActionObjectPermission
 from .user import User
 from .user_roles import ServiceRole
 
 
+# session.info key of the server whose cached roles are dropped on commit
+_ROLES_CHANGED = "user_stash_roles_changed"
+
+
+def _invalidate_roles(session: Session) -> None:
+    if _ROLES_CHANGED in session.info:
+        role_cache.invalidate(session.info.pop(_ROLES_CHANGED))
+
+
 @serializable(canonical_name="UserStashSQL", version=1)
 class UserStash(ObjectStash[User]):
+    # every write can change the role of a user, the cached roles of this
+    # server are dropped once the write is committed. Dropping them earlier
+    # lets a concurrent lookup cache the old role again before the commit.
+
+    def _invalidate_roles_on_commit(self, session: Session) -> None:
+        session.info[_ROLES_CHANGED] = self.server_uid
+        if not event.contains(session, "after_commit", _invalidate_roles):
+            event.listen(session, "after_commit", _invalidate_roles)
+
+    @as_result(SyftException, StashException)
+    @with_session
+    def set(
+        self,
+        credentials: SyftVerifyKey,
+        obj: User,
+        add_permissions: list[ActionObjectPermission] | None = None,
+        add_storage_permission: bool = True,
+        ignore_duplicates: bool = False,
+        session: Session = None,
+        skip_check_type: bool = False,
+    ) -> User:
+        user = super().set(
+            credentials,
+            obj,
+            add_permissions=add_permissions,
+            add_storage_permission=add_storage_permission,
+            ignore_duplicates=ignore_duplicates,
+            session=session,
+            skip_check_type=skip_check_type,
+        ).unwrap()
+        self._invalidate_roles_on_commit(session)
+        return user
+
+    @as_result(StashException)
+    @with_session
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[User],
+        add_storage_permission: bool = True,
+        ignore_duplicates: bool = False,
+        session: Session = None,
+        skip_check_type: bool = False,
+    ) -> list[Result[User, StashException]]:
+        results = super().set_many(
+            credentials,
+            objs,
+            add_storage_permission=add_storage_permission,
+            ignore_duplicates=ignore_duplicates,
+            session=session,
+            skip_check_type=skip_check_type,
+        ).unwrap()
+        self._invalidate_roles_on_commit(session)
+        return results
+
+    @as_result(
+        StashException,
+        NotFoundException,
+        AttributeError,
+        ValidationError,
+        UniqueConstraintException,
+    )
+    @with_session
+    def update(
+        self,
+        credentials: SyftVerifyKey,
+        obj: User,
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> User:
+        user = super().update(
+            credentials, obj, has_permission=has_permission, session=session
+        ).unwrap()
+        self._invalidate_roles_on_commit(session)
+        return user
+
+    @as_result(StashException)
+    @with_session
+    def update_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[User],
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> list[Result[User, StashException | NotFoundException]]:
+        results = super().update_many(
+            credentials, objs, has_permission=has_permission, session=session
+        ).unwrap()
+        self._invalidate_roles_on_commit(session)
+        return results
+
+    @as_result(StashException, NotFoundException)
+    @with_session
+    def delete_by_uid(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> UID:
+        deleted = super().delete_by_uid(
+            credentials, uid, has_permission=has_permission, session=session
+        ).unwrap()
+        self._invalidate_roles_on_commit(session)
+        return deleted
+
+    @as_result(StashException)
+    @with_session
+    def delete_many(
+        self,
+        credentials: SyftVerifyKey,
+        uids: list[UID],
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> list[Result[UID, NotFoundException]]:
+        results = super().delete_many(
+            credentials, uids, has_permission=has_permission, session=session
+        ).unwrap()
+        self._invalidate_roles_on_commit(session)
+        return results
+
     @as_result(StashException, NotFoundException)
     def admin_user(self) -> User:
         # TODO: This returns only one user, the first user with the role ADMIN
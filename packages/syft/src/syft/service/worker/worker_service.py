@@ -198,6 +198,9 @@ class WorkerService(AbstractService):
         worker.to_be_deleted = True
 
         self.stash.update(context.credentials, worker).unwrap()
+        # producers in this process purge the worker without waiting for a refresh
+        for producer in context.server.queue_manager.producers.values():
+            producer.update_syft_worker(worker)
         if not force:
             # relative
             return SyftSuccess(message=f"Worker {uid} has been marked for deletion.")
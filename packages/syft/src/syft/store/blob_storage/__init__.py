@@ -121,13 +121,15 @@ def syft_iter_content(
     chunk_size: int,
     max_retries: int = MAX_RETRIES,
     timeout: int = DEFAULT_TIMEOUT,
+    session: requests.Session | None = None,
 ) -> Generator:
     """Custom iter content with smart retries (start from last byte read)"""
+    http = requests if session is None else session
     current_byte = 0
     for attempt in range(max_retries):
         headers = {"Range": f"bytes={current_byte}-"}
         try:
-            with requests.get(
+            with http.get(
                 str(blob_url), stream=True, headers=headers, timeout=(timeout, timeout)
             ) as response:
                 response.raise_for_status()
@@ -175,9 +177,10 @@ class BlobRetrievalByURL(BlobRetrieval):
         **kwargs: Any,
     ) -> Any:
         # relative
-        from ...client.api import APIRegistry
+        from ...client.client import get_http_session
 
         api = self.get_api_wrapped()
+        session = get_http_session(api.unwrap().connection if api.is_ok() else None)
 
         if api.is_ok() and api.unwrap().connection and isinstance(self.url, ServerURL):
             api = api.unwrap()
@@ -198,9 +201,9 @@ class BlobRetrievalByURL(BlobRetrieval):
                 self.type_, BlobFileType
             )
             if is_blob_file and stream:
-                return syft_iter_content(blob_url, chunk_size)
+                return syft_iter_content(blob_url, chunk_size, session=session)
 
-            response = requests.get(str(blob_url), stream=stream)  # nosec
+            response = session.get(str(blob_url), stream=stream)  # nosec
             resp_content = response.content
             response.raise_for_status()
 
@@ -7,16 +7,26 @@ from urllib.parse import urlparse
 
 # third party
 from pydantic import BaseModel
+import sqlalchemy as sa
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.schema import CreateIndex
 
 # relative
+from ...serde.json_serde import json_dumps
+from ...serde.json_serde import json_loads
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...types.uid import UID
 from ...util.telemetry import instrument_sqlalchemny
+from .role_cache import role_cache
 from .schema import PostgresBase
 from .schema import SQLiteBase
+from .schema import insert_ignore_conflicts
+from .schema import legacy_unique_index_name
+from .schema import permissions_table_name
+from .schema import split_permission_string
 
 logger = logging.getLogger(__name__)
 instrument_sqlalchemny()
@@ -65,8 +75,8 @@ class DBManager(Generic[ConfigT]):
         self.server_uid = server_uid
         self.engine = create_engine(
             config.connection_string,
-            # json_serializer=dumps,
-            # json_deserializer=loads,
+            json_serializer=json_dumps,
+            json_deserializer=json_loads,
         )
         logger.info(f"Connecting to {config.connection_string}")
         self.sessionmaker = sessionmaker(bind=self.engine)
@@ -82,4 +92,171 @@ class DBManager(Generic[ConfigT]):
         with self.sessionmaker().begin() as _:
             if reset:
                 Base.metadata.drop_all(bind=self.engine)
+                role_cache.invalidate(self.server_uid)
             Base.metadata.create_all(self.engine)
+        self.add_missing_columns(Base.metadata)
+        self.migrate_permissions_columns(Base.metadata)
+
+    def add_missing_columns(self, metadata: sa.MetaData) -> None:
+        """Add the columns and indexes that tables created by an older version miss.
+
+        When an object type gets a new searchable or unique field, its table
+        gets the generated column of that field. The database computes it for
+        the rows that are already stored, without reading them into the server.
+        Tables created before __attr_unique__ was enforced by the database get
+        their unique indexes here too, tables with a unique index on the JSON value
+        of a field get it on the generated column instead.
+
+        Postgres only supports STORED generated columns, adding one rewrites the
+        table while holding an exclusive lock on it. The indexes are built
+        concurrently there, so they don't block writes.
+
+        When stored objects already share the value of a unique field, its index
+        is skipped and the duplicates are logged. The index is added on the first
+        start after they are removed.
+        """
+        dialect = self.engine.dialect
+        inspector = sa.inspect(self.engine)
+        for table in metadata.sorted_tables:
+            existing_columns = {
+                column["name"] for column in inspector.get_columns(table.name)
+            }
+            missing_indexes = []
+            with self.engine.begin() as connection:
+                for column in table.columns:
+                    if column.name in existing_columns:
+                        continue
+                    logger.info(f"Adding column {column.name} to {table.name}")
+                    table_name = dialect.identifier_preparer.format_table(table)
+                    column_ddl = CreateColumn(column).compile(dialect=dialect)
+                    connection.execute(
+                        sa.text(f"ALTER TABLE {table_name} ADD COLUMN {column_ddl}")
+                    )
+                unique_field_indexes = [
+                    index
+                    for index in table.indexes
+                    if index.unique and "field_name" in index.info
+                ]
+                # the old index has no name in common with the new one, and
+                # SQLite can't reflect it
+                for index in unique_field_indexes:
+                    legacy_name = legacy_unique_index_name(
+                        table.name, index.info["field_name"]
+                    )
+                    connection.execute(
+                        sa.text(
+                            "DROP INDEX IF EXISTS "
+                            + dialect.identifier_preparer.quote(legacy_name)
+                        )
+                    )
+                existing_indexes = {
+                    index["name"]
+                    for index in sa.inspect(connection).get_indexes(table.name)
+                }
+                for index in table.indexes:
+                    if index.name in existing_indexes:
+                        continue
+                    if index in unique_field_indexes and self._has_duplicates(
+                        connection, table, index
+                    ):
+                        continue
+                    missing_indexes.append(index)
+            for index in missing_indexes:
+                self._create_index(index)
+
+    def _create_index(self, index: sa.Index) -> None:
+        if self.engine.dialect.name != "postgresql":
+            with self.engine.begin() as connection:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+            return
+
+        # CREATE INDEX CONCURRENTLY can't run inside a transaction
+        postgres_options = index.dialect_options["postgresql"]
+        postgres_options["concurrently"] = True
+        try:
+            with self.engine.connect().execution_options(
+                isolation_level="AUTOCOMMIT"
+            ) as connection:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+        finally:
+            postgres_options["concurrently"] = False
+
+    def _has_duplicates(
+        self, connection: sa.Connection, table: sa.Table, index: sa.Index
+    ) -> bool:
+        (column,) = index.columns
+        duplicates = (
+            connection.execute(
+                sa.select(column)
+                .where(column.is_not(None))
+                .group_by(column)
+                .having(sa.func.count() > 1)
+                .limit(10)
+            )
+            .scalars()
+            .all()
+        )
+        if duplicates:
+            logger.error(
+                f"Can't add the unique index on {index.info['field_name']} of "
+                f"{table.name}, these values are stored more than once: "
+                f"{', '.join(duplicates)}. The field is not unique until the "
+                "duplicate objects are removed and the server is restarted."
+            )
+        return bool(duplicates)
+
+    def migrate_permissions_columns(self, metadata: sa.MetaData) -> None:
+        """Move grants from the JSON `permissions` column of tables created by an
+        older version into their permissions table, then drop the column.
+
+        Runs once per table, the column no longer exists afterwards.
+        """
+        inspector = sa.inspect(self.engine)
+        for table in metadata.sorted_tables:
+            permissions_table = metadata.tables.get(permissions_table_name(table.name))
+            if permissions_table is None:
+                continue
+            existing_columns = {
+                column["name"] for column in inspector.get_columns(table.name)
+            }
+            if "permissions" not in existing_columns:
+                continue
+
+            logger.info(f"Moving the permissions column of {table.name}")
+            legacy_table = sa.table(
+                table.name,
+                sa.column("id", table.c.id.type),
+                sa.column("permissions", sa.JSON),
+            )
+            with self.engine.begin() as connection:
+                rows = connection.execute(
+                    sa.select(legacy_table.c.id, legacy_table.c.permissions).where(
+                        legacy_table.c.permissions.is_not(None)
+                    )
+                )
+                permission_rows = []
+                for uid, permission_strings in rows:
+                    for permission_string in permission_strings or []:
+                        permission, verify_key = split_permission_string(
+                            permission_string
+                        )
+                        permission_rows.append(
+                            {
+                                "object_id": uid,
+                                "permission": permission,
+                                "verify_key": verify_key,
+                            }
+                        )
+                if permission_rows:
+                    connection.execute(
+                        insert_ignore_conflicts(
+                            permissions_table, self.engine.dialect.name
+                        ),
+                        permission_rows,
+                    )
+                table_name = self.engine.dialect.identifier_preparer.format_table(
+                    table
+                )
+                connection.execute(
+                    sa.text(f"ALTER TABLE {table_name} DROP COLUMN permissions")
+                )
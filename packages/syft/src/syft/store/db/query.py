@@ -13,6 +13,7 @@ from sqlalchemy import Result
 from sqlalchemy import Select
 from sqlalchemy import Table
 from sqlalchemy import func
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import DatabaseError
 from sqlalchemy.orm import Session
 from typing_extensions import Self
@@ -28,17 +29,23 @@ from ...types.uid import UID
 from .errors import StashDBException
 from .schema import PostgresBase
 from .schema import SQLiteBase
+from .schema import get_field_column
+from .schema import get_permissions_table
+from .schema import split_permission_string
 
 
 class FilterOperator(enum.Enum):
     EQ = "eq"
+    NE = "ne"
     CONTAINS = "contains"
+    IN = "in"
 
 
 class Query(ABC):
     def __init__(self, object_type: type[SyftObject]) -> None:
         self.object_type: type = object_type
         self.table: Table = self._get_table(object_type)
+        self.permissions_table: Table = get_permissions_table(self.table)
         self.stmt: Select = self.table.select()
 
     @abstractmethod
@@ -110,6 +117,7 @@ class Query(ABC):
         example usage:
         Query(User).filter("name", "eq", "Alice")
         Query(User).filter("friends", "contains", "Bob")
+        Query(User).filter("name", "in", ["Alice", "Bob"])
 
         Args:
             field (str): Field to filter on
@@ -197,8 +205,21 @@ class Query(ABC):
 
         if operator == FilterOperator.EQ:
             return self._eq_filter(table, field, value)
+        elif operator == FilterOperator.NE:
+            return self._ne_filter(table, field, value)
         elif operator == FilterOperator.CONTAINS:
             return self._contains_filter(table, field, value)
+        elif operator == FilterOperator.IN:
+            return self._in_filter(table, field, value)
+
+    def _ne_filter(
+        self,
+        table: Table,
+        field: str,
+        value: Any,
+    ) -> sa.sql.elements.ColumnElement:
+        # objects without the field are not equal to the value either
+        return sa.not_(func.coalesce(self._eq_filter(table, field, value), sa.false()))
 
     def order_by(
         self,
@@ -218,6 +239,77 @@ class Query(ABC):
         Returns:
             Self: The query object with the order by clause applied.
         """
+        field, order = self._resolve_order(field, order)
+        column = self._get_order_expression(field)
+
+        if order == "asc":
+            self.stmt = self.stmt.order_by(column.asc())
+        else:
+            self.stmt = self.stmt.order_by(column.desc())
+
+        return self
+
+    def keyset(
+        self,
+        field: str | None = None,
+        order: Literal["asc", "desc"] | None = None,
+        after: tuple[Any, UID] | None = None,
+    ) -> Self:
+        """Order the query by a field and the id, and keep the rows after a cursor.
+
+        The cursor of a row is its (sort_key, id), the sort key is selected in the
+        `sort_key` column. Unlike an offset, skipping the rows before the cursor
+        uses the order instead of reading them. Null values come before all others.
+
+        Args:
+            field (Optional[str]): field to order by. If None, uses the default field.
+            order (Optional[Literal["asc", "desc"]]): Order to use ("asc" or "desc").
+            after (Optional[tuple[Any, UID]]): cursor of the last row of the previous page.
+
+        Raises:
+            ValueError: If the order is not "asc" or "desc"
+
+        Returns:
+            Self: The query object with the order by and cursor clauses applied.
+        """
+        field, order = self._resolve_order(field, order)
+        column = self._get_order_expression(field)
+        id_column = self.table.c.id
+
+        if order == "asc":
+            order_clauses = [column.asc().nulls_first(), id_column.asc()]
+        else:
+            order_clauses = [column.desc().nulls_last(), id_column.desc()]
+        self.stmt = self.stmt.add_columns(column.label("sort_key")).order_by(
+            *order_clauses
+        )
+
+        if after is None:
+            return self
+
+        value, uid = after
+        after_id = id_column > uid if order == "asc" else id_column < uid
+        if value is None:
+            if order == "asc":
+                clause = sa.or_(
+                    column.is_not(None), sa.and_(column.is_(None), after_id)
+                )
+            else:
+                clause = sa.and_(column.is_(None), after_id)
+        else:
+            value = sa.literal(value, type_=column.type)
+            after_value = column > value if order == "asc" else column < value
+            clause = sa.or_(after_value, sa.and_(column == value, after_id))
+            if order == "desc":
+                clause = sa.or_(clause, column.is_(None))
+        self.stmt = self.stmt.where(clause)
+        return self
+
+    def _resolve_order(
+        self,
+        field: str | None,
+        order: Literal["asc", "desc"] | None,
+    ) -> tuple[str, Literal["asc", "desc"]]:
         # Determine the field and order defaults if not provided
         if field is None:
             if hasattr(self.object_type, "__order_by__"):
@@ -230,20 +322,20 @@ class Query(ABC):
             default_order = "asc"
         order = order or default_order
 
-        column = self._get_column(field)
+        if order.lower() not in ("asc", "desc"):
+            raise ValueError(f"Invalid sort order {order}")
+        return field, order.lower()  # type: ignore
 
+    def _get_order_expression(self, field: str) -> sa.ColumnElement:
+        column = self._get_column(field)
         if isinstance(column.type, sa.JSON):
-            column = sa.cast(column, sa.String)
-
-        if order.lower() == "asc":
-            self.stmt = self.stmt.order_by(column.asc())
-
-        elif order.lower() == "desc":
-            self.stmt = self.stmt.order_by(column.desc())
-        else:
-            raise ValueError(f"Invalid sort order {order}")
+            # sort by the JSON value, so numbers and timestamps sort as numbers
+            return self._json_order_expression(field)
+        return column
 
-        return self
+    @abstractmethod
+    def _json_order_expression(self, field: str) -> sa.ColumnElement:
+        pass
 
     def limit(self, limit: int | None) -> Self:
         """Add a limit clause to the query."""
@@ -264,12 +356,30 @@ class Query(ABC):
         self.stmt = self.stmt.offset(offset)
         return self
 
-    @abstractmethod
     def _make_permissions_clause(
         self,
         permission: ActionObjectPermission,
     ) -> sa.sql.elements.BinaryExpression:
-        pass
+        # ids come from the (verify_key, permission, object_id) index
+        # instead of scanning the objects
+        permission_name, verify_key = split_permission_string(
+            permission.permission_string
+        )
+        permissions_table = self.permissions_table
+        permitted_ids = sa.select(permissions_table.c.object_id).where(
+            sa.or_(
+                sa.and_(
+                    permissions_table.c.verify_key == verify_key,
+                    permissions_table.c.permission == permission_name,
+                ),
+                sa.and_(
+                    permissions_table.c.verify_key == "",
+                    permissions_table.c.permission
+                    == permission.compound_permission_string,
+                ),
+            )
+        )
+        return self.table.c.id.in_(permitted_ids)
 
     @abstractmethod
     def _contains_filter(
@@ -280,6 +390,15 @@ class Query(ABC):
     ) -> sa.sql.elements.BinaryExpression:
         pass
 
+    @abstractmethod
+    def _in_filter(
+        self,
+        table: Table,
+        field: str,
+        values: list[Any],
+    ) -> sa.sql.elements.BinaryExpression:
+        pass
+
     def _get_column(self, column: str) -> Column:
         if column == "id":
             return self.table.c.id
@@ -294,16 +413,9 @@ class Query(ABC):
 
 
 class SQLiteQuery(Query):
-    def _make_permissions_clause(
-        self,
-        permission: ActionObjectPermission,
-    ) -> sa.sql.elements.BinaryExpression:
-        permission_string = permission.permission_string
-        compound_permission_string = permission.compound_permission_string
-        return sa.or_(
-            self.table.c.permissions.contains(permission_string),
-            self.table.c.permissions.contains(compound_permission_string),
-        )
+    def _json_order_expression(self, field: str) -> sa.ColumnElement:
+        # json_extract returns numbers as numbers and strings without quotes
+        return func.json_extract(self.table.c.fields, f'$."{field}"')
 
     def _get_table(self, object_type: type[SyftObject]) -> Table:
         cname = object_type.__canonical_name__
@@ -329,23 +441,47 @@ class SQLiteQuery(Query):
         if field == "id":
             return table.c.id == UID(value)
 
+        json_value = serialize_json(value)
+        column = get_field_column(table, field)
+        if column is not None:
+            if json_value is None:
+                return column.is_(None)
+            return column == func.json_quote(json_value)
+
         if "." in field:
             # magic!
             field = field.split(".")  # type: ignore
 
-        json_value = serialize_json(value)
         return table.c.fields[field] == func.json_quote(json_value)
 
+    def _in_filter(
+        self,
+        table: Table,
+        field: str,
+        values: list[Any],
+    ) -> sa.sql.elements.BinaryExpression:
+        if field == "id":
+            return table.c.id.in_([UID(value) for value in values])
+
+        json_values = [func.json_quote(serialize_json(value)) for value in values]
+        column = get_field_column(table, field)
+        if column is not None:
+            return column.in_(json_values)
+
+        if "." in field:
+            field = field.split(".")  # type: ignore
+
+        return table.c.fields[field].in_(json_values)
+
 
 class PostgresQuery(Query):
-    def _make_permissions_clause(
-        self, permission: ActionObjectPermission
-    ) -> sa.sql.elements.BinaryExpression:
-        permission_string = [permission.permission_string]
-        compound_permission_string = [permission.compound_permission_string]
-        return sa.or_(
-            self.table.c.permissions.contains(permission_string),
-            self.table.c.permissions.contains(compound_permission_string),
+    def _json_order_expression(self, field: str) -> sa.ColumnElement:
+        # jsonb orders numbers numerically and strings by collation, a JSON null
+        # becomes NULL so it is ordered and compared like a missing field
+        return func.nullif(
+            sa.cast(self.table.c.fields[field], postgresql.JSONB),
+            sa.cast(sa.literal("null"), postgresql.JSONB),
+            type_=postgresql.JSONB,
         )
 
     def _contains_filter(
@@ -374,10 +510,35 @@ class PostgresQuery(Query):
         if field == "id":
             return table.c.id == UID(value)
 
+        json_value = serialize_json(value)
+        column = get_field_column(table, field)
+        if column is not None:
+            if json_value is None:
+                return column.is_(None)
+            return column == sa.cast(json_value, sa.Text)
+
         if "." in field:
             # magic!
             field = field.split(".")  # type: ignore
 
-        json_value = serialize_json(value)
         # NOTE: there might be a bug with casting everything to text
         return table.c.fields[field].astext == sa.cast(json_value, sa.Text)
+
+    def _in_filter(
+        self,
+        table: Table,
+        field: str,
+        values: list[Any],
+    ) -> sa.sql.elements.BinaryExpression:
+        if field == "id":
+            return table.c.id.in_([UID(value) for value in values])
+
+        json_values = [sa.cast(serialize_json(value), sa.Text) for value in values]
+        column = get_field_column(table, field)
+        if column is not None:
+            return column.in_(json_values)
+
+        if "." in field:
+            field = field.split(".")  # type: ignore
+
+        return table.c.fields[field].astext.in_(json_values)
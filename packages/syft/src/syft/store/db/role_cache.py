@@ -0,0 +1,68 @@
+# stdlib
+import threading
+import time
+
+# relative
+from ...server.credentials import SyftVerifyKey
+from ...service.user.user_roles import ServiceRole
+from ...types.uid import UID
+
+# how long a role is trusted before it is read from the User table again,
+# bounds how stale roles get in processes that don't see the invalidation
+ROLE_CACHE_TTL_SEC = 10
+
+
+class RoleCache:
+    """Process-wide cache of the role of a verify key on a server.
+
+    Shared by all stashes of all servers in the process, entries expire after
+    `ttl` seconds and writes to the User table invalidate the entries of that server.
+    """
+
+    def __init__(self, ttl: float = ROLE_CACHE_TTL_SEC) -> None:
+        self.ttl = ttl
+        self._roles: dict[tuple[UID | None, str], tuple[ServiceRole, float]] = {}
+        # bumped on every invalidation, so lookups that started before it don't
+        # put a stale role back in the cache
+        self.generation = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self, server_uid: UID | None, verify_key: SyftVerifyKey
+    ) -> ServiceRole | None:
+        entry = self._roles.get((server_uid, str(verify_key)))
+        if entry is None:
+            return None
+        role, expires_at = entry
+        if time.monotonic() >= expires_at:
+            return None
+        return role
+
+    def set(
+        self,
+        server_uid: UID | None,
+        verify_key: SyftVerifyKey,
+        role: ServiceRole,
+        generation: int,
+    ) -> None:
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._roles[(server_uid, str(verify_key))] = (
+                role,
+                time.monotonic() + self.ttl,
+            )
+
+    def invalidate(self, server_uid: UID | None) -> None:
+        with self._lock:
+            self.generation += 1
+            for key in [key for key in self._roles if key[0] == server_uid]:
+                del self._roles[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._roles.clear()
+
+
+role_cache = RoleCache()
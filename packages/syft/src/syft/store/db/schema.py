@@ -10,6 +10,7 @@ from sqlalchemy import Dialect
 from sqlalchemy import Table
 from sqlalchemy import TypeDecorator
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.types import JSON
 
@@ -60,18 +61,16 @@ def create_table(
     dialect_name = dialect.name
 
     fields_type = JSON if dialect_name == "sqlite" else postgresql.JSON
-    permissions_type = JSON if dialect_name == "sqlite" else postgresql.JSONB
     storage_permissions_type = JSON if dialect_name == "sqlite" else postgresql.JSONB
 
     Base = SQLiteBase if dialect_name == "sqlite" else PostgresBase
 
     if table_name not in Base.metadata.tables:
-        Table(
+        table = Table(
             object_type.__canonical_name__,
             Base.metadata,
             Column("id", UIDTypeDecorator, primary_key=True, default=uuid.uuid4),
             Column("fields", fields_type, default={}),
-            Column("permissions", permissions_type, default=[]),
             Column(
                 "storage_permissions",
                 storage_permissions_type,
@@ -83,5 +82,137 @@ def create_table(
             Column("_updated_at", sa.DateTime, server_onupdate=sa.func.now()),
             Column("_deleted_at", sa.DateTime, index=True),
         )
+        # filters on searchable and unique fields use these columns and their
+        # indexes instead of extracting the field from the JSON of every row
+        for field_name, unique in indexed_fields(object_type):
+            column = Column(
+                field_column_name(field_name),
+                sa.String,
+                sa.Computed(
+                    field_column_expression(field_name, dialect_name),
+                    # SQLite can only add VIRTUAL columns to existing tables,
+                    # Postgres only supports STORED ones
+                    persisted=dialect_name != "sqlite",
+                ),
+            )
+            table.append_column(column)
+            # let the database enforce __attr_unique__, so writes don't need to
+            # check uniqueness with a separate query
+            sa.Index(
+                f"uq_{table_name}_{field_name}"
+                if unique
+                else f"ix_{table_name}_{field_name}",
+                column,
+                unique=unique,
+                info={"field_name": field_name},
+            )
+        create_permissions_table(table)
 
     return Base.metadata.tables[table_name]
+
+
+def indexed_fields(object_type: type[SyftObject]) -> list[tuple[str, bool]]:
+    """The (field name, unique) pairs of the fields that get an indexed column."""
+    unique_fields = getattr(object_type, "__attr_unique__", [])
+    searchable_fields = getattr(object_type, "__attr_searchable__", [])
+    fields = dict.fromkeys([*unique_fields, *searchable_fields])
+    return [
+        (field_name, field_name in unique_fields)
+        for field_name in fields
+        if field_name != "id"
+    ]
+
+
+def legacy_unique_index_name(table_name: str, field_name: str) -> str:
+    """Name of the unique index on the JSON value of a field, which tables created
+    before the generated columns have instead of the index on the column."""
+    return f"ix_{table_name}_{field_name}_unique"
+
+
+def field_column_name(field_name: str) -> str:
+    return f"_field_{field_name}"
+
+
+def field_column_expression(field_name: str, dialect_name: str) -> str:
+    """SQL expression of the generated column of a field.
+
+    The value is what `Query` filters compare to on that dialect, and NULL
+    for missing or null values so unique columns allow any number of them.
+    """
+    if dialect_name == "sqlite":
+        json_path = f'$."{field_name}"'
+        return f"NULLIF(JSON_QUOTE(JSON_EXTRACT(fields, '{json_path}')), 'null')"
+    return f"fields ->> '{field_name}'"
+
+
+def get_field_column(table: Table, field_name: str) -> Column | None:
+    """The indexed column of a field, None if the field has no column."""
+    return table.c.get(field_column_name(field_name))
+
+
+def insert_ignore_conflicts(table: Table, dialect_name: str) -> sa.Insert:
+    """Insert into `table`, skipping the rows that conflict with its primary key
+    or a unique index on the dialects that support ON CONFLICT."""
+    if dialect_name == "sqlite":
+        return sqlite.insert(table).on_conflict_do_nothing()
+    elif dialect_name == "postgresql":
+        return postgresql.insert(table).on_conflict_do_nothing()
+    return table.insert()
+
+
+def permissions_table_name(table_name: str) -> str:
+    return f"{table_name}_permissions"
+
+
+def create_permissions_table(table: Table) -> Table:
+    """Create the permissions table for an object table, in the same metadata.
+
+    Every row grants one permission on one object. `verify_key` is empty for
+    permissions that are not bound to a user, like ALL_READ.
+
+    Args:
+        table (Table): The object table.
+
+    Returns:
+        Table: The created permissions table.
+    """
+    table_name = permissions_table_name(table.name)
+    permissions_table = Table(
+        table_name,
+        table.metadata,
+        Column(
+            "object_id",
+            UIDTypeDecorator,
+            sa.ForeignKey(table.c.id, ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        Column("permission", sa.String, primary_key=True),
+        Column("verify_key", sa.String, primary_key=True, default=""),
+    )
+    # permission checks look up all objects a user has a permission on
+    sa.Index(
+        f"ix_{table_name}_lookup",
+        permissions_table.c.verify_key,
+        permissions_table.c.permission,
+        permissions_table.c.object_id,
+    )
+    return permissions_table
+
+
+def get_permissions_table(table: Table) -> Table:
+    return table.metadata.tables[permissions_table_name(table.name)]
+
+
+def split_permission_string(permission_string: str) -> tuple[str, str]:
+    """Split an ActionObjectPermission.permission_string into (permission, verify_key)."""
+    if "_" not in permission_string or permission_string.startswith("ALL_"):
+        return permission_string, ""
+    verify_key, permission = permission_string.split("_", 1)
+    return permission, verify_key
+
+
+def join_permission_string(permission: str, verify_key: str) -> str:
+    """Inverse of `split_permission_string`."""
+    if not verify_key:
+        return permission
+    return f"{verify_key}_{permission}"
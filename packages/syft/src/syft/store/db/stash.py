@@ -1,5 +1,9 @@
 # stdlib
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from datetime import datetime
+from datetime import timezone
 from functools import wraps
 import inspect
 from typing import Any
@@ -14,8 +18,8 @@ from pydantic import ValidationError
 import sqlalchemy as sa
 from sqlalchemy import Row
 from sqlalchemy import Table
-from sqlalchemy import func
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing_extensions import Self
 from typing_extensions import TypeVar
@@ -34,26 +38,41 @@ from ...service.action.action_permissions import ActionPermission
 from ...service.action.action_permissions import StoragePermission
 from ...service.user.user_roles import ServiceRole
 from ...types.errors import SyftException
+from ...types.result import Err
+from ...types.result import Ok
+from ...types.result import Result
 from ...types.result import as_result
 from ...types.syft_metaclass import Empty
 from ...types.syft_object import PartialSyftObject
 from ...types.syft_object import SyftObject
 from ...types.uid import UID
 from ...util.telemetry import instrument
+from ...util.util import get_dev_mode
 from ..document_store_errors import NotFoundException
 from ..document_store_errors import StashException
 from ..document_store_errors import UniqueConstraintException
 from .db import DBManager
 from .query import Query
+from .role_cache import role_cache
 from .schema import PostgresBase
 from .schema import SQLiteBase
 from .schema import create_table
+from .schema import get_permissions_table
+from .schema import insert_ignore_conflicts
+from .schema import join_permission_string
+from .schema import split_permission_string
 from .sqlite import SQLiteDBManager
 
 StashT = TypeVar("StashT", bound=SyftObject)
 T = TypeVar("T")
 P = ParamSpec("P")
 
+# (sort key, id) of the last object of a page, see `ObjectStash.get_page`
+PageCursor = tuple[Any, UID]
+
+# number of rows `ObjectStash.iter_all` fetches from the database at once
+ITER_BATCH_SIZE = 100
+
 
 def parse_filters(filter_dict: dict[str, Any] | None) -> list[tuple[str, str, Any]]:
     # NOTE using django style filters, e.g. {"age__gt": 18}
@@ -71,6 +90,26 @@ def parse_filters(filter_dict: dict[str, Any] | None) -> list[tuple[str, str, An
     return filters
 
 
+def is_unique_violation(error: IntegrityError) -> bool:
+    """True if `error` was raised by a primary key or unique index, not by another
+    constraint like NOT NULL, a foreign key or a trigger."""
+    orig = error.orig
+    # psycopg exposes `sqlstate`, psycopg2 `pgcode`
+    sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    if sqlstate is not None:
+        return sqlstate == "23505"
+    errorname = getattr(orig, "sqlite_errorname", None)
+    if errorname is not None:
+        return errorname in ("SQLITE_CONSTRAINT_UNIQUE", "SQLITE_CONSTRAINT_PRIMARYKEY")
+    return "unique" in str(orig).lower()
+
+
+def utcnow() -> datetime:
+    # naive UTC like the _created_at server default, with microseconds so
+    # updates within the same second get different _updated_at values
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 def with_session(func: Callable[P, T]) -> Callable[P, T]:  # type: ignore
     """
     Decorator to inject a session into the function kwargs if it is not provided.
@@ -85,6 +124,22 @@ def with_session(func: Callable[P, T]) -> Callable[P, T]:  # type: ignore
     sig = inspect.signature(func)
     inject_session: bool = "session" in sig.parameters
 
+    if inspect.isgeneratorfunction(func):
+        # keep the session open until the generator is exhausted or closed
+        @wraps(func)
+        def generator_wrapper(
+            self: "ObjectStash[StashT]", *args: Any, **kwargs: Any
+        ) -> Any:
+            if inject_session and kwargs.get("session") is None:
+                with self.sessionmaker() as session:
+                    with session.begin():
+                        kwargs["session"] = session
+                        yield from func(self, *args, **kwargs)
+                return
+            yield from func(self, *args, **kwargs)
+
+        return generator_wrapper  # type: ignore
+
     @wraps(func)
     def wrapper(self: "ObjectStash[StashT]", *args: Any, **kwargs: Any) -> Any:
         if inject_session and kwargs.get("session") is None:
@@ -105,6 +160,7 @@ class ObjectStash(Generic[StashT]):
         self.db = store
         self.object_type = self.get_object_type()
         self.table = create_table(self.object_type, self.dialect)
+        self.permissions_table = get_permissions_table(self.table)
         self.sessionmaker: Callable[[], Session] = self.db.sessionmaker
 
     @property
@@ -250,11 +306,7 @@ class ObjectStash(Generic[StashT]):
             uid_field_value = UID(field_value)
             return table.c.id == uid_field_value
 
-        json_value = serialize_json(field_value)
-        if self.db.engine.dialect.name == "sqlite":
-            return table.c.fields[field_name] == func.json_quote(json_value)
-        elif self.db.engine.dialect.name == "postgresql":
-            return table.c.fields[field_name].astext == cast(json_value, sa.String)
+        return self.query()._eq_filter(table, field_name, field_value)
 
     @as_result(SyftException, StashException, NotFoundException)
     def get_index(
@@ -280,7 +332,8 @@ class ObjectStash(Generic[StashT]):
 
     def row_as_obj(self, row: Row) -> StashT:
         # TODO make unwrappable serde
-        return deserialize_json(row.fields)
+        # rows are only written by the stash from validated objects
+        return deserialize_json(row.fields, trusted=True)
 
     @with_session
     def get_role(
@@ -297,6 +350,11 @@ class ObjectStash(Generic[StashT]):
             # this happens when we create stashes in tests
             return ServiceRole.GUEST
 
+        role = role_cache.get(self.server_uid, credentials)
+        if role is not None:
+            return role
+        generation = role_cache.generation
+
         try:
             query = self.query(User).filter("verify_key", "eq", credentials)
         except Exception as e:
@@ -304,25 +362,15 @@ class ObjectStash(Generic[StashT]):
             raise e
 
         user = query.execute(session).first()
-        if user is None:
-            return ServiceRole.GUEST
-
-        return self.row_as_obj(user).role
+        role = ServiceRole.GUEST if user is None else self.row_as_obj(user).role
+        role_cache.set(self.server_uid, credentials, role, generation)
+        return role
 
     def _get_permission_filter_from_permisson(
         self,
         permission: ActionObjectPermission,
     ) -> sa.sql.elements.BinaryExpression:
-        permission_string = permission.permission_string
-        compound_permission_string = permission.compound_permission_string
-
-        if self.db.engine.dialect.name == "postgresql":
-            permission_string = [permission_string]  # type: ignore
-            compound_permission_string = [compound_permission_string]  # type: ignore
-        return sa.or_(
-            self.table.c.permissions.contains(permission_string),
-            self.table.c.permissions.contains(compound_permission_string),
-        )
+        return self.query()._make_permissions_clause(permission)
 
     @with_session
     def _apply_permission_filter(
@@ -369,50 +417,180 @@ class ObjectStash(Generic[StashT]):
     ) -> StashT:
         if not self.allow_any_type and not skip_check_type:
             self.check_type(obj, self.object_type).unwrap()
-        uid = obj.id
 
-        # check if the object already exists
-        if self.exists(credentials, uid, session=session) or not self.is_unique(
-            obj, session=session
-        ):
+        # the primary key and the unique indexes on __attr_unique__ reject
+        # duplicates, the insert returns no row when that happens
+        stmt = insert_ignore_conflicts(self.table, self.dialect.name).values(
+            **self._row_values(obj, add_storage_permission)
+        )
+        try:
+            inserted = session.execute(stmt.returning(self.table.c.id)).first()
+        except IntegrityError as e:
+            # dialects without ON CONFLICT support
+            if not is_unique_violation(e):
+                raise StashException(f"Failed to insert {obj}: {e.orig}") from e
+            inserted = None
+
+        if inserted is None:
             if ignore_duplicates:
                 return obj
-            unique_fields_str = ", ".join(self.unique_fields)
-            raise UniqueConstraintException(
-                public_message=f"Duplication Key Error for {obj}.\n"
-                f"The fields that should be unique are {unique_fields_str}."
-            )
+            raise self._duplicate_error(obj)
 
-        permissions = self.get_ownership_permissions(uid, credentials)
+        permissions = self.get_ownership_permissions(obj.id, credentials)
         if add_permissions is not None:
-            add_permission_strings = [p.permission_string for p in add_permissions]
-            permissions.extend(add_permission_strings)
+            permissions.extend(p.permission_string for p in add_permissions)
+        self._insert_permission_rows(
+            self._permission_rows(obj.id, permissions), session=session
+        )
+        return obj
+
+    @as_result(StashException)
+    @with_session
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[StashT],
+        add_storage_permission: bool = True,
+        ignore_duplicates: bool = False,
+        session: Session = None,
+        skip_check_type: bool = False,
+    ) -> list[Result[StashT, StashException]]:
+        """
+        Insert multiple objects with a single multi-row statement.
 
+        Returns a result per object, in the order of `objs`. Objects that already exist
+        or clash on a unique field get an Err(UniqueConstraintException), or Ok
+        if `ignore_duplicates` is set.
+        """
+        results: list[Result[StashT, StashException] | None] = [None] * len(objs)
+        rows = []
+        for idx, obj in enumerate(objs):
+            if not self.allow_any_type and not skip_check_type:
+                type_check = self.check_type(obj, self.object_type)
+                if type_check.is_err():
+                    results[idx] = type_check
+                    continue
+            rows.append(self._row_values(obj, add_storage_permission))
+
+        inserted = self._insert_rows(rows, session=session)
+        permission_rows = [
+            permission_row
+            for uid in inserted
+            for permission_row in self._permission_rows(
+                uid, self.get_ownership_permissions(uid, credentials)
+            )
+        ]
+        self._insert_permission_rows(permission_rows, session=session)
+        for idx, obj in enumerate(objs):
+            if results[idx] is not None:
+                continue
+            if obj.id in inserted or ignore_duplicates:
+                results[idx] = Ok(obj)
+            else:
+                results[idx] = Err(self._duplicate_error(obj))
+        return cast(list[Result[StashT, StashException]], results)
+
+    def _row_values(
+        self, obj: StashT, add_storage_permission: bool
+    ) -> dict[str, Any]:
         storage_permissions = []
         if add_storage_permission:
             storage_permissions.append(
                 self.server_uid.no_dash,
             )
 
-        fields = serialize_json(obj)
+        fields = serialize_json(obj, validate=False)
+        if get_dev_mode():
+            self._check_fields_deserializable(fields)
+
+        return {
+            "id": obj.id,
+            "fields": fields,
+            "storage_permissions": storage_permissions,
+        }
+
+    def _insert_rows(
+        self, rows: list[dict[str, Any]], session: Session
+    ) -> frozenset[UID]:
+        """Insert rows, skipping duplicates. Returns the ids that were inserted."""
+        if not rows:
+            return frozenset()
+
+        if self._is_sqlite() or self.dialect.name == "postgresql":
+            stmt = insert_ignore_conflicts(self.table, self.dialect.name).returning(
+                self.table.c.id
+            )
+            return frozenset(row.id for row in session.execute(stmt, rows))
+
+        # dialects without ON CONFLICT support, isolate each row in a savepoint
+        inserted = set()
+        for row in rows:
+            try:
+                with session.begin_nested():
+                    session.execute(self.table.insert().values(**row))
+                inserted.add(row["id"])
+            except IntegrityError as e:
+                if not is_unique_violation(e):
+                    raise StashException(f"Failed to insert a row: {e.orig}") from e
+        return frozenset(inserted)
+
+    def _duplicate_error(self, obj: StashT) -> UniqueConstraintException:
+        unique_fields_str = ", ".join(self.unique_fields)
+        return UniqueConstraintException(
+            public_message=f"Duplication Key Error for {obj}.\n"
+            f"The fields that should be unique are {unique_fields_str}."
+        )
+
+    def _permission_rows(
+        self, uid: UID, permission_strings: Iterable[str]
+    ) -> list[dict[str, Any]]:
+        rows = []
+        for permission_string in permission_strings:
+            permission, verify_key = split_permission_string(permission_string)
+            rows.append(
+                {"object_id": uid, "permission": permission, "verify_key": verify_key}
+            )
+        return rows
+
+    def _insert_permission_rows(
+        self, rows: list[dict[str, Any]], session: Session
+    ) -> None:
+        """Grant permissions, permissions that already exist are skipped."""
+        if not rows:
+            return None
+
+        if self._is_sqlite() or self.dialect.name == "postgresql":
+            stmt = insert_ignore_conflicts(self.permissions_table, self.dialect.name)
+            session.execute(stmt, rows)
+            return None
+
+        for row in rows:
+            try:
+                with session.begin_nested():
+                    session.execute(self.permissions_table.insert().values(**row))
+            except IntegrityError as e:
+                if not is_unique_violation(e):
+                    raise StashException(f"Failed to add permission: {e.orig}") from e
+        return None
+
+    def _delete_permission_rows(self, uids: Iterable[UID], session: Session) -> None:
+        # SQLite does not enforce the ON DELETE CASCADE of the foreign key
+        uids = list(uids)
+        if uids:
+            stmt = self.permissions_table.delete().where(
+                self.permissions_table.c.object_id.in_(uids)
+            )
+            session.execute(stmt)
+
+    def _check_fields_deserializable(self, fields: dict) -> None:
+        # TODO: Ideally, we want to make sure we don't serialize what we cannot deserialize
+        #       and remove this check. Only runs in dev mode, as it deserializes every write.
         try:
-            # check if the fields are deserializable
-            # TODO: Ideally, we want to make sure we don't serialize what we cannot deserialize
-            #       and remove this check.
             deserialize_json(fields)
         except Exception as e:
             raise StashException(
                 f"Error serializing object: {e}. Some fields are invalid."
             )
-        # create the object with the permissions
-        stmt = self.table.insert().values(
-            id=uid,
-            fields=fields,
-            permissions=permissions,
-            storage_permissions=storage_permissions,
-        )
-        session.execute(stmt)
-        return self.get_by_uid(credentials, uid, session=session).unwrap()
 
     @as_result(ValidationError, AttributeError)
     def apply_partial_update(
@@ -464,12 +642,6 @@ class ObjectStash(Generic[StashT]):
                 original_obj=original_obj, update_obj=obj
             ).unwrap()
 
-        # TODO has_permission is not used
-        if not self.is_unique(obj, session=session):
-            raise UniqueConstraintException(
-                f"Some fields are not unique for {type(obj).__name__} and unique fields {self.unique_fields}"
-            )
-
         stmt = self.table.update().where(self._get_field_filter("id", obj.id))
         stmt = self._apply_permission_filter(
             stmt,
@@ -478,20 +650,112 @@ class ObjectStash(Generic[StashT]):
             has_permission=has_permission,
             session=session,
         )
-        fields = serialize_json(obj)
+        fields = serialize_json(obj, validate=False)
+        if get_dev_mode():
+            self._check_fields_deserializable(fields)
+
+        stmt = stmt.values(fields=fields, _updated_at=utcnow())
         try:
-            deserialize_json(fields)
-        except Exception as e:
-            raise StashException(
-                f"Error serializing object: {e}. Some fields are invalid."
+            result = session.execute(stmt)
+        except IntegrityError as e:
+            if not is_unique_violation(e):
+                raise StashException(f"Failed to update {obj}: {e.orig}") from e
+            raise UniqueConstraintException(
+                f"Some fields are not unique for {type(obj).__name__} and unique fields {self.unique_fields}"
             )
-        stmt = stmt.values(fields=fields)
-        result = session.execute(stmt)
         if result.rowcount == 0:
             raise NotFoundException(
                 f"{self.object_type.__name__}: {obj.id} not found or no permission to update."
             )
-        return self.get_by_uid(credentials, obj.id, session=session).unwrap()
+        return obj
+
+    @as_result(StashException)
+    @with_session
+    def update_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[StashT],
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> list[Result[StashT, StashException | NotFoundException]]:
+        """
+        Update multiple objects with a single executemany statement.
+
+        Returns a result per object, in the order of `objs`. Objects that don't exist or
+        can't be written with `credentials` get an Err(NotFoundException), objects that
+        clash on a unique field an Err(UniqueConstraintException).
+        """
+        results: list[Result | None] = [None] * len(objs)
+
+        pending = []
+        for idx, obj in enumerate(objs):
+            if isinstance(obj, PartialSyftObject):
+                # partial updates need the stored object
+                results[idx] = self.update(
+                    credentials, obj, has_permission=has_permission, session=session
+                )
+            else:
+                pending.append(idx)
+
+        stmt = select(self.table.c.id).where(
+            self.table.c.id.in_([objs[idx].id for idx in pending])
+        )
+        stmt = self._apply_permission_filter(
+            stmt,
+            credentials=credentials,
+            permission=ActionPermission.WRITE,
+            has_permission=has_permission,
+            session=session,
+        )
+        writable = set(session.execute(stmt).scalars())
+
+        params = {}
+        for idx in pending:
+            obj = objs[idx]
+            if obj.id not in writable:
+                results[idx] = Err(
+                    NotFoundException(
+                        f"{self.object_type.__name__}: {obj.id} not found or no permission to update."
+                    )
+                )
+                continue
+            fields = serialize_json(obj, validate=False)
+            if get_dev_mode():
+                self._check_fields_deserializable(fields)
+            params[idx] = {"b_id": obj.id, "b_fields": fields}
+
+        stmt = (
+            self.table.update()
+            .where(self.table.c.id == sa.bindparam("b_id"))
+            .values(fields=sa.bindparam("b_fields"), _updated_at=utcnow())
+        )
+        try:
+            if params:
+                with session.begin_nested():
+                    session.execute(stmt, list(params.values()))
+            for idx in params:
+                results[idx] = Ok(objs[idx])
+        except IntegrityError as e:
+            if not is_unique_violation(e):
+                raise StashException(f"Failed to update objects: {e.orig}") from e
+            # find the objects that clash on a unique field
+            for idx, param in params.items():
+                try:
+                    with session.begin_nested():
+                        session.execute(stmt, [param])
+                    results[idx] = Ok(objs[idx])
+                except IntegrityError as e:
+                    if not is_unique_violation(e):
+                        raise StashException(
+                            f"Failed to update {objs[idx]}: {e.orig}"
+                        ) from e
+                    obj_type = type(objs[idx]).__name__
+                    results[idx] = Err(
+                        UniqueConstraintException(
+                            f"Some fields are not unique for {obj_type} and unique fields {self.unique_fields}"
+                        )
+                    )
+        return cast(list[Result[StashT, StashException | NotFoundException]], results)
 
     @as_result(StashException, NotFoundException)
     @with_session
@@ -515,8 +779,58 @@ class ObjectStash(Generic[StashT]):
             raise NotFoundException(
                 f"{self.object_type.__name__}: {uid} not found or no permission to delete."
             )
+        self._delete_permission_rows([uid], session=session)
         return uid
 
+    @as_result(StashException)
+    @with_session
+    def delete_many(
+        self,
+        credentials: SyftVerifyKey,
+        uids: list[UID],
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> list[Result[UID, NotFoundException]]:
+        """
+        Delete multiple objects with a single statement.
+
+        Returns a result per uid, in the order of `uids`. Objects that don't exist or
+        can't be deleted with `credentials` get an Err(NotFoundException).
+        """
+        stmt = self.table.delete().where(self.table.c.id.in_(uids))
+        stmt = self._apply_permission_filter(
+            stmt,
+            credentials=credentials,
+            permission=ActionPermission.WRITE,
+            has_permission=has_permission,
+            session=session,
+        )
+        if self.dialect.delete_returning:
+            deleted = set(session.execute(stmt.returning(self.table.c.id)).scalars())
+        else:
+            select_stmt = select(self.table.c.id).where(self.table.c.id.in_(uids))
+            select_stmt = self._apply_permission_filter(
+                select_stmt,
+                credentials=credentials,
+                permission=ActionPermission.WRITE,
+                has_permission=has_permission,
+                session=session,
+            )
+            deleted = set(session.execute(select_stmt).scalars())
+            session.execute(stmt)
+        self._delete_permission_rows(deleted, session=session)
+
+        return [
+            Ok(uid)
+            if uid in deleted
+            else Err(
+                NotFoundException(
+                    f"{self.object_type.__name__}: {uid} not found or no permission to delete."
+                )
+            )
+            for uid in uids
+        ]
+
     @as_result(StashException)
     @with_session
     def get_one(
@@ -616,6 +930,161 @@ class ObjectStash(Generic[StashT]):
         result = query.execute(session).all()
         return [self.row_as_obj(row) for row in result]
 
+    @as_result(StashException)
+    @with_session
+    def count(
+        self,
+        credentials: SyftVerifyKey,
+        filters: dict[str, Any] | None = None,
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> int:
+        """Count the objects `get_all` would return, without loading them."""
+        query = self.query()
+
+        if not has_permission:
+            role = self.get_role(credentials, session=session)
+            query = query.with_permissions(credentials, role)
+
+        for field_name, operator, field_value in parse_filters(filters):
+            query = query.filter(field_name, operator, field_value)
+
+        stmt = query.stmt.with_only_columns(self.table.c.id)
+        stmt = sa.select(sa.func.count()).select_from(stmt.subquery())
+        return session.execute(stmt).scalar_one()
+
+    @as_result(StashException)
+    @with_session
+    def get_page(
+        self,
+        credentials: SyftVerifyKey,
+        filters: dict[str, Any] | None = None,
+        has_permission: bool = False,
+        order_by: str | None = None,
+        sort_order: str | None = None,
+        limit: int = 100,
+        after: PageCursor | None = None,
+        session: Session = None,
+    ) -> tuple[list[StashT], PageCursor | None]:
+        """
+        Get a page of objects from the stash, starting after a cursor.
+
+        Unlike `get_all` with an offset, the database does not read the objects of
+        the previous pages, so every page is as fast as the first one.
+
+        Args:
+            credentials (SyftVerifyKey): credentials of the user
+            filters (dict[str, Any] | None, optional): dictionary of filters, like in `get_all`.
+                Defaults to None.
+            has_permission (bool, optional): If True, overrides the permission check.
+                Defaults to False.
+            order_by (str | None, optional): If provided, the results will be ordered by this field.
+                If not provided, the default order and field defined on the SyftObject.__order_by__ are used.
+                Defaults to None.
+            sort_order (str | None, optional): "asc" or "desc" If not defined,
+                the default order defined on the SyftObject.__order_by__ is used.
+                Defaults to None.
+            limit (int, optional): maximum number of objects in the page. Defaults to 100.
+            after (PageCursor | None, optional): cursor returned with the previous page,
+                None for the first page. Defaults to None.
+
+        Returns:
+            tuple[list[StashT], PageCursor | None]: the objects, and the cursor of the
+                next page or None if this is the last page.
+        """
+        query = self.query()
+
+        if not has_permission:
+            role = self.get_role(credentials, session=session)
+            query = query.with_permissions(credentials, role)
+
+        for field_name, operator, field_value in parse_filters(filters):
+            query = query.filter(field_name, operator, field_value)
+
+        # one more row tells if there is a next page
+        query = query.keyset(order_by, sort_order, after=after).limit(limit + 1)
+        rows = query.execute(session).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = (rows[-1].sort_key, rows[-1].id)
+        return [self.row_as_obj(row) for row in rows], next_cursor
+
+    @with_session
+    def iter_all(
+        self,
+        credentials: SyftVerifyKey,
+        filters: dict[str, Any] | None = None,
+        has_permission: bool = False,
+        order_by: str | None = None,
+        sort_order: str | None = None,
+        batch_size: int = ITER_BATCH_SIZE,
+        session: Session = None,
+    ) -> Iterator[StashT]:
+        """
+        Iterate over the objects in the stash, optionally filtered, without loading
+        them all in memory. Arguments are the same as for `get_all`.
+
+        The rows are fetched `batch_size` at a time, in a single query. The session
+        stays open until the iterator is exhausted or closed.
+        """
+        query = self.query()
+
+        if not has_permission:
+            role = self.get_role(credentials, session=session)
+            query = query.with_permissions(credentials, role)
+
+        for field_name, operator, field_value in parse_filters(filters):
+            query = query.filter(field_name, operator, field_value)
+
+        query = query.order_by(order_by, sort_order)
+        query.stmt = query.stmt.execution_options(yield_per=batch_size)
+        for row in query.execute(session):
+            yield self.row_as_obj(row)
+
+    @as_result(StashException)
+    @with_session
+    def get_all_ids(
+        self,
+        credentials: SyftVerifyKey,
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> list[UID]:
+        """Get the ids of all objects the user can read, without loading the objects."""
+        query = self.query()
+
+        if not has_permission:
+            role = self.get_role(credentials, session=session)
+            query = query.with_permissions(credentials, role)
+
+        query.stmt = query.stmt.with_only_columns(self.table.c.id)
+        return list(query.execute(session).scalars())
+
+    @as_result(StashException)
+    @with_session
+    def get_all_update_times(
+        self,
+        credentials: SyftVerifyKey,
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> dict[UID, datetime | None]:
+        """Get when each object the user can read was last updated, None if never.
+
+        Changes when an object is added, updated or deleted, without loading the
+        objects.
+        """
+        query = self.query()
+
+        if not has_permission:
+            role = self.get_role(credentials, session=session)
+            query = query.with_permissions(credentials, role)
+
+        query.stmt = query.stmt.with_only_columns(
+            self.table.c.id, self.table.c._updated_at
+        )
+        return {uid: updated_at for uid, updated_at in query.execute(session)}
+
     # PERMISSIONS
     def get_ownership_permissions(
         self, uid: UID, credentials: SyftVerifyKey
@@ -635,20 +1104,9 @@ class ObjectStash(Generic[StashT]):
         session: Session = None,
         ignore_missing: bool = False,
     ) -> None:
-        try:
-            existing_permissions = self._get_permissions_for_uid(
-                permission.uid, session=session
-            ).unwrap()
-        except NotFoundException:
-            if ignore_missing:
-                return None
-            raise
-
-        existing_permissions.add(permission.permission_string)
-
-        stmt = self.table.update().where(self.table.c.id == permission.uid)
-        stmt = stmt.values(permissions=list(existing_permissions))
-        session.execute(stmt)
+        self.add_permissions(
+            [permission], ignore_missing=ignore_missing, session=session
+        ).unwrap()
         return None
 
     @as_result(NotFoundException)
@@ -659,28 +1117,67 @@ class ObjectStash(Generic[StashT]):
         ignore_missing: bool = False,
         session: Session = None,
     ) -> None:
-        for permission in permissions:
-            self.add_permission(
-                permission, session=session, ignore_missing=ignore_missing
-            ).unwrap()
+        results = self.add_permissions_many(
+            permissions, ignore_missing=ignore_missing, session=session
+        ).unwrap()
+        for result in results:
+            result.unwrap()
         return None
 
+    @as_result(StashException)
+    @with_session
+    def add_permissions_many(
+        self,
+        permissions: list[ActionObjectPermission],
+        ignore_missing: bool = False,
+        session: Session = None,
+    ) -> list[Result[ActionObjectPermission, NotFoundException]]:
+        """
+        Add permissions to multiple objects with a single insert into the permissions table.
+
+        Returns a result per permission, in the order of `permissions`. Permissions for
+        objects that don't exist get an Err(NotFoundException), unless `ignore_missing`
+        is set.
+        """
+        uids = {permission.uid for permission in permissions}
+        stmt = select(self.table.c.id).where(self.table.c.id.in_(uids))
+        existing = set(session.execute(stmt).scalars())
+
+        results: list[Result[ActionObjectPermission, NotFoundException]] = []
+        rows = []
+        for permission in permissions:
+            if permission.uid in existing:
+                rows.extend(
+                    self._permission_rows(
+                        permission.uid, [permission.permission_string]
+                    )
+                )
+                results.append(Ok(permission))
+            elif ignore_missing:
+                results.append(Ok(permission))
+            else:
+                results.append(
+                    Err(
+                        NotFoundException(
+                            f"No permissions found for uid: {permission.uid}"
+                        )
+                    )
+                )
+
+        self._insert_permission_rows(rows, session=session)
+        return results
+
     @with_session
     def remove_permission(
         self, permission: ActionObjectPermission, session: Session = None
     ) -> None:
-        # TODO not threadsafe
-        try:
-            permissions = self._get_permissions_for_uid(permission.uid).unwrap()
-            permissions.remove(permission.permission_string)
-        except (NotFoundException, KeyError):
-            # TODO add error handling to permissions
-            return None
-
-        stmt = (
-            self.table.update()
-            .where(self.table.c.id == permission.uid)
-            .values(permissions=list(permissions))
+        permission_name, verify_key = split_permission_string(
+            permission.permission_string
+        )
+        stmt = self.permissions_table.delete().where(
+            self.permissions_table.c.object_id == permission.uid,
+            self.permissions_table.c.permission == permission_name,
+            self.permissions_table.c.verify_key == verify_key,
         )
         session.execute(stmt)
         return None
@@ -700,39 +1197,75 @@ class ObjectStash(Generic[StashT]):
     def has_permissions(
         self, permissions: list[ActionObjectPermission], session: Session = None
     ) -> bool:
-        # TODO: we should use a permissions table to check all permissions at once
+        if not permissions:
+            return False
 
         permission_filters = [
-            sa.and_(
-                self._get_field_filter("id", p.uid),
-                self._get_permission_filter_from_permisson(permission=p),
-            )
-            for p in permissions
+            self._permission_exists(permission) for permission in permissions
         ]
-
-        stmt = self.table.select().where(
-            sa.and_(
-                *permission_filters,
-            ),
+        stmt = select(sa.and_(*permission_filters))
+        return bool(session.execute(stmt).scalar())
+
+    def _permission_exists(
+        self, permission: ActionObjectPermission
+    ) -> sa.sql.elements.ColumnElement:
+        # looks up a single object, so the primary key index is used
+        permission_name, verify_key = split_permission_string(
+            permission.permission_string
+        )
+        permissions_table = self.permissions_table
+        return (
+            select(permissions_table.c.object_id)
+            .where(
+                permissions_table.c.object_id == permission.uid,
+                sa.or_(
+                    sa.and_(
+                        permissions_table.c.verify_key == verify_key,
+                        permissions_table.c.permission == permission_name,
+                    ),
+                    sa.and_(
+                        permissions_table.c.verify_key == "",
+                        permissions_table.c.permission
+                        == permission.compound_permission_string,
+                    ),
+                ),
+            )
+            .exists()
         )
-        result = session.execute(stmt).first()
-        return result is not None
 
     @as_result(StashException)
     @with_session
     def _get_permissions_for_uid(self, uid: UID, session: Session = None) -> Set[str]:  # noqa: UP006
-        stmt = select(self.table.c.permissions).where(self.table.c.id == uid)
-        result = session.execute(stmt).scalar_one_or_none()
-        if result is None:
+        stmt = select(self.table.c.id).where(self.table.c.id == uid)
+        if session.execute(stmt).first() is None:
             raise NotFoundException(f"No permissions found for uid: {uid}")
-        return set(result)
+
+        stmt = select(
+            self.permissions_table.c.permission, self.permissions_table.c.verify_key
+        ).where(self.permissions_table.c.object_id == uid)
+        return {
+            join_permission_string(row.permission, row.verify_key)
+            for row in session.execute(stmt)
+        }
 
     @as_result(StashException)
     @with_session
     def get_all_permissions(self, session: Session = None) -> dict[UID, Set[str]]:  # noqa: UP006
-        stmt = select(self.table.c.id, self.table.c.permissions)
-        results = session.execute(stmt).all()
-        return {UID(row.id): set(row.permissions) for row in results}
+        permissions: dict[UID, Set[str]] = {  # noqa: UP006
+            UID(uid): set() for uid in session.execute(select(self.table.c.id)).scalars()
+        }
+        stmt = select(
+            self.permissions_table.c.object_id,
+            self.permissions_table.c.permission,
+            self.permissions_table.c.verify_key,
+        )
+        for row in session.execute(stmt):
+            uid = UID(row.object_id)
+            if uid in permissions:
+                permissions[uid].add(
+                    join_permission_string(row.permission, row.verify_key)
+                )
+        return permissions
 
     # STORAGE PERMISSIONS
     @with_session
@@ -872,7 +1405,48 @@ class ObjectStash(Generic[StashT]):
                 obj=obj,
                 session=session,
             ).unwrap()
-        except UniqueConstraintException:
-            return self.update(
-                credentials=credentials, obj=obj, session=session
-            ).unwrap()
+        except UniqueConstraintException as e:
+            try:
+                return self.update(
+                    credentials=credentials, obj=obj, session=session
+                ).unwrap()
+            except NotFoundException:
+                # the insert conflicted on a unique field of another object
+                raise e
+
+    @as_result(StashException)
+    @with_session
+    def upsert_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[StashT],
+        add_storage_permission: bool = True,
+        session: Session = None,
+    ) -> list[Result[StashT, StashException]]:
+        """
+        Insert multiple objects, updating the ones that already exist. Uses one insert
+        statement and one update statement for the whole batch.
+
+        Returns a result per object, in the order of `objs`.
+        """
+        results = self.set_many(
+            credentials,
+            objs,
+            add_storage_permission=add_storage_permission,
+            session=session,
+        ).unwrap()
+
+        conflicts = [
+            idx
+            for idx, result in enumerate(results)
+            if isinstance(result.err(), UniqueConstraintException)
+        ]
+        update_results = self.update_many(
+            credentials, [objs[idx] for idx in conflicts], session=session
+        ).unwrap()
+        for idx, update_result in zip(conflicts, update_results):
+            # NotFoundException means the insert conflicted on a unique field
+            # of another object, keep the insert error
+            if not isinstance(update_result.err(), NotFoundException):
+                results[idx] = update_result
+        return results
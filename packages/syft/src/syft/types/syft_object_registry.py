@@ -17,6 +17,8 @@ class SyftObjectRegistry:
     __object_transform_registry__: dict[str, Callable] = {}
     __object_serialization_registry__: dict[str, dict[int, tuple]] = {}
     __type_to_canonical_name__: dict[type, tuple[str, int]] = {}
+    # compiled serde plans, keyed on (canonical_name, version, for_hashing)
+    __serde_plan_registry__: dict[tuple[str, int, bool], Any] = {}
 
     @classmethod
     def register_cls(
@@ -30,6 +32,24 @@ class SyftObjectRegistry:
 
         cls.__type_to_canonical_name__[serde_attributes[7]] = (canonical_name, version)
 
+        # plans compiled for a previous registration are stale now
+        for for_hashing in (False, True):
+            cls.__serde_plan_registry__.pop(
+                (canonical_name, version, for_hashing), None
+            )
+
+    @classmethod
+    def get_serde_plan(
+        cls, canonical_name: str, version: int, for_hashing: bool
+    ) -> Any | None:
+        return cls.__serde_plan_registry__.get((canonical_name, version, for_hashing))
+
+    @classmethod
+    def register_serde_plan(
+        cls, canonical_name: str, version: int, for_hashing: bool, plan: Any
+    ) -> None:
+        cls.__serde_plan_registry__[(canonical_name, version, for_hashing)] = plan
+
     @classmethod
     def get_versions(cls, canonical_name: str) -> list[int]:
         available_versions: dict = cls.__object_serialization_registry__.get(
@@ -70,3 +70,25 @@ def test_api_cache_invalidation_login(root_verify_key, worker):
     guest_client = guest_client.login(email="a@b.org", password="aaa")
 
     assert guest_client.upload_dataset(dataset)
+
+
+def test_serialized_api_cache(worker):
+    root_client = worker.root_client
+    verify_key = root_client.credentials.verify_key
+    protocol = worker.current_protocol
+
+    api_bytes, etag = worker.get_serialized_api(verify_key, protocol)
+    cached_bytes, cached_etag = worker.get_serialized_api(verify_key, protocol)
+    assert cached_bytes is api_bytes
+    assert cached_etag == etag
+
+    @sy.syft_function()
+    def my_func():
+        return 1
+
+    assert root_client.code.submit(my_func)
+
+    # new user code changes the API of the user
+    api_bytes, new_etag = worker.get_serialized_api(verify_key, protocol)
+    assert new_etag != etag
+    assert cached_bytes is not api_bytes
@@ -1,3 +1,12 @@
+# stdlib
+import asyncio
+
+# syft absolute
+from syft.client.client import HTTPConnection
+from syft.client.client import HTTPTransportConfig
+from syft.types.uid import UID
+
+
 def test_client_logged_in_user(worker):
     guest_client = worker.guest_client
     assert guest_client.logged_in_user == ""
@@ -15,3 +24,26 @@ def test_client_logged_in_user(worker):
     client = client.login(email="sheldon@caltech.edu", password="bazinga")
 
     assert client.logged_in_user == "sheldon@caltech.edu"
+
+
+def test_http_connection_reuses_pooled_session(monkeypatch):
+    monkeypatch.setattr(
+        HTTPConnection, "transport_config", HTTPTransportConfig(pool_size=32)
+    )
+    connection = HTTPConnection(url="http://localhost:8080")
+
+    session = connection.session
+    assert connection.session is session
+    assert session.get_adapter("http://localhost:8080")._pool_maxsize == 32
+    assert connection.with_proxy(UID()).session is session
+
+
+def test_remote_function_call_async(worker):
+    client = worker.root_client
+
+    async def get_users():
+        get_current_user = client.api.services.user.get_current_user
+        return await asyncio.gather(*[get_current_user.call_async() for _ in range(3)])
+
+    users = asyncio.run(get_users())
+    assert [user.email for user in users] == [client.logged_in_user] * 3
@@ -56,3 +56,23 @@ def test_nested_hashing():
     )
 
     assert obj1.hash() == obj2.hash()
+
+
+def test_hash_after_nested_mutation():
+    obj = MockWrapper(id=str(uuid4()), data=MockObject(key="key", value="value"))
+    digest = obj.hash()
+    before = hash(obj)
+
+    obj.data.value = "other"
+
+    assert obj.hash() != digest
+    assert hash(obj) != before
+
+
+def test_hash_does_not_extend_exclude_attrs():
+    obj = MockObject(key="key", value="value")
+    obj.hash()
+    obj.hash()
+
+    assert MockObject.__hash_exclude_attrs__ == ["flag"]
+    assert SyftHashableObject.__hash_exclude_attrs__ == []
@@ -191,7 +191,9 @@ def test_get_all_by_verify_key_for_status(
         )
 
 
-def test_update_notification_status(root_verify_key, document_store: DBManager) -> None:
+def test_update_notification_status(
+    root_verify_key, monkeypatch: MonkeyPatch, document_store: DBManager
+) -> None:
     random_uid = UID()
     random_verify_key = SyftSigningKey.generate().verify_key
     test_stash = NotificationStash(store=document_store)
@@ -219,6 +221,8 @@ def test_update_notification_status(root_verify_key, document_store: DBManager)
     result = response2.ok()
     assert result.status == NotificationStatus.READ
 
+    # invalid fields are only rejected on write in dev mode
+    monkeypatch.setenv("DEV_MODE", "True")
     notification_expiry_status_auto = NotificationExpiryStatus(0)
     with pytest.raises(SyftException) as exc:
         test_stash.update_notification_status(
@@ -2,11 +2,15 @@
 
 # syft absolute
 from syft.client.client import SyftClient
+from syft.serde.json_serde import serialize_json
 from syft.server.credentials import SyftVerifyKey
 from syft.service.context import AuthedServiceContext
+from syft.service.request.request import ChangeStatus
 from syft.service.request.request import Request
+from syft.service.request.request import RequestStatus
 from syft.service.request.request import SubmitRequest
 from syft.service.request.request_stash import RequestStash
+from syft.types.uid import UID
 
 
 def test_requeststash_get_all_for_verify_key_no_requests(
@@ -67,3 +71,67 @@ def test_requeststash_get_all_for_verify_key_success(
         requests.ok()[1] == stash_set_result_2.ok()
         or requests.ok()[0] == stash_set_result_2.ok()
     )
+
+
+def test_requeststash_get_all_by_history_status(
+    root_verify_key,
+    request_stash: RequestStash,
+    authed_context_guest_datasite_client: AuthedServiceContext,
+) -> None:
+    pending = SubmitRequest(changes=[]).to(
+        Request, context=authed_context_guest_datasite_client
+    )
+    rejected = SubmitRequest(changes=[]).to(
+        Request, context=authed_context_guest_datasite_client
+    )
+    rejected.history.append(ChangeStatus(change_id=UID(), applied=False))
+    assert rejected.history_status == RequestStatus.REJECTED
+    request_stash.set(root_verify_key, pending).unwrap()
+    request_stash.set(root_verify_key, rejected).unwrap()
+
+    def get_ids(status: RequestStatus) -> set[UID]:
+        requests = request_stash.get_all_by_history_status(
+            root_verify_key, status
+        ).unwrap()
+        return {request.id for request in requests}
+
+    # pending requests can still get their status from the code status
+    assert get_ids(RequestStatus.PENDING) == {pending.id}
+    assert get_ids(RequestStatus.APPROVED) == {pending.id}
+    assert get_ids(RequestStatus.REJECTED) == {pending.id, rejected.id}
+
+
+def test_requeststash_get_all_by_history_status_not_stored(
+    root_verify_key,
+    request_stash: RequestStash,
+    authed_context_guest_datasite_client: AuthedServiceContext,
+) -> None:
+    pending = SubmitRequest(changes=[]).to(
+        Request, context=authed_context_guest_datasite_client
+    )
+    rejected = SubmitRequest(changes=[]).to(
+        Request, context=authed_context_guest_datasite_client
+    )
+    rejected.history.append(ChangeStatus(change_id=UID(), applied=False))
+    request_stash.set(root_verify_key, pending).unwrap()
+    request_stash.set(root_verify_key, rejected).unwrap()
+
+    # requests stored before history_status was stored don't have the field
+    table = request_stash.table
+    with request_stash.sessionmaker() as session, session.begin():
+        for request in (pending, rejected):
+            fields = serialize_json(request)
+            del fields["history_status"]
+            session.execute(
+                table.update().where(table.c.id == request.id).values(fields=fields)
+            )
+
+    def get_ids(status: RequestStatus) -> set[UID]:
+        requests = request_stash.get_all_by_history_status(
+            root_verify_key, status
+        ).unwrap()
+        return {request.id for request in requests}
+
+    assert get_ids(RequestStatus.PENDING) == {pending.id}
+    assert get_ids(RequestStatus.APPROVED) == {pending.id}
+    assert get_ids(RequestStatus.REJECTED) == {pending.id, rejected.id}
@@ -0,0 +1,178 @@
+# stdlib
+import asyncio
+import base64
+from collections.abc import AsyncGenerator
+from collections.abc import Callable
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+
+# third party
+from fastapi import APIRouter
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+from starlette.requests import ClientDisconnect
+
+# syft absolute
+import syft as sy
+from syft.server.routes import iter_queue
+from syft.server.routes import make_routes
+from syft.server.routes import routes_lifespan
+from syft.types.uid import UID
+
+
+def consume_in_thread(chunks: list) -> list[bytes]:
+    async def run() -> list[bytes]:
+        loop = asyncio.get_running_loop()
+        # a queue of one chunk, so every put waits for the thread to read
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        consumer = loop.run_in_executor(None, lambda: list(iter_queue(queue, loop)))
+        for chunk in chunks:
+            await queue.put(chunk)
+        return await consumer
+
+    return asyncio.run(run())
+
+
+def test_iter_queue_forwards_chunks_in_order() -> None:
+    assert consume_in_thread([b"a", b"b", b"c", None]) == [b"a", b"b", b"c"]
+
+
+def test_iter_queue_aborts_on_exception() -> None:
+    with pytest.raises(ConnectionAbortedError):
+        consume_in_thread([b"a", ConnectionAbortedError()])
+
+
+class MockPeerConnection:
+    def __init__(self) -> None:
+        self.uploaded: list[bytes] = []
+        self.errors: list[BaseException] = []
+
+    def to_blob_route(self, path: str) -> SimpleNamespace:
+        return SimpleNamespace(path=path)
+
+    def _make_put(
+        self, path: str, data: Iterator[bytes], stream: bool = False
+    ) -> SimpleNamespace:
+        try:
+            for chunk in data:
+                self.uploaded.append(chunk)
+        except ConnectionAbortedError as e:
+            self.errors.append(e)
+            raise
+        return SimpleNamespace(content=b"".join(self.uploaded), headers={})
+
+
+def mock_worker(handle_api_call: Callable | None = None) -> SimpleNamespace:
+    peer = SimpleNamespace(pick_highest_priority_route=lambda: None)
+    network_stash = SimpleNamespace(
+        get_by_uid=lambda *args: SimpleNamespace(unwrap=lambda: peer)
+    )
+    return SimpleNamespace(
+        verify_key=None,
+        network=SimpleNamespace(stash=network_stash),
+        handle_api_call=handle_api_call,
+    )
+
+
+@pytest.fixture
+def peer_connection(monkeypatch: pytest.MonkeyPatch) -> MockPeerConnection:
+    connection = MockPeerConnection()
+    monkeypatch.setattr(
+        "syft.service.network.server_peer.route_to_connection",
+        lambda route: connection,
+    )
+    return connection
+
+
+def stream_path() -> str:
+    url_path = base64.urlsafe_b64encode(b"blob/upload").decode()
+    return f"/stream/{UID()}/{url_path}/"
+
+
+def get_endpoint(router: APIRouter, path: str, method: str) -> Callable:
+    for route in router.routes:
+        if route.path == path and method in route.methods:
+            return route.endpoint
+    raise KeyError(path)
+
+
+def make_app(worker: SimpleNamespace) -> FastAPI:
+    app = FastAPI(lifespan=routes_lifespan)
+    app.include_router(make_routes(worker))
+    return app
+
+
+def test_api_call_route() -> None:
+    def handle_api_call(api_call: Any) -> dict:
+        return {"echo": api_call}
+
+    app = make_app(mock_worker(handle_api_call))
+    with TestClient(app) as client:
+        response = client.post(
+            "/api_call", content=sy.serialize("hello", to_bytes=True)
+        )
+
+    assert response.status_code == 200
+    assert sy.deserialize(response.content, from_bytes=True) == {"echo": "hello"}
+    assert app.state.api_call_executor._shutdown
+    assert app.state.upload_executor._shutdown
+
+
+def test_api_call_route_chunked_body() -> None:
+    def handle_api_call(api_call: Any) -> dict:
+        return {"echo": api_call}
+
+    data = sy.serialize(list(range(1000)), to_bytes=True)
+    # chunks that split the segment table and the segments
+    chunks = [data[i : i + 7] for i in range(0, len(data), 7)]
+
+    with TestClient(make_app(mock_worker(handle_api_call))) as client:
+        response = client.post("/api_call", content=iter(chunks))
+
+    assert response.status_code == 200
+    assert sy.deserialize(response.content, from_bytes=True) == {
+        "echo": list(range(1000))
+    }
+
+
+def test_stream_upload_forwards_chunks(peer_connection: MockPeerConnection) -> None:
+    chunks = [b"a" * 1024, b"b" * 1024, b"c"]
+
+    with TestClient(make_app(mock_worker())) as client:
+        response = client.put(stream_path(), content=iter(chunks))
+
+    assert response.status_code == 200
+    assert response.content == b"".join(chunks)
+    assert b"".join(peer_connection.uploaded) == b"".join(chunks)
+    assert peer_connection.errors == []
+
+
+def test_stream_upload_client_disconnect(
+    peer_connection: MockPeerConnection,
+) -> None:
+    app = FastAPI()
+
+    class DisconnectingRequest:
+        def __init__(self) -> None:
+            self.app = app
+
+        async def stream(self) -> AsyncGenerator[bytes, None]:
+            yield b"a"
+            raise ClientDisconnect()
+
+    router = make_routes(mock_worker())
+    stream_upload = get_endpoint(router, "/stream/{peer_uid}/{url_path}/", "PUT")
+    _, _, peer_uid, url_path, _ = stream_path().split("/")
+
+    async def upload() -> None:
+        async with routes_lifespan(app):
+            await stream_upload(peer_uid, url_path, DisconnectingRequest())
+
+    with pytest.raises(ClientDisconnect):
+        asyncio.run(upload())
+
+    # the forwarded upload was aborted and waited for before the handler returned
+    assert peer_connection.uploaded == [b"a"]
+    assert len(peer_connection.errors) == 1
@@ -0,0 +1,89 @@
+# stdlib
+from enum import Enum
+import json
+import math
+
+# syft absolute
+from syft.serde.json_serde import deserialize_json
+from syft.serde.json_serde import get_json_model_codec
+from syft.serde.json_serde import json_dumps
+from syft.serde.json_serde import json_loads
+from syft.serde.json_serde import serialize_json
+from syft.serde.serializable import serializable
+from syft.types.syft_object import SYFT_OBJECT_VERSION_1
+from syft.types.syft_object import SyftObject
+from syft.types.uid import UID
+
+
+@serializable(canonical_name="JSONMockEnum", version=1)
+class JSONMockEnum(Enum):
+    A = "a"
+    B = "b"
+
+
+@serializable()
+class JSONMockObject(SyftObject):
+    __canonical_name__ = "JSONMockObject"
+    __version__ = SYFT_OBJECT_VERSION_1
+    __attr_searchable__ = ["name", "name_upper"]
+
+    name: str
+    kind: JSONMockEnum
+    scores: list[int]
+    tags: tuple[str, ...] | None = None
+    owners: list[UID] = []
+    extra: dict | None = None
+
+    @property
+    def name_upper(self) -> str:
+        return self.name.upper()
+
+
+def test_json_model_codec_roundtrip() -> None:
+    obj = JSONMockObject(
+        id=UID(),
+        name="abc",
+        kind=JSONMockEnum.B,
+        scores=[1, 2],
+        owners=[UID()],
+        extra={"key": [1, "a"]},
+    )
+
+    serialized = serialize_json(obj)
+
+    assert serialized["kind"] == "B"
+    assert serialized["scores"] == [1, 2]
+    assert serialized["owners"] == [obj.owners[0].no_dash]
+    assert serialized["name_upper"] == "ABC"
+    # ambiguous annotations fall back to base64 encoded syft bytes
+    assert isinstance(serialized["extra"], str)
+
+    deserialized = deserialize_json(json_loads(json_dumps(serialized)))
+    assert deserialized == obj
+
+
+def test_json_model_codec_cached() -> None:
+    assert get_json_model_codec(JSONMockObject) is get_json_model_codec(JSONMockObject)
+
+
+def test_json_dumps_large_int() -> None:
+    value = {"value": 2**80}
+    assert json_loads(json_dumps(value)) == json.loads(json.dumps(value))
+
+
+def test_json_dumps_non_finite_floats() -> None:
+    value = {"nan": math.nan, "inf": [math.inf, -math.inf], "none": None}
+    loaded = json_loads(json_dumps(value))
+
+    assert math.isnan(loaded["nan"])
+    assert loaded["inf"] == [math.inf, -math.inf]
+    assert loaded["none"] is None
+
+
+def test_json_loads_stdlib_non_finite_floats() -> None:
+    # rows written with json.dumps before orjson was used
+    stored = json.dumps({"value": math.nan, "limit": math.inf})
+    loaded = json_loads(stored)
+
+    assert math.isnan(loaded["value"])
+    assert loaded["limit"] == math.inf
@@ -1,9 +1,13 @@
 # stdlib
 from collections.abc import Callable
+from io import BytesIO
 from time import time
+from typing import ClassVar
 
 # third party
 from pydantic import BaseModel
+from pydantic import field_validator
+import pytest
 
 # syft absolute
 import syft as sy
@@ -350,3 +354,233 @@ def test_pydantic_derived_only():
     assert (data.uid, data.value, data.flag) != (de.uid, de.value, de.flag)
     assert (de.uid, de.value, de.flag) == (None, None, None)
     assert (data.source, data.target) == (de.source, de.target)
+
+
+# ------------------------------ Wire format ------------------------------
+
+
+def test_nested_fields_single_message():
+    data = PydDerived(uid=str(time()), value=2, source="source", target="target")
+    wrapper = Derived(uid=str(time()), value=3, status=data)
+
+    proto = sy.serialize(wrapper, to_proto=True)
+
+    assert len(proto.fieldsData) == 0
+    assert len(proto.fieldsObject) == len(proto.fieldsName)
+
+    de = sy.deserialize(proto.to_bytes(), from_bytes=True)
+
+    assert (de.uid, de.value) == (wrapper.uid, wrapper.value)
+    assert de.status == data
+
+
+@serializable(
+    canonical_name="PydNested",
+    version=1,
+)
+class PydNested(BaseModel):
+    child: "PydNested | None" = None
+
+
+def test_deeply_nested_fields():
+    data = None
+    for _ in range(100):
+        data = PydNested(child=data)
+
+    ser = sy.serialize(data, to_bytes=True)
+    de = sy.deserialize(ser, from_bytes=True)
+
+    assert de == data
+
+
+def test_over_deep_message_rejected():
+    # syft absolute
+    from syft.serde.recursive import MAX_NESTING_LIMIT
+    from syft.serde.recursive import recursive_scheme
+
+    # build the message iteratively, a peer does not need syft objects to send it
+    msg = recursive_scheme.new_message()
+    proto = msg
+    for _ in range(MAX_NESTING_LIMIT // 2 + 1):
+        proto.canonicalName = "PydNested"
+        proto.version = 1
+        proto.init("fieldsName", 1)
+        proto.fieldsName[0] = "child"
+        proto = proto.init("fieldsObject", 1)[0]
+
+    with pytest.raises(Exception, match="too deeply-nested"):
+        sy.deserialize(msg.to_bytes(), from_bytes=True)
+
+
+def test_legacy_fields_data_readable():
+    # syft absolute
+    from syft.serde.recursive import recursive_scheme
+
+    data = PydBase(uid=str(time()), value=2, flag=True)
+
+    # message layout used before fields were nested as structs:
+    # every field is encoded to bytes on its own and stored in fieldsData
+    msg = recursive_scheme.new_message()
+    msg.canonicalName = "PydBase"
+    msg.version = 1
+    attrs = sorted(["uid", "value", "flag"])
+    msg.init("fieldsName", len(attrs))
+    msg.init("fieldsData", len(attrs))
+    for idx, attr in enumerate(attrs):
+        msg.fieldsName[idx] = attr
+        msg.fieldsData.init(idx, 1)
+        msg.fieldsData[idx][0] = sy.serialize(getattr(data, attr), to_bytes=True)
+
+    de = sy.deserialize(msg.to_bytes(), from_bytes=True)
+
+    assert de == data
+
+
+def test_combine_bytes_chunks():
+    # syft absolute
+    from syft.serde.recursive import combine_bytes
+
+    single = b"syft"
+    assert combine_bytes([single]) is single
+    assert combine_bytes([b"sy", b"", b"ft"]) == b"syft"
+
+
+def test_deserialize_from_buffer():
+    data = PydBase(uid=str(time()), value=2, flag=True)
+    ser = sy.serialize(data, to_bytes=True)
+
+    assert sy.deserialize(bytearray(ser), from_bytes=True) == data
+    assert sy.deserialize(memoryview(ser), from_bytes=True) == data
+
+
+def test_deserialize_multi_chunk_bytes():
+    # syft absolute
+    from syft.serde.recursive import recursive_scheme
+
+    msg = recursive_scheme.new_message()
+    msg.canonicalName = "bytes"
+    msg.version = 1
+    msg.init("nonrecursiveBlob", 2)
+    msg.nonrecursiveBlob[0] = b"sy"
+    msg.nonrecursiveBlob[1] = b"ft"
+
+    de = sy.deserialize(msg.to_bytes(), from_bytes=True)
+
+    assert isinstance(de, bytes)
+    assert de == b"syft"
+
+
+def test_serialize_to_sink():
+    data = PydDerived(uid=str(time()), value=2, source="a" * 2**20, target="b" * 2**20)
+
+    sink = BytesIO()
+    size = sy.serialize_to(data, sink)
+
+    assert size == len(sink.getvalue())
+    assert sink.getvalue() == sy.serialize(data, to_bytes=True)
+
+    sink.seek(0)
+    assert sy.deserialize_from(sink) == data
+
+
+class ShortReader:
+    """Returns at most `chunk_size` bytes per read, like a socket."""
+
+    def __init__(self, data: bytes, chunk_size: int):
+        self.buffer = BytesIO(data)
+        self.chunk_size = chunk_size
+
+    def read(self, size: int) -> bytes:
+        return self.buffer.read(min(size, self.chunk_size))
+
+
+def test_deserialize_from_short_reads():
+    data = PydDerived(uid=str(time()), value=2, source="a" * 2**16, target="b")
+    ser = sy.serialize(data, to_bytes=True)
+
+    assert sy.deserialize_from(ShortReader(ser, chunk_size=3)) == data
+
+    with pytest.raises(EOFError):
+        sy.deserialize_from(ShortReader(ser[:-8], chunk_size=3))
+
+
+def test_deserialize_from_truncated_source():
+    ser = sy.serialize(PydBase(uid=str(time()), value=2), to_bytes=True)
+
+    with pytest.raises(EOFError):
+        sy.deserialize_from(BytesIO(ser[:-8]))
+
+
+def test_serde_plan_cached_in_registry():
+    # syft absolute
+    from syft.types.syft_object_registry import SyftObjectRegistry
+
+    plan = SyftObjectRegistry.get_serde_plan("PydDerivedWithoutAttr", 1, False)
+
+    assert plan is not None
+    assert [name for name, _ in plan.fields] == ["flag", "source", "target", "value"]
+
+    sy.serialize(PydBase(uid=str(time()), value=2), to_bytes=True, for_hashing=True)
+    hash_plan = SyftObjectRegistry.get_serde_plan("PydBase", 1, True)
+    assert hash_plan is not None
+    assert hash_plan is not SyftObjectRegistry.get_serde_plan("PydBase", 1, False)
+
+
+def test_serde_plan_reset_on_register():
+    # syft absolute
+    from syft.types.syft_object_registry import SyftObjectRegistry
+
+    @serializable(canonical_name="PydReregistered", version=1)
+    class PydReregistered(BaseModel):
+        value: int | None = None
+
+    first_plan = SyftObjectRegistry.get_serde_plan("PydReregistered", 1, False)
+
+    @serializable(canonical_name="PydReregistered", version=1)
+    class PydReregistered(BaseModel):  # noqa: F811
+        value: int | None = None
+        flag: bool | None = None
+
+    second_plan = SyftObjectRegistry.get_serde_plan("PydReregistered", 1, False)
+
+    assert second_plan is not first_plan
+    assert [name for name, _ in second_plan.fields] == ["flag", "value"]
+    de = sy.deserialize(
+        sy.serialize(PydReregistered(value=1, flag=True), to_bytes=True),
+        from_bytes=True,
+    )
+    assert (de.value, de.flag) == (1, True)
+
+
+@serializable(
+    canonical_name="PydValidated",
+    version=1,
+)
+class PydValidated(BaseModel):
+    value: int
+    items: tuple[int, ...] = ()
+
+    validations: ClassVar[int] = 0
+
+    @field_validator("value")
+    @classmethod
+    def count_validations(cls, value: int) -> int:
+        cls.validations += 1
+        return value
+
+
+def test_trusted_deserialize_skips_validation():
+    data = PydValidated(value=2, items=(1, 2))
+    ser = sy.serialize(data, to_bytes=True)
+
+    PydValidated.validations = 0
+    assert sy.deserialize(ser, from_bytes=True) == data
+    assert PydValidated.validations == 1
+
+    de = sy.deserialize(ser, from_bytes=True, trusted=True)
+    assert de == data
+    assert PydValidated.validations == 1
+
+    # untrusted payloads are still validated after a trusted call
+    sy.deserialize(ser, from_bytes=True)
+    assert PydValidated.validations == 2
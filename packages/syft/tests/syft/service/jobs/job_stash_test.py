@@ -2,13 +2,18 @@
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+import threading
+import time
 
 # third party
 import pytest
 
 # syft absolute
 import syft as sy
+from syft.service.context import AuthedServiceContext
+from syft.service.job import job_service
 from syft.service.job.job_stash import Job
+from syft.service.job.job_stash import JobEvents
 from syft.service.job.job_stash import JobStatus
 from syft.types.errors import SyftException
 from syft.types.uid import UID
@@ -48,6 +53,57 @@ def test_eta_string(current_iter, n_iters, status, creation_time_delta, expected
         assert expected in job.eta_string
 
 
+def test_job_events_wake_waiters():
+    events = JobEvents()
+    job_id = UID()
+
+    with events.watch(job_id) as changed, events.watch(UID()) as other:
+        assert not changed.wait(timeout=0.01)
+
+        threading.Timer(0.05, events.notify, args=(job_id,)).start()
+        assert changed.wait(timeout=5)
+        # only the waiters of the job that changed are woken
+        assert not other.is_set()
+
+        # notifications that don't know the job wake every waiter
+        events.notify()
+        assert other.is_set()
+
+    assert events._waiters == {}
+
+
+def test_job_wait_capped(worker, monkeypatch):
+    context = AuthedServiceContext(
+        server=worker, credentials=worker.signing_key.verify_key
+    )
+    job = Job(id=UID(), server_uid=worker.id)
+    worker.services.job.stash.set(context.credentials, job).unwrap()
+
+    # no free slot, the wait returns the pending job right away
+    monkeypatch.setattr(job_service, "_job_wait_slots", threading.BoundedSemaphore(1))
+    job_service._job_wait_slots.acquire()
+    start = time.time()
+    result = worker.services.job.wait(context, job.id, timeout=5)
+
+    assert result.status == JobStatus.CREATED
+    assert time.time() - start < 1
+
+
+def test_job_fetch_without_wait_endpoint(worker, monkeypatch):
+    client = worker.root_client
+    job = Job(id=UID(), server_uid=worker.id)
+    worker.services.job.stash.set(client.verify_key, job).unwrap()
+    job = client.api.services.job.get(job.id)
+
+    # servers from before the long poll have no job.wait endpoint
+    monkeypatch.delitem(client.api.endpoints, "job.wait")
+    start = time.time()
+    job.fetch(timeout=0.2)
+
+    assert job.status == JobStatus.CREATED
+    assert 0.2 <= time.time() - start < 5
+
+
 def test_job_no_consumer(worker):
     client = worker.root_client
     ds_client = worker.guest_client
@@ -0,0 +1,86 @@
+# stdlib
+import time
+from types import SimpleNamespace
+from typing import Any
+
+# syft absolute
+from syft.service.api.utils import print as log_print
+from syft.service.log.log_buffer import JobLogBuffer
+from syft.types.uid import UID
+
+
+class MockLogService:
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.appended: list[tuple[str, str]] = []
+        self.compacted = False
+
+    def append(self, context: Any, uid: UID, new_str: str, new_err: str) -> None:
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("database unavailable")
+        self.appended.append((new_str, new_err))
+
+    def compact(self, context: Any, uid: UID) -> None:
+        self.compacted = True
+
+
+def make_buffer(log_service: MockLogService, **kwargs: Any) -> JobLogBuffer:
+    context = SimpleNamespace(
+        server=SimpleNamespace(services=SimpleNamespace(log=log_service))
+    )
+    return JobLogBuffer(context=context, log_id=UID(), **kwargs)
+
+
+def test_log_buffer_flushes_in_chunks() -> None:
+    log_service = MockLogService()
+    log_buffer = make_buffer(log_service, max_size=4, flush_interval=60)
+
+    log_buffer.write(stdout="ab")
+    log_buffer.write(stderr="c")
+    assert log_service.appended == []
+    log_buffer.write(stdout="d")
+    assert log_service.appended == [("abd", "c")]
+
+    log_buffer.write(stdout="e")
+    log_buffer.close()
+    assert log_service.appended == [("abd", "c"), ("e", "")]
+    assert log_service.compacted
+
+
+def test_log_buffer_retries_failed_timer_flush() -> None:
+    log_service = MockLogService(failures=1)
+    log_buffer = make_buffer(log_service, flush_interval=0.01)
+
+    log_buffer.write(stdout="lost?")
+    # the failed flush on the timer thread is logged, the output stays buffered
+    time.sleep(0.2)
+    assert log_service.failures == 0
+    assert log_service.appended == []
+
+    log_buffer.close()
+    assert log_service.appended == [("lost?", "")]
+    assert log_service.compacted
+
+
+def test_log_buffer_write_does_not_raise() -> None:
+    log_service = MockLogService(failures=1)
+    log_buffer = make_buffer(log_service, max_size=1, flush_interval=60)
+
+    log_buffer.write(stdout="a")
+    log_buffer.write(stdout="b")
+
+    assert log_service.appended == [("ab", "")]
+
+
+def test_endpoint_print_is_buffered() -> None:
+    log_service = MockLogService()
+    log_buffer = make_buffer(log_service, flush_interval=60)
+
+    log_print(log_buffer, "first", 1)
+    log_print(log_buffer, "second", end="")
+    assert log_service.appended == []
+
+    log_buffer.close()
+    assert log_service.appended == [("first 1\nsecond", "")]
+    assert log_service.compacted
@@ -0,0 +1,267 @@
+# stdlib
+from collections.abc import Iterator
+import multiprocessing
+import os
+from pathlib import Path
+import subprocess  # nosec
+import sys
+import textwrap
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+# third party
+import psutil
+import pytest
+
+# syft absolute
+from syft.service.queue import queue
+from syft.service.queue.queue import JobProcessPool
+from syft.types.uid import UID
+
+
+class MockWorkerSettings:
+    def __init__(self, settings_hash: str) -> None:
+        self.id = UID()
+        self.name = "worker"
+        self.signing_key = None
+        self.db_config = None
+        self.blob_store_config = None
+        self.server_side_type = None
+        self.deployment_type = None
+        self.queue_config = SimpleNamespace(
+            client_config=SimpleNamespace(create_producer=True, n_consumers=1)
+        )
+        self.settings_hash = settings_hash
+
+    def hash(self) -> str:
+        return self.settings_hash
+
+
+class MockServer:
+    instances: list["MockServer"] = []
+    building = threading.Event()
+    release = threading.Event()
+
+    def __init__(self, **kwargs: Any) -> None:
+        MockServer.building.set()
+        MockServer.release.wait(timeout=5)
+        self.kwargs = kwargs
+        MockServer.instances.append(self)
+
+
+@pytest.fixture
+def mock_server(monkeypatch: pytest.MonkeyPatch) -> type[MockServer]:
+    monkeypatch.setattr(queue, "_worker_servers", {})
+    monkeypatch.setattr(queue, "_worker_servers_lock", threading.Lock())
+    monkeypatch.setattr("syft.server.server.Server", MockServer)
+    MockServer.instances = []
+    MockServer.building = threading.Event()
+    MockServer.release = threading.Event()
+    MockServer.release.set()
+    return MockServer
+
+
+def test_worker_server_reused(mock_server: type[MockServer]) -> None:
+    settings = MockWorkerSettings("a")
+
+    worker = queue.get_worker_server(settings)
+
+    assert queue.get_worker_server(settings) is worker
+    assert queue.get_worker_server(MockWorkerSettings("a")) is worker
+    assert mock_server.instances == [worker]
+    assert settings.queue_config.client_config.n_consumers == 0
+
+
+def test_worker_server_rebuilt_for_new_settings(
+    mock_server: type[MockServer],
+) -> None:
+    worker = queue.get_worker_server(MockWorkerSettings("a"))
+    changed = queue.get_worker_server(MockWorkerSettings("b"))
+
+    assert changed is not worker
+    assert mock_server.instances == [worker, changed]
+
+
+def test_worker_server_per_process(
+    mock_server: type[MockServer], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings = MockWorkerSettings("a")
+    worker = queue.get_worker_server(settings)
+
+    monkeypatch.setattr(queue.os, "getpid", lambda: -1)
+    assert queue.get_worker_server(settings) is not worker
+
+    # a forked child starts with an empty cache and a fresh lock
+    queue._worker_servers_lock.acquire()
+    queue._reset_worker_servers()
+    assert not queue._worker_servers_lock.locked()
+    assert queue._worker_servers == {}
+
+
+def test_worker_server_built_once_without_lock(
+    mock_server: type[MockServer],
+) -> None:
+    mock_server.release.clear()
+    settings = MockWorkerSettings("a")
+    workers = []
+
+    def get_worker() -> None:
+        workers.append(queue.get_worker_server(settings))
+
+    threads = [threading.Thread(target=get_worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    assert mock_server.building.wait(timeout=5)
+    # other settings are not blocked while a server is being built
+    with queue._worker_servers_lock:
+        pass
+
+    mock_server.release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(mock_server.instances) == 1
+    assert workers == mock_server.instances * 4
+
+
+def record_pid(pid_file: str, job: str, credentials: Any) -> None:
+    Path(pid_file).write_text(str(os.getpid()))
+    if job == "hang":
+        time.sleep(60)
+
+
+def wait_for_pid(pid_file: Path) -> int:
+    for _ in range(100):
+        if pid_file.exists() and pid_file.read_text():
+            return int(pid_file.read_text())
+        time.sleep(0.05)
+    raise TimeoutError(f"job did not write {pid_file}")
+
+
+@pytest.fixture
+def job_process_pool() -> Iterator[JobProcessPool]:
+    # fork, the test handler is not importable from a forkserver
+    pool = JobProcessPool(
+        size=1,
+        max_jobs_per_process=2,
+        mp_context=multiprocessing.get_context("fork"),
+        handler=record_pid,
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs fork")
+def test_job_process_pool_runs_job(
+    job_process_pool: JobProcessPool, tmp_path: Path
+) -> None:
+    pid_file = tmp_path / "pid"
+    process = job_process_pool.acquire()
+    job_pid = process.pid
+
+    job_process_pool.submit(process, str(pid_file), "job", None)
+
+    # the process is handed out again once the job is done
+    assert job_process_pool.acquire() is process
+    assert int(pid_file.read_text()) == job_pid != os.getpid()
+    job_process_pool.idle.put(process)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs fork")
+def test_job_process_pool_recycles_process(
+    job_process_pool: JobProcessPool, tmp_path: Path
+) -> None:
+    process = job_process_pool.acquire()
+    for idx in range(job_process_pool.max_jobs_per_process):
+        assert process.process.is_alive()
+        job_process_pool.submit(process, str(tmp_path / str(idx)), "job", None)
+        new_process = job_process_pool.acquire()
+        if idx < job_process_pool.max_jobs_per_process - 1:
+            assert new_process is process
+
+    assert new_process is not process
+    assert new_process.n_jobs == 0
+    assert not process.process.is_alive()
+    job_process_pool.idle.put(new_process)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs fork")
+def test_job_process_pool_replaces_killed_process(
+    job_process_pool: JobProcessPool, tmp_path: Path
+) -> None:
+    pid_file = tmp_path / "pid"
+    process = job_process_pool.acquire()
+    job_pid = process.pid
+    job_process_pool.submit(process, str(pid_file), "hang", None)
+
+    # killing a job terminates the process with the job_pid of the job
+    assert wait_for_pid(pid_file) == job_pid
+    psutil.Process(job_pid).terminate()
+
+    new_process = job_process_pool.acquire()
+    assert new_process.pid != job_pid
+    assert new_process.process.is_alive()
+
+    job_process_pool.submit(new_process, str(tmp_path / "next"), "job", None)
+    assert job_process_pool.acquire() is new_process
+    assert wait_for_pid(tmp_path / "next") == new_process.pid
+    job_process_pool.idle.put(new_process)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs fork")
+def test_job_process_pool_replaces_dead_idle_process(
+    job_process_pool: JobProcessPool,
+) -> None:
+    process = job_process_pool.acquire()
+    process.process.kill()
+    process.process.join(timeout=5)
+    job_process_pool.idle.put(process)
+
+    new_process = job_process_pool.acquire()
+    assert new_process is not process
+    assert new_process.process.is_alive()
+    job_process_pool.idle.put(new_process)
+
+
+EXIT_AFTER_JOB = textwrap.dedent(
+    """
+    import multiprocessing
+    from syft.service.queue import queue
+
+    def handler(*args):
+        pass
+
+    queue._job_process_pool = queue.JobProcessPool(
+        size=1,
+        mp_context=multiprocessing.get_context("fork"),
+        handler=handler,
+    )
+    pool = queue.get_job_process_pool()
+    process = pool.acquire()
+    pool.submit(process, None, "job", None)
+    # waits for the job, the process is not given back to the pool
+    print(pool.acquire().pid, flush=True)
+    """
+)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs fork")
+def test_job_process_pool_closed_at_exit() -> None:
+    # without closing the pool, multiprocessing waits for its processes forever
+    result = subprocess.run(  # nosec
+        [sys.executable, "-c", EXIT_AFTER_JOB],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    job_pid = int(result.stdout.strip())
+    for _ in range(100):
+        if not psutil.pid_exists(job_pid):
+            break
+        time.sleep(0.05)
+    assert not psutil.pid_exists(job_pid)
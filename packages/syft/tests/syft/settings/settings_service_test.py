@@ -421,3 +421,21 @@ def test_notifications_enabled_without_emails_credentials_not_allowed(
         root_datasite_client.api.services.settings.update(notifications_enabled=True)
 
     assert _NOTIFICATIONS_ENABLED_WIHOUT_CREDENTIALS_ERROR in exc.value.public_message
+
+
+def test_settings_update_invalidates_cached_metadata(worker, faker: Faker) -> None:
+    root_client = worker.root_client
+    metadata = worker.metadata
+    assert worker.metadata_capnp is worker.metadata_capnp
+
+    # every caller gets its own copy of the cached metadata
+    old_name = metadata.name
+    metadata.name = faker.name()
+    assert worker.metadata is not metadata
+    assert worker.metadata.name == old_name
+
+    new_name = faker.name()
+    root_client.api.services.settings.update(name=new_name)
+
+    assert worker.metadata.name == new_name
+    assert worker.settings.name == new_name
@@ -1,6 +1,7 @@
 # stdlib
 from collections.abc import Callable
 from collections.abc import Container
+import json
 import random
 import threading
 from typing import Any
@@ -9,19 +10,27 @@ from typing import TypeVar
 # third party
 from faker import Faker
 import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 from typing_extensions import ParamSpec
 
 # syft absolute
 from syft.serde.serializable import serializable
 from syft.server.credentials import SyftSigningKey
 from syft.server.credentials import SyftVerifyKey
+from syft.service.action.action_permissions import ActionObjectPermission
+from syft.service.action.action_permissions import ActionObjectREAD
+from syft.service.action.action_permissions import ActionPermission
 from syft.service.queue.queue_stash import Status
 from syft.service.request.request_service import RequestService
+from syft.store.db.query import PostgresQuery
+from syft.store.db.schema import create_table
 from syft.store.db.sqlite import SQLiteDBConfig
 from syft.store.db.sqlite import SQLiteDBManager
 from syft.store.db.stash import ObjectStash
 from syft.store.document_store_errors import NotFoundException
 from syft.store.document_store_errors import StashException
+from syft.store.document_store_errors import UniqueConstraintException
 from syft.store.linked_obj import LinkedObject
 from syft.types.errors import SyftException
 from syft.types.syft_object import SyftObject
@@ -122,6 +131,21 @@ def test_basestash_set(
     assert result == mock_object
 
 
+def test_basestash_get_skips_validation(
+    root_verify_key, base_stash: MockStash, mock_object: MockObject, monkeypatch
+) -> None:
+    base_stash.set(root_verify_key, mock_object).unwrap()
+
+    def fail_validation(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("stash reads should not re-validate objects")
+
+    monkeypatch.setattr(MockObject, "model_validate", fail_validation)
+    result = base_stash.get_by_uid(root_verify_key, mock_object.id).unwrap()
+
+    assert result == mock_object
+    assert result.status == Status.CREATED
+
+
 def test_basestash_set_duplicate(
     root_verify_key, base_stash: MockStash, faker: Faker
 ) -> None:
@@ -150,6 +174,95 @@ def test_basestash_set_duplicate_unique_key(
     assert result.is_err()
 
 
+def test_basestash_unique_index_added_to_old_table(
+    root_verify_key, base_stash: MockStash, faker: Faker
+) -> None:
+    # a table created before unique fields were enforced by the database
+    with base_stash.db.engine.begin() as connection:
+        connection.exec_driver_sql(
+            "DROP INDEX uq_base_stash_mock_object_type_name"
+        )
+    base_stash.db.init_tables()
+
+    original, duplicate = (
+        MockObject(**kwargs)
+        for kwargs in multiple_object_kwargs(faker, n=2, name=faker.name())
+    )
+    base_stash.set(root_verify_key, original).unwrap()
+
+    with pytest.raises(UniqueConstraintException):
+        base_stash.set(root_verify_key, duplicate).unwrap()
+
+
+def test_basestash_json_unique_index_replaced(base_stash: MockStash) -> None:
+    # a table with the unique index on the JSON value instead of the column
+    with base_stash.db.engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX uq_base_stash_mock_object_type_name")
+        connection.exec_driver_sql(
+            "CREATE UNIQUE INDEX ix_base_stash_mock_object_type_name_unique "
+            "ON base_stash_mock_object_type (json_extract(fields, '$.name'))"
+        )
+    base_stash.db.init_tables()
+
+    with base_stash.db.engine.connect() as connection:
+        index_names = set(
+            connection.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'index' "
+                "AND tbl_name = 'base_stash_mock_object_type'"
+            ).scalars()
+        )
+    assert "uq_base_stash_mock_object_type_name" in index_names
+    assert "ix_base_stash_mock_object_type_name_unique" not in index_names
+
+
+def test_basestash_unique_index_existing_duplicates(
+    root_verify_key, base_stash: MockStash, faker: Faker, caplog
+) -> None:
+    def index_names() -> set[str]:
+        with base_stash.db.engine.connect() as connection:
+            return set(
+                connection.exec_driver_sql(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' "
+                    "AND tbl_name = 'base_stash_mock_object_type'"
+                ).scalars()
+            )
+
+    with base_stash.db.engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX uq_base_stash_mock_object_type_name")
+    name = faker.name()
+    duplicates = [
+        MockObject(**kwargs) for kwargs in multiple_object_kwargs(faker, n=2, name=name)
+    ]
+    for obj in duplicates:
+        base_stash.set(root_verify_key, obj).unwrap()
+
+    # the server still starts, without the index
+    base_stash.db.init_tables()
+    assert "stored more than once" in caplog.text
+    assert "uq_base_stash_mock_object_type_name" not in index_names()
+
+    base_stash.delete_by_uid(root_verify_key, duplicates[0].id).unwrap()
+    base_stash.db.init_tables()
+    assert "uq_base_stash_mock_object_type_name" in index_names()
+
+
+def test_basestash_update_other_integrity_error(
+    root_verify_key, base_stash: MockStash, mock_object: MockObject
+) -> None:
+    base_stash.set(root_verify_key, mock_object).unwrap()
+    with base_stash.db.engine.begin() as connection:
+        connection.exec_driver_sql(
+            "CREATE TRIGGER reject_update BEFORE UPDATE ON base_stash_mock_object_type "
+            "BEGIN SELECT RAISE(ABORT, 'update rejected'); END"
+        )
+
+    result = base_stash.update(root_verify_key, mock_object)
+
+    assert result.is_err()
+    assert not isinstance(result.err(), UniqueConstraintException)
+    assert "update rejected" in str(result.err())
+
+
 def test_basestash_delete(
     root_verify_key, base_stash: MockStash, mock_object: MockObject
 ) -> None:
@@ -192,6 +305,26 @@ def test_basestash_update(
     assert retrieved == updated_obj
 
 
+def test_basestash_get_all_update_times(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    base_stash.set(root_verify_key, mock_objects[0]).unwrap()
+    update_times = base_stash.get_all_update_times(root_verify_key).unwrap()
+    assert update_times == {mock_objects[0].id: None}
+
+    base_stash.update(root_verify_key, mock_objects[0]).unwrap()
+    first_update = base_stash.get_all_update_times(root_verify_key).unwrap()
+    assert first_update[mock_objects[0].id] is not None
+
+    base_stash.update_many(root_verify_key, mock_objects[:1]).unwrap()
+    second_update = base_stash.get_all_update_times(root_verify_key).unwrap()
+    assert second_update[mock_objects[0].id] > first_update[mock_objects[0].id]
+
+    base_stash.set(root_verify_key, mock_objects[1]).unwrap()
+    update_times = base_stash.get_all_update_times(root_verify_key).unwrap()
+    assert set(update_times) == {mock_objects[0].id, mock_objects[1].id}
+
+
 def test_basestash_upsert(
     root_verify_key, base_stash: MockStash, mock_object: MockObject, faker: Faker
 ) -> None:
@@ -216,6 +349,184 @@ def test_basestash_upsert(
     assert len(base_stash.get_all(root_verify_key).unwrap()) == 2
 
 
+def test_basestash_set_many(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject], faker
+) -> None:
+    base_stash.set(root_verify_key, mock_objects[0]).unwrap()
+    duplicate_name = MockObject(**object_kwargs(faker, name=mock_objects[1].name))
+
+    results = base_stash.set_many(
+        root_verify_key, mock_objects + [duplicate_name]
+    ).unwrap()
+
+    assert len(results) == len(mock_objects) + 1
+    assert isinstance(results[0].err(), StashException)
+    assert all(result.ok() == obj for result, obj in zip(results[1:], mock_objects[1:]))
+    assert isinstance(results[-1].err(), StashException)
+    assert len(base_stash.get_all(root_verify_key).unwrap()) == len(mock_objects)
+
+    results = base_stash.set_many(
+        root_verify_key, mock_objects, ignore_duplicates=True
+    ).unwrap()
+    assert all(result.is_ok() for result in results)
+
+
+def test_basestash_update_many(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject], faker
+) -> None:
+    base_stash.set_many(root_verify_key, mock_objects[:-1]).unwrap()
+
+    updated = [obj.copy() for obj in mock_objects]
+    for obj in updated:
+        obj.value += 1
+
+    results = base_stash.update_many(root_verify_key, updated).unwrap()
+    assert [result.ok() for result in results[:-1]] == updated[:-1]
+    assert isinstance(results[-1].err(), NotFoundException)
+
+    for obj in updated[:-1]:
+        assert base_stash.get_by_uid(root_verify_key, obj.id).unwrap() == obj
+
+    # a unique clash only fails the clashing object
+    clash = updated[0].copy()
+    clash.name = updated[1].name
+    renamed = updated[2].copy()
+    renamed.name = faker.name()
+    results = base_stash.update_many(root_verify_key, [clash, renamed]).unwrap()
+    assert isinstance(results[0].err(), StashException)
+    assert results[1].ok() == renamed
+    assert base_stash.get_by_uid(root_verify_key, renamed.id).unwrap() == renamed
+
+
+def test_basestash_upsert_many(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    base_stash.set_many(root_verify_key, mock_objects[:5]).unwrap()
+
+    updated = [obj.copy() for obj in mock_objects]
+    for obj in updated:
+        obj.value += 1
+    # new id, but clashes with an existing name
+    clash = updated[0].copy()
+    clash.id = UID()
+
+    results = base_stash.upsert_many(root_verify_key, updated + [clash]).unwrap()
+    assert [result.ok() for result in results[:-1]] == updated
+    assert isinstance(results[-1].err(), StashException)
+    assert sorted(
+        base_stash.get_all(root_verify_key).unwrap(), key=lambda obj: obj.name
+    ) == sorted(updated, key=lambda obj: obj.name)
+
+
+def test_basestash_delete_many(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    base_stash.set_many(root_verify_key, mock_objects).unwrap()
+    random_uid = create_unique(UID, [obj.id for obj in mock_objects])
+
+    uids = [obj.id for obj in mock_objects[:3]] + [random_uid]
+    results = base_stash.delete_many(root_verify_key, uids).unwrap()
+
+    assert [result.ok() for result in results[:3]] == uids[:3]
+    assert isinstance(results[3].err(), NotFoundException)
+    assert len(base_stash.get_all(root_verify_key).unwrap()) == len(mock_objects) - 3
+
+
+def test_basestash_add_permissions_many(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    base_stash.set_many(root_verify_key, mock_objects).unwrap()
+    user_verify_key = SyftSigningKey.generate().verify_key
+    random_uid = create_unique(UID, [obj.id for obj in mock_objects])
+
+    permissions = [
+        ActionObjectREAD(uid=uid, credentials=user_verify_key)
+        for uid in [obj.id for obj in mock_objects] + [random_uid]
+    ]
+    results = base_stash.add_permissions_many(permissions).unwrap()
+
+    assert all(result.is_ok() for result in results[:-1])
+    assert isinstance(results[-1].err(), NotFoundException)
+    for obj in mock_objects:
+        assert base_stash.get_by_uid(user_verify_key, obj.id).unwrap() == obj
+
+    results = base_stash.add_permissions_many(permissions, ignore_missing=True).unwrap()
+    assert all(result.is_ok() for result in results)
+
+
+def test_basestash_grant_revoke_permission(
+    root_verify_key, base_stash: MockStash, mock_object: MockObject
+) -> None:
+    base_stash.set(root_verify_key, mock_object).unwrap()
+    user_verify_key = SyftSigningKey.generate().verify_key
+    permission = ActionObjectREAD(uid=mock_object.id, credentials=user_verify_key)
+    assert not base_stash.has_permission(permission)
+    assert base_stash.get_all(user_verify_key).unwrap() == []
+
+    # granting twice is a no-op
+    base_stash.add_permission(permission).unwrap()
+    base_stash.add_permission(permission).unwrap()
+    assert base_stash.has_permission(permission)
+    assert base_stash.get_all(user_verify_key).unwrap() == [mock_object]
+    assert permission.permission_string in base_stash._get_permissions_for_uid(
+        mock_object.id
+    ).unwrap()
+
+    base_stash.remove_permission(permission)
+    assert not base_stash.has_permission(permission)
+    assert base_stash.get_all(user_verify_key).unwrap() == []
+
+    base_stash.add_permission(
+        ActionObjectPermission(uid=mock_object.id, permission=ActionPermission.ALL_READ)
+    ).unwrap()
+    assert base_stash.has_permission(permission)
+    assert base_stash.get_all(user_verify_key).unwrap() == [mock_object]
+
+    base_stash.delete_by_uid(root_verify_key, mock_object.id).unwrap()
+    assert base_stash.get_all_permissions().unwrap() == {}
+    assert base_stash.session.query(base_stash.permissions_table).count() == 0
+
+
+def test_basestash_migrate_permissions_column(
+    root_verify_key, base_stash: MockStash, mock_object: MockObject
+) -> None:
+    base_stash.set(root_verify_key, mock_object).unwrap()
+    user_verify_key = SyftSigningKey.generate().verify_key
+    permission = ActionObjectREAD(uid=mock_object.id, credentials=user_verify_key)
+    owner_permissions = base_stash._get_permissions_for_uid(mock_object.id).unwrap()
+
+    # a database created before permissions had their own table keeps every
+    # grant in the JSON `permissions` column of the object table
+    legacy_permissions = [*owner_permissions, permission.permission_string]
+    with base_stash.db.engine.begin() as connection:
+        connection.exec_driver_sql(
+            "ALTER TABLE base_stash_mock_object_type ADD COLUMN permissions JSON"
+        )
+        connection.exec_driver_sql(
+            "UPDATE base_stash_mock_object_type SET permissions = ?",
+            (json.dumps(legacy_permissions),),
+        )
+        connection.exec_driver_sql(
+            "DELETE FROM base_stash_mock_object_type_permissions"
+        )
+    assert not base_stash.has_permission(permission)
+
+    base_stash.db.init_tables()
+
+    assert base_stash.has_permission(permission)
+    assert base_stash.get_all(user_verify_key).unwrap() == [mock_object]
+    assert base_stash._get_permissions_for_uid(mock_object.id).unwrap() == set(
+        legacy_permissions
+    )
+    columns = sa.inspect(base_stash.db.engine).get_columns(base_stash.table.name)
+    assert "permissions" not in {column["name"] for column in columns}
+
+    # the migration only runs once
+    base_stash.remove_permission(permission)
+    base_stash.db.init_tables()
+    assert not base_stash.has_permission(permission)
+
+
 def test_basestash_cannot_update_non_existent(
     root_verify_key, base_stash: MockStash, mock_object: MockObject, faker: Faker
 ) -> None:
@@ -323,6 +634,91 @@ def test_basestash_query_one(
         ).unwrap()
 
 
+def test_basestash_query_uses_field_columns(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    base_stash.set_many(root_verify_key, mock_objects)
+    obj = random.choice(mock_objects)
+
+    query = base_stash.query().filter("importance", "eq", obj.importance)
+    assert "_field_importance" in str(query.stmt)
+    results = base_stash.get_all(
+        root_verify_key, filters={"importance": obj.importance}
+    ).unwrap()
+    assert {result.id for result in results} == {
+        mock.id for mock in mock_objects if mock.importance == obj.importance
+    }
+
+    # a table created before `importance` was searchable gets the column back
+    with base_stash.db.engine.begin() as connection:
+        connection.exec_driver_sql(
+            "DROP INDEX ix_base_stash_mock_object_type_importance"
+        )
+        connection.exec_driver_sql(
+            "ALTER TABLE base_stash_mock_object_type DROP COLUMN _field_importance"
+        )
+    base_stash.db.add_missing_columns(base_stash.table.metadata)
+
+    results = base_stash.get_all(
+        root_verify_key, filters={"importance": obj.importance}
+    ).unwrap()
+    assert obj.id in {result.id for result in results}
+
+
+def test_basestash_get_page(
+    root_verify_key, base_stash: MockStash, faker: Faker
+) -> None:
+    objs = [MockObject(**kwargs) for kwargs in multiple_object_kwargs(faker, n=25)]
+    objs[0].value = objs[1].value
+    base_stash.set_many(root_verify_key, objs)
+
+    for sort_order in ("asc", "desc"):
+        results = []
+        cursor = None
+        while True:
+            page, cursor = base_stash.get_page(
+                root_verify_key,
+                order_by="value",
+                sort_order=sort_order,
+                limit=10,
+                after=cursor,
+            ).unwrap()
+            assert len(page) <= 10
+            results.extend(page)
+            if cursor is None:
+                break
+
+        # values are ordered as numbers, not as strings
+        values = [obj.value for obj in results]
+        assert values == sorted(values, reverse=sort_order == "desc")
+        assert {obj.id for obj in results} == {obj.id for obj in objs}
+        assert len(results) == len(objs)
+
+
+def test_postgres_keyset_json_null_is_null() -> None:
+    create_table(MockObject, postgresql.dialect())
+    query = PostgresQuery(MockObject).keyset("value", "asc", after=(None, UID()))
+    sql = str(query.stmt.compile(dialect=postgresql.dialect()))
+
+    # JSON null values sort and compare as NULL, not as the JSON value 'null'
+    sort_key = "nullif(CAST(base_stash_mock_object_type.fields -> "
+    assert sort_key in sql
+    assert "AS JSONB), CAST(" in sql
+    assert "ASC NULLS FIRST" in sql
+    assert ") IS NOT NULL OR " in sql
+
+
+def test_basestash_iter_all(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    base_stash.set_many(root_verify_key, mock_objects)
+
+    results = list(base_stash.iter_all(root_verify_key, order_by="value", batch_size=3))
+    assert [obj.value for obj in results] == sorted(obj.value for obj in mock_objects)
+    assert {obj.id for obj in results} == {obj.id for obj in mock_objects}
+    assert base_stash.count(root_verify_key).unwrap() == len(mock_objects)
+
+
 def test_basestash_query_enum(
     root_verify_key, base_stash: MockStash, mock_object: MockObject
 ) -> None:
@@ -361,6 +757,36 @@ def test_basestash_query_linked_obj(
     assert result == mock_object
 
 
+def test_basestash_query_in(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    for mock_object in mock_objects:
+        mock_object.linked_obj = LinkedObject(
+            object_type=MockObject,
+            object_uid=UID(),
+            id=UID(),
+            server_uid=UID(),
+            service_type=RequestService,
+        )
+    base_stash.set_many(root_verify_key, mock_objects)
+    expected = mock_objects[:3]
+    expected_ids = {obj.id for obj in expected}
+
+    for field, values in [
+        ("id", [obj.id for obj in expected]),
+        ("name", [obj.name for obj in expected]),
+        ("linked_obj.object_uid", [obj.linked_obj.object_uid for obj in expected]),
+    ]:
+        query = base_stash.query().filter(field, "in", values)
+        assert " IN " in str(query.stmt)
+        results = base_stash.get_all(
+            root_verify_key, filters={f"{field}__in": values}
+        ).unwrap()
+        assert {result.id for result in results} == expected_ids
+
+    assert base_stash.get_all(root_verify_key, filters={"name__in": []}).unwrap() == []
+
+
 def test_basestash_query_all(
     root_verify_key, base_stash: MockStash, mock_objects: list[MockObject], faker: Faker
 ) -> None:
@@ -0,0 +1,54 @@
+# syft absolute
+from syft.service.log.log import SyftLog
+from syft.service.log.log_stash import LogStash
+from syft.service.log.log_stash import STDERR
+from syft.service.log.log_stash import STDOUT
+from syft.types.uid import UID
+
+
+def test_log_stash_append_chunks_and_compact() -> None:
+    log_stash = LogStash.random()
+    root_verify_key = log_stash.root_verify_key
+    log = SyftLog(id=UID(), job_id=UID(), stdout="start\n")
+    log_stash.set(root_verify_key, log).unwrap()
+
+    for i in range(3):
+        log_stash.append_chunks(root_verify_key, log.id, stdout=f"{i}\n").unwrap()
+    log_stash.append_chunks(root_verify_key, log.id, stderr="error\n").unwrap()
+
+    # appends don't rewrite the log row
+    stored = log_stash.get_by_uid(root_verify_key, log.id).unwrap()
+    assert stored.stdout == "start\n"
+
+    full = log_stash.get_with_chunks(root_verify_key, log.id).unwrap()
+    assert full.stdout == "start\n0\n1\n2\n"
+    assert full.stderr == "error\n"
+
+    log_stash.compact(root_verify_key, log.id).unwrap()
+    stored = log_stash.get_by_uid(root_verify_key, log.id).unwrap()
+    assert stored.stdout == "start\n0\n1\n2\n"
+    assert stored.stderr == "error\n"
+    # the chunks are gone after compacting
+    full = log_stash.get_with_chunks(root_verify_key, log.id).unwrap()
+    assert full.stdout == stored.stdout
+
+
+def test_log_stash_get_stream_offset() -> None:
+    log_stash = LogStash.random()
+    root_verify_key = log_stash.root_verify_key
+    log = SyftLog(id=UID(), job_id=UID(), stdout="start\n")
+    log_stash.set(root_verify_key, log).unwrap()
+    for i in range(3):
+        log_stash.append_chunks(root_verify_key, log.id, stdout=f"line {i}\n").unwrap()
+    log_stash.append_chunks(root_verify_key, log.id, stderr="error\n").unwrap()
+
+    stdout = "start\nline 0\nline 1\nline 2\n"
+    for offset in range(len(stdout) + 2):
+        result = log_stash.get_stream(root_verify_key, log.id, STDOUT, offset=offset)
+        assert result.unwrap() == stdout[offset:]
+    assert log_stash.get_stream(root_verify_key, log.id, STDERR).unwrap() == "error\n"
+
+    log_stash.compact(root_verify_key, log.id).unwrap()
+    log_stash.append_chunks(root_verify_key, log.id, stdout="end\n").unwrap()
+    result = log_stash.get_stream(root_verify_key, log.id, STDOUT, offset=len(stdout))
+    assert result.unwrap() == "end\n"
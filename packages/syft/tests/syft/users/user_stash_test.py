@@ -219,3 +219,39 @@ def test_userstash_update(
     updated_user = result.ok()
     assert isinstance(updated_user, User)
     assert user == updated_user
+
+
+def test_userstash_update_invalidates_role(
+    root_datasite_client, user_stash: UserStash, guest_user: User
+) -> None:
+    user = add_mock_user(root_datasite_client, user_stash, guest_user)
+    assert user_stash.get_role(user.verify_key) == user.role
+
+    # the role is cached until the user is written again
+    user.role = ServiceRole.DATA_OWNER
+    user_stash.update(root_datasite_client.credentials.verify_key, obj=user).unwrap()
+    assert user_stash.get_role(user.verify_key) == ServiceRole.DATA_OWNER
+
+    user_stash.delete_by_uid(
+        root_datasite_client.credentials.verify_key, uid=user.id
+    ).unwrap()
+    assert user_stash.get_role(user.verify_key) == ServiceRole.GUEST
+
+
+def test_userstash_role_invalidated_after_commit(
+    root_datasite_client, user_stash: UserStash, guest_user: User
+) -> None:
+    user = add_mock_user(root_datasite_client, user_stash, guest_user)
+    old_role = user.role
+    assert user_stash.get_role(user.verify_key) == old_role
+
+    user.role = ServiceRole.DATA_OWNER
+    with user_stash.sessionmaker() as session:
+        with session.begin():
+            user_stash.update(
+                root_datasite_client.credentials.verify_key, obj=user, session=session
+            ).unwrap()
+            # other sessions can't see the write yet, the cached role stays
+            assert user_stash.get_role(user.verify_key) == old_role
+
+    assert user_stash.get_role(user.verify_key) == ServiceRole.DATA_OWNER
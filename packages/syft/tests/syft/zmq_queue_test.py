@@ -2,6 +2,7 @@
 from collections import defaultdict
 from secrets import token_hex
 import sys
+import threading
 from time import sleep
 
 # third party
@@ -16,6 +17,7 @@ from syft.service.queue.queue import QueueManager
 from syft.service.queue.zmq_client import ZMQClient
 from syft.service.queue.zmq_client import ZMQClientConfig
 from syft.service.queue.zmq_client import ZMQQueueConfig
+from syft.service.queue.zmq_common import RequestQueue
 from syft.service.queue.zmq_consumer import ZMQConsumer
 from syft.service.queue.zmq_producer import ZMQProducer
 from syft.service.response import SyftSuccess
@@ -203,6 +205,43 @@ def test_zmq_pub_sub(faker: Faker, producer, consumer):
     assert consumer.alive is False
 
 
+@pytest.mark.flaky(reruns=3, reruns_delay=3)
+@pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
+def test_zmq_producer_notify(producer):
+    # only run the message thread, reading queue items needs a queue stash
+    producer.thread = threading.Thread(target=producer._run)
+    producer.thread.start()
+    producer._items_available.clear()
+
+    # a client without the producer notifies it over the socket
+    client = ZMQClient(config=ZMQClientConfig(queue_port=producer.port))
+    client.notify_producer(producer.queue_name)
+    assert producer._items_available.wait(timeout=2)
+    assert len(producer.workers) == 0
+
+    producer._items_available.clear()
+    producer.notify()
+    assert producer._items_available.is_set()
+
+    producer.close()
+    assert producer.alive is False
+
+
+def test_request_queue_fair_share():
+    requests = RequestQueue()
+    for i in range(3):
+        requests.append(f"alice-{i}".encode(), submitter="alice")
+    requests.append(b"bob-0", submitter="bob")
+    requests.append(b"carol-0", submitter="carol")
+    assert len(requests) == 5
+
+    served = [requests.popleft() for _ in range(len(requests))]
+    assert served == [b"alice-0", b"bob-0", b"carol-0", b"alice-1", b"alice-2"]
+    assert not requests
+    with pytest.raises(IndexError):
+        requests.popleft()
+
+
 @pytest.fixture
 def queue_manager():
     # Create a consumer